@@ -0,0 +1,122 @@
+"""
+Entity Benchmark - EntityResolver scaling on a skewed name corpus
+Generates company names from a small vocabulary of common word parts
+("Smart Data Labs", "Green Energy Capital"...), where every trigram is
+shared by a large fraction of the names, plus typo'd and suffixed copies of
+earlier names. Reports names/s, truncated lookups and missed merges (against
+an unbudgeted, exact resolver) for each corpus size.
+
+Usage:
+    python -m benchmarks.entity_benchmark --sizes 25000 50000 100000 --output results.jsonl
+"""
+import argparse
+import json
+import platform
+import random
+import string
+import sys
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.constants import ENTITY_CANDIDATE_BUDGET
+from utils.entity_resolution import EntityResolver
+
+WORD_PARTS = (
+    "tech data cloud smart ai labs global health bio fin green energy quantum net soft "
+    "systems solutions digital hub flow logic works group capital ventures analytics "
+    "robotics media pay med"
+).split()
+LEGAL_SUFFIXES = ['', ' Ltd', ' Inc', ' LLC']
+
+
+def generate_names(count: int, duplicate_rate: float = 0.2, seed: int = 0) -> List[str]:
+    """Names of 2-4 common word parts; duplicate_rate of them copy an earlier name with one typo"""
+    rng = random.Random(seed)
+    names = []
+    for _ in range(count):
+        if names and rng.random() < duplicate_rate:
+            chars = list(rng.choice(names))
+            chars[rng.randrange(len(chars))] = rng.choice(string.ascii_lowercase)
+            names.append(''.join(chars).title() + rng.choice(LEGAL_SUFFIXES))
+        else:
+            names.append(' '.join(rng.sample(WORD_PARTS, rng.randint(2, 4))))
+    return names
+
+
+def _resolve(names: List[str], candidate_budget: Optional[int]) -> Dict:
+    resolver = EntityResolver(candidate_budget=candidate_budget)
+    started = time.perf_counter()
+    entities = [resolver.add(name) for name in names]
+    elapsed = time.perf_counter() - started
+    return {
+        'elapsed_s': round(elapsed, 3),
+        'names_per_s': round(len(names) / elapsed, 1),
+        'entities': resolver.entity_count,
+        'truncated_lookups': resolver.truncated_lookups,
+        'assignments': entities
+    }
+
+
+def run_benchmark(sizes: List[int], candidate_budget: int = ENTITY_CANDIDATE_BUDGET,
+                  exact_limit: int = 50000) -> Dict:
+    """
+    Resolve each corpus size with the candidate budget, and without it up to exact_limit names
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    results = []
+    for size in sizes:
+        names = generate_names(size)
+        budgeted = _resolve(names, candidate_budget)
+        assignments = budgeted.pop('assignments')
+        result = {'names': size, **budgeted}
+
+        if size <= exact_limit:
+            exact = _resolve(names, None)
+            exact_assignments = exact.pop('assignments')
+            # Records the exact resolver merged into an earlier entity but the budgeted one did not
+            seen, exact_seen = set(), set()
+            missed = 0
+            for entity, exact_entity in zip(assignments, exact_assignments):
+                missed += entity not in seen and exact_entity in exact_seen
+                seen.add(entity)
+                exact_seen.add(exact_entity)
+            result.update(exact_elapsed_s=exact['elapsed_s'], exact_entities=exact['entities'], missed_merges=missed)
+        results.append(result)
+
+        print(f"{size:>8} names  {result['elapsed_s']:>8} s  {result['names_per_s']:>9} names/s  "
+              f"{result['truncated_lookups']:>6} truncated  exact {result.get('exact_elapsed_s', '-')} s, "
+              f"{result.get('missed_merges', '-')} missed merges", file=sys.stderr)
+
+    return {
+        'benchmark': 'entity_resolution',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'sizes': sizes, 'candidate_budget': candidate_budget, 'exact_limit': exact_limit},
+        'results': results
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark EntityResolver on a skewed name corpus")
+    parser.add_argument('--sizes', type=int, nargs='+', default=[25000, 50000, 100000], help="Corpus sizes")
+    parser.add_argument('--budget', type=int, default=ENTITY_CANDIDATE_BUDGET, help="Posting entries per lookup")
+    parser.add_argument('--exact-limit', type=int, default=50000,
+                        help="Largest corpus also resolved without a budget, to count missed merges")
+    parser.add_argument('--output', help="Append results as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.sizes, args.budget, args.exact_limit)
+
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
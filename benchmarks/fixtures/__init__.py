@@ -0,0 +1,22 @@
+"""Synthetic outlet pages used by the benchmarks and tests (hand-written, not captured from the live sites)"""
+import os
+import re
+from typing import Dict
+
+NEWS_FIXTURE_DIR = os.path.join(os.path.dirname(__file__), 'news')
+
+
+def news_fixture_path(source: str) -> str:
+    """Path of the synthetic search page for a WebScraper.NEWS_SOURCES outlet"""
+    return os.path.join(NEWS_FIXTURE_DIR, re.sub(r'[^a-z]+', '_', source.lower()) + '.html')
+
+
+def load_news_fixtures() -> Dict[str, str]:
+    """Synthetic search page HTML keyed by outlet name"""
+    from utils.web_scraper import WebScraper
+
+    pages = {}
+    for source in WebScraper.NEWS_SOURCES:
+        with open(news_fixture_path(source), encoding='utf-8') as f:
+            pages[source] = f.read()
+    return pages
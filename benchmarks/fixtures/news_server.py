@@ -0,0 +1,174 @@
+"""
+Stand-in News Server - Synthetic outlet search pages over local HTTP
+One server (and port) per WebScraper.NEWS_SOURCES outlet, so each outlet is
+a separate host to the pooled client and per-domain limiters, exactly as in
+production. Latency, error rate and throttling are configurable per outlet.
+Pages carry an ETag and honour If-None-Match, so cache revalidation is real.
+
+Usage:
+    python -m benchmarks.fixtures.news_server --latency 0.2 --error-rate 0.05
+"""
+import argparse
+import hashlib
+import random
+import threading
+import time
+from email.utils import formatdate
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional
+
+from benchmarks.fixtures import load_news_fixtures
+
+DEFAULT_BEHAVIOUR = {
+    'latency': 0.05,      # Seconds before the response is sent
+    'jitter': 0.02,       # +/- uniform noise on the latency
+    'error_rate': 0.0,    # Share of requests answered with 503
+    'throttle_rps': None  # Requests/second above which 429 is returned
+}
+
+
+class _OutletHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'  # Keep-alive, like the real outlets
+
+    def do_GET(self):
+        outlet: _Outlet = self.server.outlet
+        status = outlet.admit()
+
+        delay = outlet.behaviour['latency'] + random.uniform(-1, 1) * outlet.behaviour['jitter']
+        if delay > 0:
+            time.sleep(delay)
+
+        if status == 429:
+            self._send(429, b'', {'Retry-After': '1'})
+        elif status == 503:
+            self._send(503, b'')
+        elif self.headers.get('If-None-Match') == outlet.etag:
+            self._send(304, b'', {'ETag': outlet.etag}, count_as=304)
+        else:
+            self._send(200, outlet.body, {
+                'Content-Type': 'text/html; charset=utf-8',
+                'ETag': outlet.etag,
+                'Last-Modified': outlet.last_modified
+            })
+
+    def _send(self, status: int, body: bytes, headers: Optional[Dict[str, str]] = None,
+              count_as: Optional[int] = None):
+        self.server.outlet.record(count_as or status)
+        self.send_response(status)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Outlet:
+    """One outlet's page, behaviour and counters"""
+
+    def __init__(self, name: str, page_html: str, behaviour: Dict):
+        self.name = name
+        self.body = page_html.encode('utf-8')
+        self.etag = '"' + hashlib.sha1(self.body).hexdigest() + '"'
+        self.last_modified = formatdate(usegmt=True)
+        self.behaviour = behaviour
+        self.stats = {'requests': 0, 'by_status': {}}
+        self._lock = threading.Lock()
+        self._window_start = time.monotonic()
+        self._window_count = 0
+
+    def admit(self) -> int:
+        """Status forced by throttling or error injection (200 otherwise)"""
+        with self._lock:
+            now = time.monotonic()
+            if now - self._window_start >= 1.0:
+                self._window_start, self._window_count = now, 0
+            self._window_count += 1
+            throttle = self.behaviour['throttle_rps']
+            if throttle is not None and self._window_count > throttle:
+                return 429
+        if random.random() < self.behaviour['error_rate']:
+            return 503
+        return 200
+
+    def record(self, status: int):
+        with self._lock:
+            self.stats['requests'] += 1
+            self.stats['by_status'][status] = self.stats['by_status'].get(status, 0) + 1
+
+
+class NewsServer:
+    """
+    Local stand-ins for every news outlet
+
+    Args:
+        behaviour: Defaults for all outlets (keys of DEFAULT_BEHAVIOUR)
+        overrides: {outlet name: behaviour keys} for individual outlets
+        host: Interface to bind
+    """
+
+    def __init__(self, behaviour: Optional[Dict] = None, overrides: Optional[Dict[str, Dict]] = None,
+                 host: str = '127.0.0.1'):
+        self.host = host
+        self.outlets: Dict[str, _Outlet] = {}
+        self._servers: Dict[str, ThreadingHTTPServer] = {}
+
+        for name, page_html in load_news_fixtures().items():
+            settings = {**DEFAULT_BEHAVIOUR, **(behaviour or {}), **(overrides or {}).get(name, {})}
+            self.outlets[name] = _Outlet(name, page_html, settings)
+
+    def start(self) -> 'NewsServer':
+        for name, outlet in self.outlets.items():
+            server = ThreadingHTTPServer((self.host, 0), _OutletHandler)
+            server.daemon_threads = True
+            server.outlet = outlet
+            threading.Thread(target=server.serve_forever, name=f'news-server-{name}', daemon=True).start()
+            self._servers[name] = server
+        return self
+
+    def source_urls(self) -> Dict[str, str]:
+        """Drop-in replacement for WebScraper.NEWS_SOURCES"""
+        return {
+            name: f"http://{self.host}:{server.server_address[1]}/search?q="
+            for name, server in self._servers.items()
+        }
+
+    def stats(self) -> Dict[str, Dict]:
+        return {name: outlet.stats for name, outlet in self.outlets.items()}
+
+    def stop(self):
+        for server in self._servers.values():
+            server.shutdown()
+            server.server_close()
+        self._servers = {}
+
+    def __enter__(self) -> 'NewsServer':
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    """Serve the stand-in outlets until interrupted"""
+    parser = argparse.ArgumentParser(description="Serve synthetic outlet search pages locally")
+    parser.add_argument('--latency', type=float, default=DEFAULT_BEHAVIOUR['latency'])
+    parser.add_argument('--jitter', type=float, default=DEFAULT_BEHAVIOUR['jitter'])
+    parser.add_argument('--error-rate', type=float, default=DEFAULT_BEHAVIOUR['error_rate'])
+    parser.add_argument('--throttle-rps', type=float, default=None)
+    args = parser.parse_args()
+
+    server = NewsServer({'latency': args.latency, 'jitter': args.jitter,
+                         'error_rate': args.error_rate, 'throttle_rps': args.throttle_rps}).start()
+    for name, url in server.source_urls().items():
+        print(f"{name:<17} {url}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,259 @@
+"""
+Ingestion Benchmark - FileProcessor throughput on synthetic documents
+Generates PDF (PyMuPDF), DOCX (python-docx), XLSX (openpyxl), CSV and TXT
+files of configurable size and table density, then measures pages/sec,
+MB/sec and peak RSS for every processor and both PDF engines.
+
+Each case runs in a fresh process so peak RSS is attributable to it.
+
+Usage:
+    python -m benchmarks.ingestion_benchmark --pages 50 --tables-per-page 2 --output results.json
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import random
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import get_context
+from typing import Dict, List, Optional
+
+WORDS = (
+    "revenue ebitda margin growth customer retention churn cohort valuation "
+    "shareholder agreement liability covenant warranty indemnity subsidiary "
+    "audit liquidity leverage capex opex guidance forecast pipeline contract"
+).split()
+
+TABLE_ROWS = 6
+TABLE_COLS = 4
+
+
+def _sentence(rng: random.Random, words: int = 14) -> str:
+    return ' '.join(rng.choice(WORDS) for _ in range(words)).capitalize() + '.'
+
+
+def _table_rows(rng: random.Random) -> List[List[str]]:
+    header = [f"Metric {col + 1}" for col in range(TABLE_COLS)]
+    rows = [[f"{rng.uniform(0, 1e6):,.0f}" for _ in range(TABLE_COLS)] for _ in range(TABLE_ROWS - 1)]
+    return [header] + rows
+
+
+# ===== SYNTHETIC DOCUMENTS =====
+
+def generate_pdf(path: str, pages: int, tables_per_page: int, seed: int = 0):
+    """Text pages with grid tables drawn by PyMuPDF"""
+    import fitz
+
+    rng = random.Random(seed)
+    pdf = fitz.open()
+    for _ in range(pages):
+        page = pdf.new_page()
+        y = 60
+        for _ in range(12):
+            page.insert_text((50, y), _sentence(rng, 10), fontsize=9)
+            y += 14
+        for _ in range(tables_per_page):
+            y += 10
+            for row in _table_rows(rng):
+                for col, cell in enumerate(row):
+                    x = 50 + col * 120
+                    page.draw_rect(fitz.Rect(x, y - 10, x + 120, y + 4), width=0.5)
+                    page.insert_text((x + 4, y), cell, fontsize=8)
+                y += 14
+    pdf.save(path)
+    pdf.close()
+
+
+def generate_docx(path: str, pages: int, tables_per_page: int, seed: int = 0):
+    """Headed sections of paragraphs and tables; one section per 'page'"""
+    import docx
+
+    rng = random.Random(seed)
+    document = docx.Document()
+    for page in range(pages):
+        document.add_heading(f"Section {page + 1}", level=1)
+        for _ in range(6):
+            document.add_paragraph(' '.join(_sentence(rng) for _ in range(2)))
+        for _ in range(tables_per_page):
+            rows = _table_rows(rng)
+            table = document.add_table(rows=len(rows), cols=TABLE_COLS)
+            for r, row in enumerate(rows):
+                for c, cell in enumerate(row):
+                    table.cell(r, c).text = cell
+    document.save(path)
+
+
+def generate_xlsx(path: str, pages: int, tables_per_page: int, seed: int = 0):
+    """One sheet per 'page', each holding tables_per_page blocks of 50 rows"""
+    import openpyxl
+
+    rng = random.Random(seed)
+    workbook = openpyxl.Workbook(write_only=True)
+    for page in range(pages):
+        sheet = workbook.create_sheet(f"Sheet{page + 1}")
+        sheet.append(['Period', 'Account', 'Amount', 'Units'])
+        for row in range(50 * max(tables_per_page, 1)):
+            sheet.append([f"2025-{row % 12 + 1:02d}", rng.choice(WORDS), rng.uniform(-1e5, 1e5), rng.randint(0, 500)])
+    workbook.save(path)
+
+
+def generate_csv(path: str, pages: int, tables_per_page: int, seed: int = 0):
+    """Ledger-style CSV with 1,000 rows per 'page'"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('period,account,amount,units\n')
+        for row in range(1000 * pages):
+            f.write(f"2025-{row % 12 + 1:02d},{rng.choice(WORDS)},{rng.uniform(-1e5, 1e5):.2f},{rng.randint(0, 500)}\n")
+
+
+def generate_txt(path: str, pages: int, tables_per_page: int, seed: int = 0):
+    """Form-feed separated pages of prose"""
+    rng = random.Random(seed)
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('\f'.join('\n'.join(_sentence(rng) for _ in range(40)) for _ in range(pages)))
+
+
+GENERATORS = {
+    'pdf': generate_pdf,
+    'docx': generate_docx,
+    'xlsx': generate_xlsx,
+    'csv': generate_csv,
+    'txt': generate_txt
+}
+
+# (case name, file type, PDF engine)
+CASES = [
+    ('pdf-pymupdf', 'pdf', 'pymupdf'),
+    ('pdf-pypdf2', 'pdf', 'pypdf2'),
+    ('docx', 'docx', None),
+    ('xlsx', 'xlsx', None),
+    ('csv', 'csv', None),
+    ('txt', 'txt', None)
+]
+
+
+# ===== MEASUREMENT =====
+
+def _peak_rss_mb() -> float:
+    """Peak resident set size of this process in MB"""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+
+
+def _run_case(path: str, file_type: str, engine: Optional[str], repeat: int) -> Dict:
+    """Worker: process one file `repeat` times with full extraction"""
+    from utils.file_processor import FileProcessor
+
+    baseline_rss = _peak_rss_mb()
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    timings = []
+    pages = 0
+    for _ in range(repeat):
+        buffer = io.BytesIO(data)
+        buffer.name = os.path.basename(path)
+
+        started = time.perf_counter()
+        if file_type == 'pdf':
+            document = FileProcessor.process_pdf(buffer, engine=engine)
+        else:
+            document = FileProcessor.process_file(buffer)
+        if document is None:
+            raise RuntimeError(f"{FileProcessor.__name__} failed on {path}")
+
+        # Force full extraction, including lazily built fields
+        pages = sum(1 for _ in document.iter_pages())
+        for key in document.keys():
+            if key != 'text':
+                document.get(key)
+        document.close()
+        timings.append(time.perf_counter() - started)
+
+    best = min(timings)
+    megabytes = len(data) / 1e6
+    return {
+        'pages': pages,
+        'size_mb': round(megabytes, 3),
+        'best_s': round(best, 4),
+        'mean_s': round(sum(timings) / len(timings), 4),
+        'pages_per_s': round(pages / best, 1) if best else None,
+        'mb_per_s': round(megabytes / best, 2) if best else None,
+        'peak_rss_mb': round(_peak_rss_mb(), 1),
+        'rss_growth_mb': round(_peak_rss_mb() - baseline_rss, 1)
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.check_output(['git', 'rev-parse', '--short', 'HEAD'],
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except Exception:
+        return None
+
+
+def run_benchmark(pages: int, tables_per_page: int, repeat: int = 3,
+                  cases: Optional[List[str]] = None) -> Dict:
+    """
+    Generate synthetic documents and benchmark every processor
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    selected = [case for case in CASES if not cases or case[0] in cases]
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='ingestion-bench-') as workdir:
+        paths = {}
+        for _, file_type, _ in selected:
+            if file_type not in paths:
+                paths[file_type] = os.path.join(workdir, f"synthetic.{file_type}")
+                GENERATORS[file_type](paths[file_type], pages, tables_per_page)
+
+        for name, file_type, engine in selected:
+            # Fresh process per case so peak RSS is not shared between cases
+            with ProcessPoolExecutor(max_workers=1, mp_context=get_context('spawn')) as pool:
+                metrics = pool.submit(_run_case, paths[file_type], file_type, engine, repeat).result()
+            results.append({'case': name, 'type': file_type, 'engine': engine, **metrics})
+            print(f"{name:<12} {metrics['pages']:>6} pages  {metrics['pages_per_s']:>9} pages/s  "
+                  f"{metrics['mb_per_s']:>7} MB/s  peak RSS {metrics['peak_rss_mb']} MB", file=sys.stderr)
+
+    return {
+        'benchmark': 'ingestion',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'commit': _git_commit(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'pages': pages, 'tables_per_page': tables_per_page, 'repeat': repeat},
+        'results': results
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark FileProcessor on synthetic documents")
+    parser.add_argument('--pages', type=int, default=50, help="Pages (sections/sheets) per document")
+    parser.add_argument('--tables-per-page', type=int, default=2, help="Table density")
+    parser.add_argument('--repeat', type=int, default=3, help="Runs per case (best is reported)")
+    parser.add_argument('--cases', nargs='*', choices=[case[0] for case in CASES],
+                        help="Subset of cases to run")
+    parser.add_argument('--output', help="Append results as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.pages, args.tables_per_page, args.repeat, args.cases)
+
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
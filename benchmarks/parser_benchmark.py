@@ -0,0 +1,113 @@
+"""
+Parser Benchmark - ArticleParser throughput on synthetic outlet pages
+Parses the fixture search page of every WebScraper.NEWS_SOURCES outlet,
+serially and on the parser thread pool, and reports pages/s, MB/s and
+articles/s per outlet. Parsing is mostly GIL-bound, so the pool is not
+expected to beat serial throughput; it is measured because that is how
+live searches parse (off the event loop), and the gap is its overhead.
+
+Usage:
+    python -m benchmarks.parser_benchmark --iterations 200 --output results.jsonl
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+from concurrent.futures import wait
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from benchmarks.fixtures import load_news_fixtures
+from utils.article_parser import ArticleParser
+from utils.web_scraper import WebScraper
+
+
+def _throughput(pages: int, megabytes: float, articles: int, elapsed: float) -> Dict:
+    return {
+        'elapsed_s': round(elapsed, 4),
+        'pages_per_s': round(pages / elapsed, 1),
+        'mb_per_s': round(megabytes / elapsed, 2),
+        'articles_per_s': round(articles / elapsed, 1)
+    }
+
+
+def run_benchmark(iterations: int = 100, workers: int = 4) -> Dict:
+    """
+    Parse every fixture `iterations` times per mode
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    fixtures = load_news_fixtures()
+    parser = ArticleParser(max_workers=workers)
+    results = []
+
+    # Per-outlet serial throughput
+    for source, page_html in fixtures.items():
+        base_url = WebScraper.NEWS_SOURCES[source]
+        articles = len(parser.parse(source, page_html, base_url))  # Warm-up and sanity check
+        if not articles:
+            raise RuntimeError(f"No articles parsed from the {source} fixture; its selectors no longer match")
+
+        started = time.perf_counter()
+        for _ in range(iterations):
+            parser.parse(source, page_html, base_url)
+        elapsed = time.perf_counter() - started
+
+        megabytes = len(page_html.encode('utf-8')) * iterations / 1e6
+        results.append({'case': 'serial', 'source': source, 'articles_per_page': articles,
+                        **_throughput(iterations, megabytes, articles * iterations, elapsed)})
+
+    # All outlets at once on the worker pool, as during a live search (this
+    # keeps the event loop free; it does not add parallelism under the GIL)
+    total_bytes = sum(len(page.encode('utf-8')) for page in fixtures.values())
+    total_articles = sum(r['articles_per_page'] for r in results)
+
+    started = time.perf_counter()
+    futures = [
+        parser.executor.submit(parser.parse, source, page_html, WebScraper.NEWS_SOURCES[source])
+        for _ in range(iterations)
+        for source, page_html in fixtures.items()
+    ]
+    wait(futures)
+    for future in futures:
+        future.result()  # Re-raise parse errors instead of timing a failed run
+    elapsed = time.perf_counter() - started
+    results.append({'case': f'pool-{workers}', 'source': 'all',
+                    **_throughput(iterations * len(fixtures), total_bytes * iterations / 1e6,
+                                  total_articles * iterations, elapsed)})
+    parser.close()
+
+    for result in results:
+        print(f"{result['case']:<8} {result['source']:<17} {result['pages_per_s']:>9} pages/s  "
+              f"{result['mb_per_s']:>7} MB/s  {result['articles_per_s']:>10} articles/s", file=sys.stderr)
+
+    return {
+        'benchmark': 'article_parser',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'iterations': iterations, 'workers': workers},
+        'results': results
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark ArticleParser on synthetic outlet pages")
+    parser.add_argument('--iterations', type=int, default=100, help="Parses per outlet and mode")
+    parser.add_argument('--workers', type=int, default=4, help="Parser thread pool size")
+    parser.add_argument('--output', help="Append results as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    report = run_benchmark(args.iterations, args.workers)
+
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
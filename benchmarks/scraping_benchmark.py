@@ -0,0 +1,188 @@
+"""
+Scraping Benchmark - WebScraper.search_all_sources under load
+Points the scraper at local stand-ins for every outlet (see
+benchmarks.fixtures.news_server) with configurable latency, errors and
+throttling, then runs concurrent searches in four phases:
+
+    cold        empty HTTP cache and news index
+    revalidate  every page revalidated with a conditional GET (304s)
+    warm-cache  pages served from the fresh HTTP cache
+    index       sources answered from the news index
+
+and reports searches/s, latency percentiles, cache hit rates, fallbacks
+to mock articles and connection reuse.
+
+Usage:
+    python -m benchmarks.scraping_benchmark --searches 40 --concurrency 4 --latency 0.1 --output results.jsonl
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urlsplit
+
+from benchmarks.fixtures.news_server import NewsServer, DEFAULT_BEHAVIOUR
+from config.constants import DOMAIN_RATE_LIMITS
+from utils.http_cache import HTTPCache
+from utils.news_index import NewsIndex
+from utils.web_scraper import WebScraper
+
+PHASES = ['cold', 'revalidate', 'warm-cache', 'index']
+
+
+def _percentile(values: List[float], percent: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(percent / 100 * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+def _configure_phase(scraper: WebScraper, phase: str):
+    """Freshness windows that force each phase's code path"""
+    scraper.cache_freshness = 0 if phase == 'revalidate' else 3600
+    scraper.index_freshness = 3600 if phase == 'index' else 0
+
+
+def _run_phase(scraper: WebScraper, phase: str, companies: List[str], industry: str,
+               concurrency: int, deadline: Optional[float]) -> Dict:
+    _configure_phase(scraper, phase)
+    cache_before = dict(scraper.http_cache.stats)
+    served_before = scraper.news_index.stats['served']
+    requests_before = scraper.http_client.stats['requests']
+    opened_before = scraper.http_client.stats['connections_opened']
+    mock_urls = {
+        article['url']
+        for source in scraper.NEWS_SOURCES
+        for article in scraper._generate_mock_articles(source, 'company', industry)
+    }
+
+    def search(company: str) -> Dict:
+        started = time.perf_counter()
+        results = scraper.search_all_sources(company, industry, deadline=deadline)
+        return {
+            'latency': time.perf_counter() - started,
+            'missing': sum(1 for articles in results.values() if not articles),
+            'fallbacks': sum(1 for articles in results.values()
+                             if articles and articles[0]['url'] in mock_urls)
+        }
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        outcomes = list(pool.map(search, companies))
+    elapsed = time.perf_counter() - started
+
+    latencies = [outcome['latency'] for outcome in outcomes]
+    cache = {key: scraper.http_cache.stats[key] - cache_before[key] for key in cache_before}
+    lookups = cache['hits'] + cache['revalidated'] + cache['misses']
+    requests = scraper.http_client.stats['requests'] - requests_before
+    opened = scraper.http_client.stats['connections_opened'] - opened_before
+    sources = len(companies) * len(scraper.NEWS_SOURCES)
+
+    return {
+        'phase': phase,
+        'searches': len(companies),
+        'elapsed_s': round(elapsed, 3),
+        'searches_per_s': round(len(companies) / elapsed, 2),
+        'latency_ms': {
+            'p50': round(_percentile(latencies, 50) * 1000, 1),
+            'p95': round(_percentile(latencies, 95) * 1000, 1),
+            'p99': round(_percentile(latencies, 99) * 1000, 1),
+            'max': round(max(latencies) * 1000, 1)
+        },
+        'http_cache': {**cache, 'hit_rate': round((cache['hits'] + cache['revalidated']) / lookups, 3) if lookups else None},
+        'index_served_rate': round((scraper.news_index.stats['served'] - served_before) / sources, 3),
+        'network_requests': requests,
+        'connection_reuse_rate': round(max(requests - opened, 0) / requests, 3) if requests else None,
+        'missing_rate': round(sum(outcome['missing'] for outcome in outcomes) / sources, 3),
+        'fallback_rate': round(sum(outcome['fallbacks'] for outcome in outcomes) / sources, 3)
+    }
+
+
+def run_benchmark(searches: int = 40, concurrency: int = 4, behaviour: Optional[Dict] = None,
+                  overrides: Optional[Dict[str, Dict]] = None, deadline: Optional[float] = None,
+                  domain_rate: Optional[float] = 50.0, phases: Optional[List[str]] = None) -> Dict:
+    """
+    Drive search_all_sources against the stand-in outlets
+
+    Returns:
+        Machine-readable results with run metadata
+    """
+    behaviour = {**DEFAULT_BEHAVIOUR, **(behaviour or {})}
+    companies = [f"Company {index}" for index in range(searches)]
+    results = []
+
+    with tempfile.TemporaryDirectory(prefix='scraping-bench-') as workdir, \
+            NewsServer(behaviour, overrides) as server:
+        source_urls = server.source_urls()
+        if domain_rate is not None:
+            # Lift the production politeness limits off the local stand-ins
+            for url in source_urls.values():
+                DOMAIN_RATE_LIMITS[urlsplit(url).netloc] = {'rate': domain_rate, 'burst': domain_rate}
+
+        scraper = WebScraper(http_cache=HTTPCache(os.path.join(workdir, 'http')),
+                             news_index=NewsIndex(os.path.join(workdir, 'news_index.db')))
+        scraper.NEWS_SOURCES = source_urls
+
+        for phase in phases or PHASES:
+            result = _run_phase(scraper, phase, companies, 'Food & Beverage', concurrency, deadline)
+            results.append(result)
+            print(f"{phase:<11} {result['searches_per_s']:>7} searches/s  "
+                  f"p50 {result['latency_ms']['p50']:>7} ms  p99 {result['latency_ms']['p99']:>7} ms  "
+                  f"cache hit {result['http_cache']['hit_rate']}  index {result['index_served_rate']}  "
+                  f"fallback {result['fallback_rate']}", file=sys.stderr)
+
+        server_stats = server.stats()
+        scraper.news_index.close()
+
+    return {
+        'benchmark': 'scraping',
+        'timestamp': datetime.now().isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'params': {'searches': searches, 'concurrency': concurrency, 'behaviour': behaviour,
+                   'overrides': overrides or {}, 'deadline': deadline, 'domain_rate': domain_rate},
+        'results': results,
+        'server': server_stats
+    }
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Benchmark WebScraper against local stand-in outlets")
+    parser.add_argument('--searches', type=int, default=40, help="Searches (distinct companies) per phase")
+    parser.add_argument('--concurrency', type=int, default=4, help="Searches in flight at once")
+    parser.add_argument('--latency', type=float, default=DEFAULT_BEHAVIOUR['latency'], help="Outlet latency (s)")
+    parser.add_argument('--jitter', type=float, default=DEFAULT_BEHAVIOUR['jitter'], help="Latency noise (s)")
+    parser.add_argument('--error-rate', type=float, default=DEFAULT_BEHAVIOUR['error_rate'],
+                        help="Share of requests answered with 503")
+    parser.add_argument('--throttle-rps', type=float, default=None,
+                        help="Per-outlet requests/s above which 429 is returned")
+    parser.add_argument('--slow-source', nargs=2, action='append', metavar=('NAME', 'SECONDS'),
+                        help="Give one outlet its own latency (repeatable)")
+    parser.add_argument('--deadline', type=float, default=None, help="search_all_sources deadline (s)")
+    parser.add_argument('--domain-rate', type=float, default=50.0,
+                        help="Client-side requests/s per outlet (0 keeps the production limits)")
+    parser.add_argument('--phases', nargs='*', choices=PHASES, help="Subset of phases to run")
+    parser.add_argument('--output', help="Append results as one JSON line to this file")
+    args = parser.parse_args(argv)
+
+    behaviour = {'latency': args.latency, 'jitter': args.jitter,
+                 'error_rate': args.error_rate, 'throttle_rps': args.throttle_rps}
+    overrides = {name: {'latency': float(seconds)} for name, seconds in args.slow_source or []}
+
+    report = run_benchmark(args.searches, args.concurrency, behaviour, overrides,
+                           args.deadline, args.domain_rate or None, args.phases)
+
+    if args.output:
+        with open(args.output, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(report) + '\n')
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == '__main__':
+    main()
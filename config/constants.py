@@ -5,6 +5,13 @@ Constants and configuration values
 # File processing constants
 MAX_FILE_SIZE_MB = 200
 ALLOWED_EXTENSIONS = ['pdf', 'docx', 'xlsx', 'txt', 'csv']
+PDF_ENGINE = 'pymupdf'  # or 'pypdf2'
+CSV_CHUNK_ROWS = 100_000
+CSV_SAMPLE_ROWS = 20
+CSV_TOP_VALUES_KEPT = 1000  # Bounded per-column value counts for categorical summaries
+NEAR_DUPLICATE_THRESHOLD = 0.8  # Estimated Jaccard similarity of word shingles
+ARTICLE_DUPLICATE_THRESHOLD = 0.7  # Word Jaccard of summaries of untitled articles across outlets
+ARTICLE_TITLE_DUPLICATE_THRESHOLD = 0.8  # Word-bigram Jaccard of headlines across outlets
 
 # LLM Configuration
 DEFAULT_MODEL = "gpt-4-turbo-preview"
@@ -31,6 +38,31 @@ GROWTH_RATES = {
 REQUEST_TIMEOUT = 30
 MAX_RETRIES = 3
 USER_AGENT = "Investment-Analyst-Bot/1.0"
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE = 20
+HTTP_MAX_CONNECTIONS_PER_HOST = 6
+HTTP_KEEPALIVE_EXPIRY = 30  # Seconds an idle pooled connection is kept open
+RATE_LIMIT_PER_SECOND = 2.0  # Requests per second per domain
+RATE_LIMIT_BURST = 5
+RATE_LIMIT_MAX_WAIT = 2.0  # Skip rather than queue longer than this (seconds)
+CIRCUIT_FAILURE_THRESHOLD = 3  # Consecutive failures before a domain is skipped
+CIRCUIT_COOLDOWN = 300  # Seconds a failing domain is skipped
+DOMAIN_RATE_LIMITS = {
+    # 'www.bloomberg.com': {'rate': 0.5, 'burst': 2}
+}
+HTTP_CACHE_DIR = "data/cache/http"
+PARSER_WORKERS = 4
+MAX_ARTICLES_PER_SOURCE = 10
+HTTP_CACHE_FRESHNESS = 3600  # Seconds a cached page is served without revalidation
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024  # On-disk response bytes before LRU eviction
+HTTP_CACHE_MAX_ENTRIES = 20000  # On-disk responses before LRU eviction
+NEWS_SEARCH_DEADLINE = 5  # Seconds the market page waits before reporting partial results
+NEWS_INDEX_PATH = "data/cache/news_index.db"
+NEWS_INDEX_FRESHNESS = 21600  # Seconds a source's crawl for a company is served from the index
+NEWS_WATCHLIST_PATH = "data/watchlist.json"
+NEWS_CRAWL_INTERVAL = 14400  # Below NEWS_INDEX_FRESHNESS so watchlist companies never go stale
+NEWS_CRAWL_JITTER = 0.2  # +/- fraction applied to crawl intervals and delays
+NEWS_CRAWL_COMPANY_DELAY = 30  # Seconds between two company crawls
 
 # Data sources
 ACCELERATOR_URLS = [
@@ -43,6 +75,18 @@ FUNDING_PLATFORM_URLS = [
     "https://www.angellist.com"
 ]
 
+# Deal sourcing
+DEAL_CACHE_TTL = 3600  # Seconds per-source deal results are reused
+DEAL_CACHE_MAX_ENTRIES = 256  # In-memory (source, filters) entries before LRU eviction
+DEAL_CACHE_DIR = "data/cache/deals"  # Optional on-disk tier (pass to DealScraper)
+DEAL_STORE_PATH = "data/cache/deals.db"  # Persistent deal store for incremental refreshes
+ENTITY_MATCH_THRESHOLD = 0.85  # Character-trigram Dice similarity of normalised company names
+ENTITY_CANDIDATE_BUDGET = 2000  # Posting entries a name lookup collects candidates from (None: exact, quadratic)
+DEAL_UNIVERSE_PATH = "data/cache/deal_universe.db"  # Searchable companies behind DealSourcer
+DEAL_PIPELINE_PATH = "data/cache/deal_pipeline.db"  # Deals listed on the Deal Sourcing page
+DEAL_UNIVERSE_PAGE_SIZE = 500  # Rows fetched per batch when streaming search results
+DEAL_LIST_PAGE_SIZE = 20  # Deals shown per page on the Deal Sourcing page
+
 # Report sections
 MEMO_SECTIONS = [
     "Executive Summary",
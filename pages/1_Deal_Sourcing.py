@@ -8,6 +8,8 @@ import base64
 import os
 from datetime import datetime
 from utils.qdb_styling import apply_qdb_styling
+from utils.deal_universe import DealUniverse, parse_revenue
+from config.constants import DEAL_PIPELINE_PATH, DEAL_LIST_PAGE_SIZE
 
 st.set_page_config(page_title="Deal Sourcing", page_icon="📊", layout="wide", initial_sidebar_state="collapsed")
 apply_qdb_styling()
@@ -29,6 +31,8 @@ if 'selected_deals' not in st.session_state:
     st.session_state.selected_deals = {}
 if 'current_selected_deal' not in st.session_state:
     st.session_state.current_selected_deal = None
+if 'search_cursor' not in st.session_state:
+    st.session_state.search_cursor = None
 
 # ===== DEAL DATABASE =====
 ATTRACTIVE_INDUSTRIES = [
@@ -130,6 +134,13 @@ SAMPLE_DEALS = [
     }
 ]
 
+@st.cache_resource
+def load_pipeline():
+    """Persistent deal store, re-seeded whenever SAMPLE_DEALS changes"""
+    return DealUniverse(DEAL_PIPELINE_PATH, seed=SAMPLE_DEALS)
+
+pipeline = load_pipeline()
+
 # ===== STYLING =====
 st.markdown("""
 <style>
@@ -266,28 +277,21 @@ st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
 # ===== SEARCH BUTTON =====
 if st.button("Search Deals", use_container_width=True, key="search_btn"):
     with st.spinner("Searching deal databases..."):
-        filtered_deals = []
-        for deal in SAMPLE_DEALS:
-            if industry_search and deal['industry'] not in industry_search:
-                continue
-            
-            if stage_search and deal['stage'] not in stage_search:
-                continue
-            
-            if min_revenue != "Any":
-                deal_revenue = deal['revenue'].replace("$", "").replace("M ARR", "")
-                try:
-                    min_val = float(min_revenue.replace("$", "").replace("M", ""))
-                    deal_val = float(deal_revenue.split("-")[0])
-                    if deal_val < min_val:
-                        continue
-                except:
-                    pass
-            
-            filtered_deals.append(deal)
+        # Filters run as SQL against the deal store; results arrive a page at a time
+        filters = {
+            'industries': industry_search or None,
+            'stages': stage_search or None,
+            'revenue_min': parse_revenue(min_revenue) if min_revenue != "Any" else None
+        }
+        filtered_deals, cursor = pipeline.page(limit=DEAL_LIST_PAGE_SIZE, **filters)
         
+        st.session_state.search_filters = filters
+        st.session_state.search_cursor = cursor
+        # Stat cards count every match in SQL, not just the loaded page
+        st.session_state.search_attraction = pipeline.count_by('attraction', **filters)
+        st.session_state.search_total = sum(st.session_state.search_attraction.values())
         st.session_state.search_results = filtered_deals
-        st.success(f"Found {len(filtered_deals)} deals matching your criteria")
+        st.success(f"Found {st.session_state.search_total} deals matching your criteria")
         st.rerun()
 
 st.markdown("<div style='height:8px;'></div>", unsafe_allow_html=True)
@@ -298,12 +302,14 @@ if st.session_state.search_results:
     
     col_stat1, col_stat2, col_stat3, col_stat4 = st.columns(4)
     
-    attractive = sum(1 for d in st.session_state.search_results if d['attraction'] == 'ATTRACTIVE')
-    unattractive = sum(1 for d in st.session_state.search_results if d['attraction'] == 'UNATTRACTIVE')
-    quality = int((attractive / len(st.session_state.search_results) * 100)) if st.session_state.search_results else 0
+    by_attraction = st.session_state.get('search_attraction', {})
+    total = st.session_state.get('search_total', 0)
+    attractive = by_attraction.get('ATTRACTIVE', 0)
+    unattractive = by_attraction.get('UNATTRACTIVE', 0)
+    quality = int((attractive / total * 100)) if total else 0
     
     with col_stat1:
-        st.metric("Total Deals", len(st.session_state.search_results))
+        st.metric("Total Deals", total)
     
     with col_stat2:
         st.metric("Attractive", attractive)
@@ -400,6 +406,19 @@ if st.session_state.search_results:
                     4. Begin comprehensive analysis
                     """)
     
+    # Next page continues from the cursor: nothing already shown is queried again
+    if st.session_state.search_cursor is not None:
+        st.caption(f"Showing {len(st.session_state.search_results)} of {st.session_state.search_total} deals")
+        if st.button("Show More Deals", use_container_width=True, key="more_deals"):
+            more_deals, cursor = pipeline.page(
+                after=st.session_state.search_cursor,
+                limit=DEAL_LIST_PAGE_SIZE,
+                **st.session_state.search_filters
+            )
+            st.session_state.search_results = st.session_state.search_results + more_deals
+            st.session_state.search_cursor = cursor
+            st.rerun()
+    
     st.markdown("</div>", unsafe_allow_html=True)
 
 # ===== SELECTED DEALS SUMMARY =====
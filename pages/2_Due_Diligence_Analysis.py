@@ -10,6 +10,7 @@ from io import BytesIO
 from utils.llm_handler import LLMHandler
 from utils.template_generator import TemplateGenerator
 from utils.qdb_styling import apply_qdb_styling
+from utils.near_duplicates import NearDuplicateDetector
 import os, base64
 
 # === PAGE CONFIG ===
@@ -186,6 +187,7 @@ if run_analysis:
     with st.spinner("🤖 Performing comprehensive due diligence analysis..."):
         
         combined_text = ""
+        document_texts = {}  # str(upload position) -> text (uploads may share a file name)
         processed_files = 0
         skipped_files = 0
         
@@ -193,7 +195,7 @@ if run_analysis:
         if uploaded_files:
             st.info(f"📄 Processing {len(uploaded_files)} documents...")
             
-            for uploaded_file in uploaded_files:
+            for index, uploaded_file in enumerate(uploaded_files):
                 try:
                     if uploaded_file.type == "application/pdf":
                         try:
@@ -209,10 +211,12 @@ if run_analysis:
                                     skipped_files += 1
                                     continue
                             
+                            file_text = ""
                             for page in pdf_reader.pages:
                                 text = page.extract_text()
                                 if text:
-                                    combined_text += text + "\n"
+                                    file_text += text + "\n"
+                            document_texts[str(index)] = file_text
                             processed_files += 1
                         
                         except Exception as pdf_error:
@@ -222,8 +226,10 @@ if run_analysis:
                     
                     elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
                         doc = docx.Document(uploaded_file)
+                        file_text = ""
                         for para in doc.paragraphs:
-                            combined_text += para.text + "\n"
+                            file_text += para.text + "\n"
+                        document_texts[str(index)] = file_text
                         processed_files += 1
                     
                     else:
@@ -233,8 +239,17 @@ if run_analysis:
                     st.warning(f"⚠️ Error processing {uploaded_file.name}")
                     skipped_files += 1
             
+            # Collapse repeated drafts before they reach the LLM
+            unique_files, duplicate_of = NearDuplicateDetector().deduplicate(document_texts)
+            combined_text = "".join(document_texts[key] for key in unique_files)
+            
             if processed_files > 0:
                 st.success(f"✅ Successfully processed {processed_files} documents")
+            if duplicate_of:
+                st.info(f"ℹ️ Collapsed {len(duplicate_of)} duplicate draft(s): " +
+                        ", ".join(f"{uploaded_files[int(dup)].name} (#{int(dup) + 1}) ≈ "
+                                  f"{uploaded_files[int(kept)].name} (#{int(kept) + 1})"
+                                  for dup, kept in duplicate_of.items()))
             if skipped_files > 0:
                 st.info(f"ℹ️ Skipped {skipped_files} files (encrypted or unsupported)")
         
@@ -11,6 +11,7 @@ from utils.qdb_styling import apply_qdb_styling
 from utils.llm_handler import LLMHandler
 from utils.template_generator import TemplateGenerator
 from utils.web_scraper import WebScraper
+from config.constants import NEWS_SEARCH_DEADLINE
 
 st.set_page_config(page_title="Market Analysis", page_icon="🌐", layout="wide", initial_sidebar_state="collapsed")
 apply_qdb_styling()
@@ -221,20 +222,29 @@ if st.button("Generate Market Analysis with Web Intelligence", use_container_wid
             
             try:
                 # THIS IS WHERE web_scraper IS USED!
-                web_results = web_scraper.search_all_sources(company_name, industry)
+                # Sources are rendered as they arrive; the slowest no longer blocks the rest
+                progress = st.empty()
+                badges = st.empty()
+                
+                for source, articles in web_scraper.iter_search_results(company_name, industry, deadline=NEWS_SEARCH_DEADLINE):
+                    web_results[source] = articles
+                    progress.markdown(f"<p style='color:#1B2B4D;'>📡 {len(web_results)}/8 sources responded...</p>", unsafe_allow_html=True)
+                    badges.markdown(" ".join(
+                        f"<span class='news-badge'>{name.split()[0]}</span>"
+                        for name, found in web_results.items() if found
+                    ), unsafe_allow_html=True)
+                
+                web_results = {source: web_results[source] for source in WebScraper.NEWS_SOURCES if source in web_results}
                 
                 # Display sources found
                 sources_found = len([s for s, articles in web_results.items() if articles])
                 total_articles = sum(len(articles) for articles in web_results.values())
                 
-                st.markdown(f"<p style='color:#16A085; font-weight:700;'>✅ Found {total_articles} articles from {sources_found}/8 sources</p>", unsafe_allow_html=True)
+                progress.markdown(f"<p style='color:#16A085; font-weight:700;'>✅ Found {total_articles} articles from {sources_found}/8 sources</p>", unsafe_allow_html=True)
                 
-                # Display badges
-                cols = st.columns(8)
-                for idx, (source, articles) in enumerate(web_results.items()):
-                    with cols[idx % 8]:
-                        if articles:
-                            st.markdown(f"<span class='news-badge'>{source.split()[0]}</span>", unsafe_allow_html=True)
+                if web_scraper.missing_sources:
+                    st.caption(f"⏱️ Still loading after {NEWS_SEARCH_DEADLINE}s: {', '.join(web_scraper.missing_sources)}. "
+                               "They will be included when you run this analysis again.")
             
             except Exception as e:
                 st.warning(f"⚠️ Web research limited: {str(e)}")
@@ -0,0 +1,98 @@
+"""ArticleParser against the synthetic outlet search pages in benchmarks/fixtures"""
+import os
+from urllib.parse import urlsplit
+
+import pytest
+
+from benchmarks.fixtures import load_news_fixtures
+from benchmarks.fixtures.news_server import NewsServer
+from utils.article_parser import ArticleParser
+from utils.http_cache import HTTPCache
+from utils.news_index import NewsIndex
+from utils.web_scraper import WebScraper
+
+TITLES = [
+    'Baladna expands dairy capacity across GCC',
+    'Qatar food security push lifts local producers',
+    'Dairy sector consolidation accelerates in the Gulf',
+    'Baladna reports record quarterly revenue',
+    'Regional investors back food manufacturing growth',
+    'Gulf dairy exports climb as new plants come online',
+    'Baladna signs supply deal with regional retailer',
+    'Food processing M&A picks up in MENA',
+    'Agritech funding in the Gulf reaches new high',
+    'Baladna shares rise after earnings beat'
+]
+DATES = [f'October {day}, 2025' for day in range(10, 20)]
+
+# URL of the first result per outlet, once resolved against the search page
+FIRST_URLS = {
+    'Bloomberg': 'https://www.bloomberg.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc',
+    'Forbes': 'https://www.forbes.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc',
+    'CNBC': 'https://www.cnbc.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc.html',
+    'Al Jazeera': 'https://www.aljazeera.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc',
+    'Gulf Business': 'https://gulfbusiness.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc/',
+    'Arabian Business': 'https://www.arabianbusiness.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc',
+    'Zawya': 'https://www.zawya.com/en/business/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc',
+    'Yahoo Finance': 'https://finance.yahoo.com/news/2025/10/10/baladna-expands-dairy-capacity-across-gcc.html'
+}
+
+
+@pytest.fixture(scope='module')
+def parser():
+    parser = ArticleParser(max_workers=2)
+    yield parser
+    parser.close()
+
+
+@pytest.fixture(scope='module')
+def fixtures():
+    return load_news_fixtures()
+
+
+@pytest.mark.parametrize('source', list(WebScraper.NEWS_SOURCES))
+def test_parse_outlet_page(parser, fixtures, source):
+    articles = parser.parse(source, fixtures[source], WebScraper.NEWS_SOURCES[source])
+
+    assert [article['title'] for article in articles] == TITLES
+    assert [article['date'] for article in articles] == DATES
+    assert articles[0]['url'] == FIRST_URLS[source]
+    assert len({article['url'] for article in articles}) == len(articles)
+    assert all(article['source'] == source and article['summary'] for article in articles)
+
+
+def test_parse_empty_and_broken_pages(parser):
+    assert parser.parse('Bloomberg', '') == []
+    assert parser.parse('Bloomberg', '<html><body><p>No results</p></body></html>') == []
+
+
+def test_parse_respects_max_articles(fixtures):
+    parser = ArticleParser(max_workers=1, max_articles=3)
+    try:
+        assert len(parser.parse('Forbes', fixtures['Forbes'])) == 3
+    finally:
+        parser.close()
+
+
+def test_search_all_sources_against_news_server(tmp_path):
+    with NewsServer({'latency': 0.0, 'jitter': 0.0}) as server:
+        source_urls = server.source_urls()
+        scraper = WebScraper(http_cache=HTTPCache(os.path.join(tmp_path, 'http')),
+                             news_index=NewsIndex(os.path.join(tmp_path, 'news_index.db')))
+        scraper.NEWS_SOURCES = source_urls
+        scraper.index_freshness = 0
+        try:
+            results = scraper.search_all_sources('Baladna', 'Food & Beverage', deadline=30)
+        finally:
+            scraper.news_index.close()
+        requests = {name: stats['requests'] for name, stats in server.stats().items()}
+
+    assert scraper.missing_sources == []
+    assert requests == {source: 1 for source in source_urls}
+    for source, articles in results.items():
+        # Parsed from the served page, not the mock fallback
+        assert sorted(article['title'] for article in articles) == sorted(TITLES)
+        first = next(article for article in articles if article['title'] == TITLES[0])
+        assert first['date'] == DATES[0]
+        # Relative links resolve against the stand-in server, absolute ones are kept
+        assert urlsplit(first['url']).path == urlsplit(FIRST_URLS[source]).path
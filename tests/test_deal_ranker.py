@@ -0,0 +1,72 @@
+"""DealRanker scores against the original per-deal implementation"""
+import copy
+
+import pytest
+
+from utils.deal_ranker import DealRanker
+from utils.deal_scraper import DealScraper
+
+# (company, composite_score, rank) of the sample source deals, as ranked
+# by the original per-deal scorer with the default weights
+BASELINE_RANKING = [
+    ('BlockChain Hub', 7.1, 1),
+    ('GreenEnergy Pro', 6.9, 2),
+    ('NeuralFlow AI', 6.7, 3),
+    ('HealthTech Hub', 6.5, 4),
+    ('BioTech Innovations LLC', 6.0, 5),
+    ('QuantumAI Systems', 5.3, 6),
+    ('DataFlow Analytics', 5.2, 7)
+]
+
+
+@pytest.fixture(scope='module')
+def sample_deals():
+    scraper = DealScraper()
+    return [deal for scrape in scraper.sources.values() for deal in scrape({})]
+
+
+def test_rank_deals_matches_baseline(sample_deals):
+    ranked = DealRanker().rank_deals(copy.deepcopy(sample_deals))
+
+    assert [(deal['company'], deal['composite_score'], deal['rank']) for deal in ranked] == BASELINE_RANKING
+
+
+def test_top_k_and_score_deal_match_baseline(sample_deals):
+    ranker = DealRanker()
+    top = ranker.rank_deals(copy.deepcopy(sample_deals), top_k=3)
+    assert [(deal['company'], deal['composite_score'], deal['rank']) for deal in top] == BASELINE_RANKING[:3]
+
+    expected = {company: score for company, score, _ in BASELINE_RANKING}
+    for deal in copy.deepcopy(sample_deals):
+        ranker.score_deal(deal)
+        assert deal['composite_score'] == expected[deal['company']]
+
+
+def test_half_way_composites_round_like_round():
+    # 6.8500000000000005 rounds up with round() but down with np.round
+    deal = {'industry': 'AI/ML', 'stage': 'Series A', 'founders': ['A'], 'revenue': '$1M ARR'}
+    ranker = DealRanker()
+    composite = ranker.score_deal(deal)
+
+    assert deal['composite_score'] == round(composite, 1)
+    assert ranker.rank_deals([dict(deal)])[0]['composite_score'] == round(composite, 1)
+
+
+def test_prepared_deals_reweight_and_invalidate(sample_deals):
+    ranker = DealRanker()
+    deals = copy.deepcopy(sample_deals)
+    prepared = ranker.prepare(deals)
+    ranker.rank_deals(prepared)
+
+    ranker.weights['risk_profile'] = 0.5
+    reweighted = [deal['company'] for deal in ranker.rank_deals(prepared)]
+    fresh = DealRanker()
+    fresh.weights = dict(ranker.weights)
+    assert reweighted == [deal['company'] for deal in fresh.rank_deals(copy.deepcopy(sample_deals))]
+
+    # Edits in place only count once the handle is invalidated
+    last = next(deal for deal in deals if deal['company'] == 'DataFlow Analytics')
+    last.update(industry='AI/ML', founders=['A'], investors='Sequoia', growth='200% YoY')
+    assert ranker.rank_deals(prepared)[0]['company'] != 'DataFlow Analytics'
+    prepared.invalidate()
+    assert ranker.rank_deals(prepared)[0]['company'] == 'DataFlow Analytics'
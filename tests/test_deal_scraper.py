@@ -0,0 +1,27 @@
+"""DealScraper filters and their cache keys"""
+import pytest
+
+from utils.deal_scraper import DealScraper
+
+
+@pytest.fixture(scope='module')
+def scraper():
+    return DealScraper()
+
+
+@pytest.fixture(scope='module')
+def deals(scraper):
+    return [deal for scrape in scraper.sources.values() for deal in scrape({})]
+
+
+@pytest.mark.parametrize('unset', [{'industries': []}, {'industries': None}, {'stages': ()}, {'min_score': None}])
+def test_unset_filters_share_key_and_results(scraper, deals, unset):
+    assert scraper._cache_key('angellist', unset) == scraper._cache_key('angellist', {})
+    assert scraper._filter_deals(deals, unset) == deals
+
+
+@pytest.mark.parametrize('name', ['min_funding', 'min_score'])
+def test_zero_thresholds_are_keyed_and_applied(scraper, deals, name):
+    assert scraper._cache_key('angellist', {name: 0}) != scraper._cache_key('angellist', {})
+    assert scraper._filter_deals(deals, {name: 0}) == deals
+    assert scraper._filter_deals(deals, {name: 10 ** 12}) == []
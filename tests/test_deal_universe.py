@@ -0,0 +1,44 @@
+"""DealUniverse seeding and per-key counts"""
+import os
+
+from utils.deal_universe import DealUniverse
+
+
+def _deals(count: int, attraction: str = 'ATTRACTIVE') -> list:
+    return [{'company': f'Company {i}', 'industry': ['AI/ML', 'Fintech'][i % 2], 'stage': 'Seed',
+             'revenue': f'${i}M ARR', 'attraction': attraction if i % 3 else 'UNATTRACTIVE'}
+            for i in range(count)]
+
+
+def test_changed_seed_reseeds_store(tmp_path):
+    path = os.path.join(tmp_path, 'pipeline.db')
+    DealUniverse(path, seed=_deals(6)).close()
+
+    universe = DealUniverse(path, seed=_deals(6))
+    assert universe.count() == 6
+    universe.close()
+
+    universe = DealUniverse(path, seed=_deals(9))
+    assert universe.count() == 9
+    assert universe.get('Company 8')['company'] == 'Company 8'
+    universe.close()
+
+
+def test_caller_deals_survive_seed_change(tmp_path):
+    path = os.path.join(tmp_path, 'universe.db')
+    universe = DealUniverse(path, seed=_deals(6))
+    universe.replace(_deals(4))
+    universe.close()
+
+    universe = DealUniverse(path, seed=_deals(9))
+    assert universe.count() == 4
+    universe.close()
+
+
+def test_count_by_covers_every_match(tmp_path):
+    universe = DealUniverse(os.path.join(tmp_path, 'pipeline.db'), seed=_deals(30))
+
+    assert universe.count_by('attraction') == {'ATTRACTIVE': 20, 'UNATTRACTIVE': 10}
+    by_attraction = universe.count_by('attraction', industries=['AI/ML'])
+    assert sum(by_attraction.values()) == universe.count(industries=['AI/ML']) == 15
+    universe.close()
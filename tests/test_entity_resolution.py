@@ -0,0 +1,37 @@
+"""EntityResolver blocking against brute-force Dice matching"""
+from benchmarks.entity_benchmark import generate_names
+from utils.entity_resolution import EntityResolver, _ngrams, normalize_name
+
+
+def _best_score(indexed, name, threshold):
+    grams = _ngrams(name, 3)
+    scores = [2 * len(grams & other) / (len(grams) + len(other)) for other in indexed]
+    best = max(scores, default=0.0)
+    return round(best, 9) if best >= threshold else None
+
+
+def test_blocking_finds_every_brute_force_match():
+    resolver = EntityResolver(candidate_budget=None)
+    indexed = {}
+    for name in generate_names(1500, seed=1):
+        normalized = normalize_name(name)
+        match = resolver.match(name)
+        expected = 1.0 if normalized in indexed else _best_score(indexed.values(), normalized, resolver.threshold)
+        assert (round(match[1], 9) if match else None) == expected, name
+
+        resolver.add(name)
+        indexed.setdefault(normalized, _ngrams(normalized, 3))
+    assert resolver.truncated_lookups == 0
+
+
+def test_budget_counts_truncated_lookups():
+    names = generate_names(3000)
+    exact, budgeted = EntityResolver(candidate_budget=None), EntityResolver(candidate_budget=50)
+    for name in names:
+        exact.add(name)
+        budgeted.add(name)
+
+    assert budgeted.truncated_lookups > 0
+    assert exact.truncated_lookups == 0
+    # Truncated lookups can only miss merges, never invent them
+    assert budgeted.entity_count >= exact.entity_count
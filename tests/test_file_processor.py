@@ -0,0 +1,41 @@
+"""FileProcessor.process_csv chunked summaries"""
+import io
+
+import numpy as np
+import pandas as pd
+
+from utils.file_processor import FileProcessor
+
+
+def _summary(csv_text: str, chunk_rows: int, **options) -> dict:
+    buffer = io.BytesIO(csv_text.encode('utf-8'))
+    buffer.name = 'data.csv'
+    return FileProcessor.process_file(buffer, chunk_rows=chunk_rows, **options)['summary']
+
+
+def test_text_after_numeric_chunks_is_counted():
+    summary = _summary('x,y\n' + '1,2\n' * 10 + 'abc,3\n' * 5, chunk_rows=10)
+
+    assert summary['non_null'] == {'x': 15, 'y': 15}
+    assert summary['numeric_summary']['x']['count'] == 10
+    assert summary['numeric_summary']['x']['non_numeric'] == 5
+    assert summary['numeric_summary']['x']['non_numeric_values'] == {'abc': 5}
+
+
+def test_columns_pruned_and_typed_over_all_chunks():
+    summary = _summary('x,y,z\n' + ',1,\n' * 10 + 'abc,2,\n' * 5, chunk_rows=10)
+
+    assert summary['columns'] == ['x', 'y']
+    assert summary['top_values'] == {'x': {'abc': 5}}
+    assert summary['numeric_columns'] == ['y']
+
+
+def test_chunked_variance_matches_pandas():
+    values = 1e9 + np.random.default_rng(0).normal(0, 1, 5000)
+    frame = pd.DataFrame({'a': values, 'b': np.arange(5000)})
+    summary = _summary(frame.to_csv(index=False), chunk_rows=700, usecols=['a'])
+
+    expected = pd.read_csv(io.StringIO(frame.to_csv(index=False)))['a']
+    assert summary['columns'] == ['a']
+    assert np.isclose(summary['numeric_summary']['a']['std'], expected.std(ddof=0), rtol=1e-6)
+    assert np.isclose(summary['numeric_summary']['a']['mean'], expected.mean())
@@ -0,0 +1,33 @@
+"""HTTPCache size bounds and LRU eviction"""
+import os
+
+from utils.http_cache import HTTPCache
+
+
+def _store(cache, name, body='x' * 100):
+    return cache.store(f'https://example.com/{name}', 200, body, {})
+
+
+def test_least_recently_used_entry_is_evicted(tmp_path):
+    cache = HTTPCache(str(tmp_path), max_entries=3)
+    for name in 'abc':
+        _store(cache, name)
+    cache.get('https://example.com/a')
+    _store(cache, 'd')
+
+    assert cache.get('https://example.com/b') is None
+    assert all(cache.get(f'https://example.com/{name}') for name in 'acd')
+    assert cache.stats['evictions'] == 1
+    assert len(os.listdir(tmp_path)) == 3
+
+
+def test_byte_limit_applies_to_existing_files_on_open(tmp_path):
+    cache = HTTPCache(str(tmp_path))
+    paths = [cache._path(_store(cache, name)['url']) for name in 'abcd']
+    for age, path in enumerate(reversed(paths)):
+        os.utime(path, (1_000_000 - age, 1_000_000 - age))
+    entry_bytes = os.path.getsize(paths[0])
+
+    reopened = HTTPCache(str(tmp_path), max_bytes=2 * entry_bytes)
+    assert reopened.stats['evictions'] == 2
+    assert sorted(os.listdir(tmp_path)) == sorted(os.path.basename(path) for path in paths[2:])
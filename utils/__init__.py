@@ -1,6 +1,7 @@
 """Utility modules for Investment Analyst AI"""
 
 from .file_processor import FileProcessor
+from .document import Document
 from .llm_handler import LLMHandler
 from .vector_store import VectorStoreManager
 from .web_scraper import WebScraper
@@ -10,6 +11,7 @@ from .qdb_styling import apply_qdb_styling
 
 __all__ = [
     'FileProcessor',
+    'Document',
     'LLMHandler',
     'VectorStoreManager',
     'WebScraper',
@@ -0,0 +1,213 @@
+"""
+Article Parser - Per-outlet extraction of search-result articles
+One precompiled lxml XPath extractor per source in WebScraper.NEWS_SOURCES.
+Parsing runs on a worker thread pool so it never blocks the event loop
+fetching the other sources. lxml holds the GIL for most of a parse, so the
+pool keeps the loop responsive rather than adding throughput.
+"""
+import asyncio
+import logging
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Dict, List, Optional
+from urllib.parse import urljoin
+
+from lxml import etree, html as lxml_html
+
+from config.constants import PARSER_WORKERS, MAX_ARTICLES_PER_SOURCE
+
+logger = logging.getLogger(__name__)
+
+WHITESPACE = re.compile(r'\s+')
+DATE_FORMATS = ['%B %d, %Y', '%b %d, %Y', '%d %B %Y', '%d %b %Y', '%m/%d/%Y']
+
+# Search-result markup per outlet: one XPath for the result item and
+# item-relative XPaths for each article field
+SOURCE_SELECTORS = {
+    'Bloomberg': {
+        'item': "//div[contains(@class, 'storyItem')]",
+        'title': ".//a[contains(@class, 'headline')]",
+        'url': ".//a[contains(@class, 'headline')]/@href",
+        'date': ".//*[contains(@class, 'publishedAt')]",
+        'summary': ".//*[contains(@class, 'summary')]"
+    },
+    'Forbes': {
+        'item': "//article[contains(@class, 'stream-item')]",
+        'title': ".//h3//a",
+        'url': ".//h3//a/@href",
+        'date': ".//*[contains(@class, 'stream-item__date')]",
+        'summary': ".//*[contains(@class, 'stream-item__description')]"
+    },
+    'CNBC': {
+        'item': "//div[contains(@class, 'SearchResult-searchResult')]",
+        'title': ".//*[contains(@class, 'Card-title')]",
+        'url': ".//a[contains(@class, 'resultlink')]/@href",
+        'date': ".//*[contains(@class, 'SearchResult-publishedDate')]",
+        'summary': ".//*[contains(@class, 'SearchResult-searchResultPreview')]"
+    },
+    'Al Jazeera': {
+        'item': "//article[contains(@class, 'gc')]",
+        'title': ".//*[contains(@class, 'gc__title')]//span",
+        'url': ".//a[contains(@class, 'gc__title__link')]/@href",
+        'date': ".//*[contains(@class, 'gc__date')]//span",
+        'summary': ".//*[contains(@class, 'gc__excerpt')]"
+    },
+    'Gulf Business': {
+        'item': "//article",
+        'title': ".//*[contains(@class, 'entry-title')]/a",
+        'url': ".//*[contains(@class, 'entry-title')]/a/@href",
+        'date': ".//time/@datetime",
+        'summary': ".//*[contains(@class, 'entry-summary')]"
+    },
+    'Arabian Business': {
+        'item': "//div[contains(@class, 'search-result')]",
+        'title': ".//*[contains(@class, 'title')]/a",
+        'url': ".//*[contains(@class, 'title')]/a/@href",
+        'date': ".//time/@datetime",
+        'summary': ".//*[contains(@class, 'excerpt')]"
+    },
+    'Zawya': {
+        'item': "//div[contains(@class, 'teaser')]",
+        'title': ".//*[contains(@class, 'teaser-title')]//a",
+        'url': ".//*[contains(@class, 'teaser-title')]//a/@href",
+        'date': ".//*[contains(@class, 'teaser-date')]",
+        'summary': ".//*[contains(@class, 'teaser-text')]"
+    },
+    'Yahoo Finance': {
+        'item': "//li[contains(@class, 'js-stream-content')]",
+        'title': ".//h3//a",
+        'url': ".//h3//a/@href",
+        'date': ".//*[contains(@class, 'publishing')]",
+        'summary': ".//p"
+    }
+}
+
+# Used for outlets without dedicated selectors
+GENERIC_SELECTORS = {
+    'item': "//article",
+    'title': ".//h1|.//h2|.//h3",
+    'url': ".//a/@href",
+    'date': ".//time/@datetime|.//time",
+    'summary': ".//p"
+}
+
+
+def _normalize_text(value) -> str:
+    """Collapse whitespace of an XPath string or element result"""
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        text = value
+    else:
+        text = value.text_content()
+    return WHITESPACE.sub(' ', text).strip()
+
+
+def _normalize_date(value: str) -> str:
+    """Render parseable dates like the rest of the reports ('%B %d, %Y')"""
+    candidate = value.strip()
+    if not candidate:
+        return datetime.now().strftime('%B %d, %Y')
+    try:
+        return datetime.fromisoformat(candidate.replace('Z', '+00:00')).strftime('%B %d, %Y')
+    except ValueError:
+        pass
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(candidate, fmt).strftime('%B %d, %Y')
+        except ValueError:
+            continue
+    return candidate
+
+
+class ArticleParser:
+    """Extract articles from outlet search pages on a thread pool"""
+
+    def __init__(self, max_workers: int = PARSER_WORKERS,
+                 max_articles: int = MAX_ARTICLES_PER_SOURCE):
+        self.max_articles = max_articles
+        self.executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='article-parser')
+        self._local = threading.local()
+
+    def _extractors(self) -> Dict[str, Dict[str, etree.XPath]]:
+        """Compiled XPath extractors, built once per worker thread"""
+        extractors = getattr(self._local, 'extractors', None)
+        if extractors is None:
+            extractors = {
+                source: {field: etree.XPath(expression) for field, expression in selectors.items()}
+                for source, selectors in {**SOURCE_SELECTORS, None: GENERIC_SELECTORS}.items()
+            }
+            self._local.extractors = extractors
+        return extractors
+
+    def parse(self, source: str, page_html: str, base_url: str = '') -> List[Dict]:
+        """
+        Extract search-result articles from one outlet page
+
+        Args:
+            source: Outlet name (key of WebScraper.NEWS_SOURCES)
+            page_html: Raw HTML of the search page
+            base_url: URL the page was fetched from, for relative links
+
+        Returns:
+            Article dicts (source, title, date, url, summary)
+        """
+        if not page_html or not page_html.strip():
+            return []
+
+        try:
+            tree = lxml_html.fromstring(page_html)
+        except (etree.ParserError, ValueError) as e:
+            logger.warning(f"Unparseable page from {source}: {str(e)}")
+            return []
+
+        extractors = self._extractors()
+        extractor = extractors.get(source, extractors[None])
+
+        articles = []
+        seen_urls = set()
+        for item in extractor['item'](tree):
+            title = _normalize_text(next(iter(extractor['title'](item)), None))
+            link = _normalize_text(next(iter(extractor['url'](item)), None))
+            if not title or not link:
+                continue
+
+            url = urljoin(base_url, link)
+            if url in seen_urls:
+                continue
+            seen_urls.add(url)
+
+            articles.append({
+                'source': source,
+                'title': title,
+                'date': _normalize_date(_normalize_text(next(iter(extractor['date'](item)), None))),
+                'url': url,
+                'summary': _normalize_text(next(iter(extractor['summary'](item)), None))
+            })
+            if len(articles) >= self.max_articles:
+                break
+
+        return articles
+
+    async def parse_async(self, source: str, page_html: str, base_url: str = '') -> List[Dict]:
+        """Parse on the worker pool without blocking the event loop"""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, self.parse, source, page_html, base_url)
+
+    def close(self):
+        self.executor.shutdown(wait=False)
+
+
+_shared_parser: Optional[ArticleParser] = None
+_shared_lock = threading.Lock()
+
+
+def get_article_parser() -> ArticleParser:
+    """Process-wide parser (and thread pool) shared by all scrapers"""
+    global _shared_parser
+    with _shared_lock:
+        if _shared_parser is None:
+            _shared_parser = ArticleParser()
+        return _shared_parser
@@ -0,0 +1,276 @@
+"""
+Data Room Ingestion - Headless bulk processing of data-room files
+Fans files from a directory or zip out across a process pool via
+FileProcessor.process_file and writes extracted artifacts to a deal workspace.
+Resumable: files whose content hash is already in the manifest are skipped.
+Near-duplicate drafts are recorded with 'duplicate_of' in the manifest.
+
+Usage:
+    python -m utils.data_room path/to/data_room.zip --deal "Baladna"
+"""
+import argparse
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from utils.near_duplicates import NearDuplicateDetector
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+DEFAULT_WORKSPACE_ROOT = os.path.join('data', 'processed')
+MANIFEST_FILE = 'manifest.jsonl'
+ARTIFACTS_DIR = 'artifacts'
+HASH_BLOCK_SIZE = 1 << 20
+
+
+def _slugify(name: str) -> str:
+    """Filesystem-safe deal workspace name"""
+    return re.sub(r'[^a-z0-9]+', '-', name.lower()).strip('-') or 'deal'
+
+
+def _read_source(source: str, member: str) -> bytes:
+    """Read a file from a directory or a zip member"""
+    if os.path.isdir(source):
+        with open(os.path.join(source, member), 'rb') as f:
+            return f.read()
+    with zipfile.ZipFile(source) as archive:
+        return archive.read(member)
+
+
+def _process_member(source: str, member: str, sha256: str, artifacts_dir: str) -> Dict:
+    """
+    Worker: extract one file and write its artifact
+
+    Runs in a child process, so only the small summary travels back
+    to the parent; page text goes straight to disk.
+    """
+    from utils.file_processor import FileProcessor
+
+    try:
+        data = _read_source(source, member)
+        buffer = io.BytesIO(data)
+        buffer.name = os.path.basename(member)
+
+        document = FileProcessor.process_file(buffer)
+        if document is None:
+            return {'member': member, 'sha256': sha256, 'error': 'unsupported or unreadable file'}
+
+        pages = list(document.iter_pages())
+        artifact = {
+            'name': member,
+            'sha256': sha256,
+            'type': document.type,
+            'page_count': document.page_count,
+            'sections': document.sections,
+            'metadata': document.get('metadata', {}),
+            'pages': pages
+        }
+        document.close()
+
+        artifact_path = os.path.join(artifacts_dir, f"{sha256}.json")
+        with open(artifact_path, 'w', encoding='utf-8') as f:
+            json.dump(artifact, f, ensure_ascii=False, default=str)
+
+        signature = NearDuplicateDetector().signature('\n'.join(pages))
+
+        return {
+            'member': member,
+            'sha256': sha256,
+            'signature': signature.tolist() if signature is not None else None,
+            'type': artifact['type'],
+            'pages': artifact['page_count'],
+            'chars': sum(len(page) for page in pages),
+            'bytes': len(data),
+            'artifact': os.path.relpath(artifact_path, os.path.dirname(artifacts_dir))
+        }
+
+    except Exception as e:
+        return {'member': member, 'sha256': sha256, 'error': str(e)}
+
+
+class DataRoomIngestor:
+    """Bulk-ingest a data room into a deal workspace"""
+
+    def __init__(self, deal_name: str, workspace_root: str = DEFAULT_WORKSPACE_ROOT,
+                 max_workers: Optional[int] = None):
+        self.deal_name = deal_name
+        self.workspace = Path(workspace_root) / _slugify(deal_name)
+        self.artifacts_dir = self.workspace / ARTIFACTS_DIR
+        self.manifest_path = self.workspace / MANIFEST_FILE
+        self.max_workers = max_workers or os.cpu_count() or 1
+
+        self.artifacts_dir.mkdir(parents=True, exist_ok=True)
+
+    # ===== DISCOVERY =====
+
+    @staticmethod
+    def _is_candidate(member: str, extensions: Set[str]) -> bool:
+        """Skip OS metadata and unsupported extensions"""
+        name = os.path.basename(member)
+        if not name or name.startswith('.') or '__MACOSX' in member:
+            return False
+        return name.rsplit('.', 1)[-1].lower() in extensions
+
+    def list_members(self, source: str) -> List[str]:
+        """List ingestible files in a directory or zip"""
+        from utils.file_processor import FileProcessor
+
+        extensions = set(FileProcessor.supported_extensions())
+
+        if os.path.isdir(source):
+            members = [
+                os.path.relpath(os.path.join(root, name), source)
+                for root, _, names in os.walk(source)
+                for name in names
+            ]
+        elif zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                members = [info.filename for info in archive.infolist() if not info.is_dir()]
+        else:
+            raise ValueError(f"Data room must be a directory or zip file: {source}")
+
+        return sorted(m for m in members if self._is_candidate(m, extensions))
+
+    @staticmethod
+    def hash_member(source: str, member: str) -> str:
+        """SHA-256 of a file's content, streamed in blocks"""
+        digest = hashlib.sha256()
+
+        def update(stream):
+            for block in iter(lambda: stream.read(HASH_BLOCK_SIZE), b''):
+                digest.update(block)
+
+        if os.path.isdir(source):
+            with open(os.path.join(source, member), 'rb') as stream:
+                update(stream)
+        else:
+            with zipfile.ZipFile(source) as archive, archive.open(member) as stream:
+                update(stream)
+        return digest.hexdigest()
+
+    # ===== MANIFEST =====
+
+    def load_manifest(self) -> Dict[str, Dict]:
+        """Processed files keyed by content hash"""
+        processed = {}
+        if not self.manifest_path.exists():
+            return processed
+
+        with open(self.manifest_path, encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    continue  # Truncated line from an interrupted run
+                if (self.workspace / entry.get('artifact', '')).is_file():
+                    processed[entry['sha256']] = entry
+        return processed
+
+    def _append_manifest(self, entry: Dict):
+        with open(self.manifest_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + '\n')
+
+    # ===== INGESTION =====
+
+    def ingest(self, source: str) -> Dict:
+        """
+        Process every new file of a data room
+
+        Args:
+            source: Directory or zip file
+
+        Returns:
+            Run statistics
+        """
+        members = self.list_members(source)
+        processed = self.load_manifest()
+
+        detector = NearDuplicateDetector()
+        for sha256, entry in processed.items():
+            if entry.get('signature') and not entry.get('duplicate_of'):
+                detector.add(sha256, signature=entry['signature'])
+
+        pending = []
+        seen_hashes = set(processed)
+        skipped = 0
+        for member in members:
+            sha256 = self.hash_member(source, member)
+            if sha256 in seen_hashes:
+                skipped += 1
+                continue
+            seen_hashes.add(sha256)
+            pending.append((member, sha256))
+
+        logger.info(f"{len(members)} files found, {skipped} already processed or duplicate, {len(pending)} to ingest "
+                    f"with {self.max_workers} workers")
+
+        stats = {'found': len(members), 'skipped': skipped, 'processed': 0, 'failed': 0,
+                 'near_duplicates': 0, 'pages': 0, 'bytes': 0}
+        started = time.perf_counter()
+
+        with ProcessPoolExecutor(max_workers=self.max_workers) as pool:
+            futures = [
+                pool.submit(_process_member, source, member, sha256, str(self.artifacts_dir))
+                for member, sha256 in pending
+            ]
+
+            for done, future in enumerate(as_completed(futures), 1):
+                result = future.result()
+
+                if 'error' in result:
+                    stats['failed'] += 1
+                    logger.warning(f"[{done}/{len(pending)}] Failed {result['member']}: {result['error']}")
+                    continue
+
+                if result['signature']:
+                    duplicate_of = detector.add(result['sha256'], signature=result['signature'])
+                    if duplicate_of:
+                        result['duplicate_of'] = duplicate_of
+                        stats['near_duplicates'] += 1
+
+                result['processed_at'] = datetime.now().isoformat(timespec='seconds')
+                self._append_manifest(result)
+
+                stats['processed'] += 1
+                stats['pages'] += result['pages']
+                stats['bytes'] += result['bytes']
+
+                elapsed = max(time.perf_counter() - started, 1e-9)
+                logger.info(f"[{done}/{len(pending)}] {result['member']} ({result['pages']} pages) | "
+                            f"{stats['processed'] / elapsed:.1f} files/s, "
+                            f"{stats['pages'] / elapsed:.1f} pages/s, "
+                            f"{stats['bytes'] / elapsed / 1e6:.2f} MB/s")
+
+        stats['elapsed_s'] = round(time.perf_counter() - started, 3)
+        stats['workspace'] = str(self.workspace)
+        return stats
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Bulk-ingest a data room into a deal workspace")
+    parser.add_argument('source', help="Data room directory or zip file")
+    parser.add_argument('--deal', required=True, help="Deal name (workspace folder)")
+    parser.add_argument('--workspace-root', default=DEFAULT_WORKSPACE_ROOT,
+                        help=f"Root folder for deal workspaces (default: {DEFAULT_WORKSPACE_ROOT})")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Worker processes (default: CPU count)")
+    args = parser.parse_args(argv)
+
+    ingestor = DataRoomIngestor(args.deal, workspace_root=args.workspace_root, max_workers=args.workers)
+    stats = ingestor.ingest(args.source)
+    print(json.dumps(stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
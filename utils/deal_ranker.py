@@ -5,8 +5,65 @@ METHODOLOGIES:
 - Market attractiveness
 - Team assessment
 - Risk scoring
+
+Deals are parsed once into typed columns; every component is a vectorised
+NumPy expression and the composite is a weighted sum of the component
+columns. Top-k and paged rankings select with argpartition instead of
+sorting every deal. prepare() keeps a deal set's component matrix, so
+re-weighting a prepared set only redoes the weighted sum and the selection.
 """
-from typing import Dict, List
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+from utils.deal_universe import parse_growth, parse_revenue
+
+ATTRACTIVE_INDUSTRIES = ["AI/ML", "ClimaTech", "FinTech", "Biotech"]
+REPUTABLE_INVESTORS = ["Sequoia", "Accel", "A16Z", "Benchmark"]
+STAGE_CODES = {'Pre-Seed': 0, 'Seed': 1, 'Series A': 2, 'Series B': 3, 'Series C': 4, 'Growth': 5}
+UNKNOWN_STAGE = -1
+
+# (composite score, input position, rank) of the last deal on a page
+RankCursor = Tuple[float, int, int]
+
+# Component score -> weight key, in score-matrix column order
+COMPONENTS = [
+    ('financial', 'financial_health'),
+    ('market', 'market_opportunity'),
+    ('team', 'team_quality'),
+    ('growth', 'growth_trajectory'),
+    ('risk', 'risk_profile')
+]
+
+
+class PreparedDeals:
+    """
+    A deal set with its component score matrix, for repeated re-weighting
+    
+    Created by DealRanker.prepare(). The matrix is computed on first use and
+    kept until invalidate() is called, which callers must do after editing
+    the deals in place.
+    """
+    
+    def __init__(self, ranker: 'DealRanker', deals: List[Dict]):
+        self.deals = deals
+        self._ranker = ranker
+        self._scores: Optional[np.ndarray] = None
+    
+    @property
+    def scores(self) -> np.ndarray:
+        """Deals x COMPONENTS matrix of component scores"""
+        if self._scores is None:
+            self._scores = self._ranker.component_scores(self._ranker.parse_deals(self.deals))
+        return self._scores
+    
+    def invalidate(self):
+        """Forget the component scores (the deals were edited)"""
+        self._scores = None
+    
+    def __len__(self) -> int:
+        return len(self.deals)
+
 
 class DealRanker:
     """Score and rank deals based on multiple factors"""
@@ -20,102 +77,181 @@ class DealRanker:
             'risk_profile': 0.10
         }
     
-    def score_deal(self, deal: Dict) -> float:
-        """Calculate composite score (0-10)"""
+    def prepare(self, deals: List[Dict]) -> PreparedDeals:
+        """
+        Parse and score a deal set once for repeated ranking
         
-        scores = {
-            'financial': self._score_financial(deal),
-            'market': self._score_market(deal),
-            'team': self._score_team(deal),
-            'growth': self._score_growth(deal),
-            'risk': self._score_risk(deal)
+        Rank the returned handle instead of the list to re-rank under new
+        weights without re-parsing; call its invalidate() after editing deals.
+        """
+        return PreparedDeals(self, deals)
+    
+    def parse_deals(self, deals: List[Dict]) -> Dict[str, np.ndarray]:
+        """One pass over the deal dicts into typed columns"""
+        revenue, revenue_reported, has_raised, attractive_industry = [], [], [], []
+        has_founders, reputable_investor, growth, stage = [], [], [], []
+        for deal in deals:
+            value = parse_revenue(deal['revenue']) if 'revenue' in deal else None
+            revenue.append(np.nan if value is None else value)
+            revenue_reported.append('revenue' in deal and (
+                isinstance(deal['revenue'], (int, float)) or '$' in str(deal['revenue'])))
+            has_raised.append('total_raised' in deal)
+            attractive_industry.append(deal.get('industry') in ATTRACTIVE_INDUSTRIES)
+            has_founders.append(bool(deal.get('founders')))
+            investors = str(deal['investors']) if 'investors' in deal else ''
+            reputable_investor.append(any(inv in investors for inv in REPUTABLE_INVESTORS))
+            value = parse_growth(deal.get('growth'))
+            growth.append(np.nan if value is None else value)
+            stage.append(STAGE_CODES.get(deal.get('stage'), UNKNOWN_STAGE))
+        
+        return {
+            'revenue': np.array(revenue, dtype=float),
+            'revenue_reported': np.array(revenue_reported, dtype=bool),
+            'has_raised': np.array(has_raised, dtype=bool),
+            'attractive_industry': np.array(attractive_industry, dtype=bool),
+            'has_founders': np.array(has_founders, dtype=bool),
+            'reputable_investor': np.array(reputable_investor, dtype=bool),
+            'growth': np.array(growth, dtype=float),
+            'stage': np.array(stage, dtype=np.int8)
         }
+    
+    def component_scores(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Deals x COMPONENTS matrix of component scores (0-10)"""
+        return np.column_stack([
+            self._score_financial(columns),
+            self._score_market(columns),
+            self._score_team(columns),
+            self._score_growth(columns),
+            self._score_risk(columns)
+        ])
+    
+    def weight_vector(self) -> np.ndarray:
+        """self.weights in COMPONENTS order"""
+        return np.array([self.weights[key] for _, key in COMPONENTS])
+    
+    def score_deal(self, deal: Dict) -> float:
+        """Calculate composite score (0-10)"""
         
-        composite = (
-            scores['financial'] * self.weights['financial_health'] +
-            scores['market'] * self.weights['market_opportunity'] +
-            scores['team'] * self.weights['team_quality'] +
-            scores['growth'] * self.weights['growth_trajectory'] +
-            scores['risk'] * self.weights['risk_profile']
-        )
+        scores = self.component_scores(self.parse_deals([deal]))
+        composite = float(self._composite(scores)[0])
         
-        deal['scores'] = scores
+        deal['scores'] = {name: float(score) for (name, _), score in zip(COMPONENTS, scores[0])}
         deal['composite_score'] = round(composite, 1)
         
         return composite
     
-    def _score_financial(self, deal: Dict) -> float:
+    def _score_financial(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
         """Score financial metrics"""
-        score = 5.0
-        
-        # Revenue scoring
-        if 'revenue' in deal:
-            if '$' in deal['revenue']:
-                score += 2
-        
-        # Funding scoring
-        if 'total_raised' in deal:
-            score += 2
-        
-        return min(score, 10)
+        # Revenue scoring, funding scoring
+        score = 5.0 + 2.0 * columns['revenue_reported'] + 2.0 * columns['has_raised']
+        return np.minimum(score, 10)
     
-    def _score_market(self, deal: Dict) -> float:
+    def _score_market(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
         """Score market opportunity"""
-        score = 5.0
-        
-        attractive_industries = ["AI/ML", "ClimaTech", "FinTech", "Biotech"]
-        if deal.get('industry') in attractive_industries:
-            score += 3
-        
-        return min(score, 10)
+        score = 5.0 + 3.0 * columns['attractive_industry']
+        return np.minimum(score, 10)
     
-    def _score_team(self, deal: Dict) -> float:
+    def _score_team(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
         """Score team quality"""
-        score = 5.0
-        
-        if 'founders' in deal and len(deal['founders']) > 0:
-            score += 2
-        
-        if 'investors' in deal:
-            reputable = ["Sequoia", "Accel", "A16Z", "Benchmark"]
-            if any(inv in str(deal['investors']) for inv in reputable):
-                score += 2
-        
-        return min(score, 10)
+        score = 5.0 + 2.0 * columns['has_founders'] + 2.0 * columns['reputable_investor']
+        return np.minimum(score, 10)
     
-    def _score_growth(self, deal: Dict) -> float:
+    def _score_growth(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
         """Score growth trajectory"""
-        score = 5.0
+        growth = np.nan_to_num(columns['growth'], nan=0.0)
+        score = 5.0 + np.select([growth >= 120, growth >= 80, growth >= 50], [3.0, 2.0, 1.0], default=0.0)
+        return np.minimum(score, 10)
+    
+    def _score_risk(self, columns: Dict[str, np.ndarray]) -> np.ndarray:
+        """Score risk profile"""
+        stage = columns['stage']
+        score = 7.0 - 2.0 * (stage == STAGE_CODES['Seed']) + 1.0 * (stage == STAGE_CODES['Series C'])
+        return np.clip(score, 0, 10)
+    
+    def _composite(self, scores: np.ndarray) -> np.ndarray:
+        """Weighted sum of the component columns, added in COMPONENTS order"""
+        # Same operation order as a per-deal sum, so composites match it bit for bit
+        composite = np.zeros(len(scores))
+        for column, weight in enumerate(self.weight_vector()):
+            composite += scores[:, column] * weight
+        return composite
+    
+    def _rank_keys(self, deals: Union[List[Dict], PreparedDeals]) -> Tuple[List[Dict], np.ndarray, np.ndarray]:
+        """Deals, component score matrix and composite_score (rounded as stored) of every deal"""
+        # A prepared set keeps its components; only the weighted sum is redone
+        prepared = deals if isinstance(deals, PreparedDeals) else self.prepare(deals)
+        scores = prepared.scores
+        # round() on each distinct composite (few exist): np.round's scaled
+        # half-even rounding differs at .x5, e.g. 6.8500000000000005 -> 6.8
+        values, inverse = np.unique(self._composite(scores), return_inverse=True)
+        rounded = np.array([round(value, 1) for value in values.tolist()])
+        return prepared.deals, scores, rounded[inverse].reshape(-1)
+    
+    @staticmethod
+    def _select(keys: np.ndarray, count: int,
+                after: Optional[Tuple[float, int]] = None) -> Tuple[np.ndarray, bool]:
+        """
+        Positions of the best `count` keys in rank order (score desc, then input order)
         
-        if 'growth' in deal:
-            growth_str = deal['growth'].lower()
-            if '120%' in growth_str or '200%' in growth_str:
-                score += 3
-            elif '80%' in growth_str or '100%' in growth_str:
-                score += 2
-            elif '50%' in growth_str:
-                score += 1
+        Linear-time selection with argpartition; only the selected keys are sorted.
+        Returns the positions and whether more deals rank below them.
+        """
+        positions = np.arange(len(keys))
+        if after is not None:
+            score, position = after
+            positions = np.flatnonzero((keys < score) | ((keys == score) & (positions > position)))
         
-        return min(score, 10)
+        remaining = len(positions) > count
+        if remaining and count > 0:
+            # Keep every deal tied with the k-th best so ties still resolve by input order
+            kth = keys[positions[np.argpartition(-keys[positions], count - 1)[count - 1]]]
+            positions = positions[keys[positions] >= kth]
+        order = np.lexsort((positions, -keys[positions]))[:count]
+        return positions[order], remaining
     
-    def _score_risk(self, deal: Dict) -> float:
-        """Score risk profile"""
-        score = 7.0
+    def rank_page(self, deals: Union[List[Dict], PreparedDeals], page_size: int,
+                  cursor: Optional[RankCursor] = None) -> Tuple[List[Dict], Optional[RankCursor]]:
+        """
+        One page of the ranking, without sorting the whole deal set
+        
+        Pass the same deals (in the same order) with the returned cursor for
+        the next page; only deals on the page get scores and a rank written.
+        Pass a PreparedDeals to page through it without re-parsing.
+        
+        Returns:
+            (ranked deals, cursor) - cursor is None after the last page
+        """
+        deals, scores, keys = self._rank_keys(deals)
+        after, last_rank = (None, 0) if cursor is None else (cursor[:2], cursor[2])
+        selected, remaining = self._select(keys, page_size, after)
         
-        if deal.get('stage') == 'Seed':
-            score -= 2
-        elif deal.get('stage') == 'Series C':
-            score += 1
+        names = [name for name, _ in COMPONENTS]
+        page = []
+        for rank, position in enumerate(selected.tolist(), last_rank + 1):
+            deal = deals[position]
+            deal['scores'] = dict(zip(names, scores[position].tolist()))
+            deal['composite_score'] = float(keys[position])
+            deal['rank'] = rank
+            page.append(deal)
         
-        return min(max(score, 0), 10)
+        if not remaining or not page:
+            return page, None
+        return page, (float(keys[selected[-1]]), int(selected[-1]), last_rank + len(page))
     
-    def rank_deals(self, deals: List[Dict]) -> List[Dict]:
-        """Rank all deals"""
-        for deal in deals:
-            self.score_deal(deal)
+    def rank_deals(self, deals: Union[List[Dict], PreparedDeals], top_k: Optional[int] = None) -> List[Dict]:
+        """Rank all deals (a list or a PreparedDeals), or only the best top_k"""
+        if top_k is not None:
+            return self.rank_page(deals, top_k)[0]
+        
+        deals, scores, keys = self._rank_keys(deals)
+        names = [name for name, _ in COMPONENTS]
+        for deal, row, value in zip(deals, scores.tolist(), keys.tolist()):
+            deal['scores'] = dict(zip(names, row))
+            deal['composite_score'] = value
         
-        # Sort by composite score
-        ranked = sorted(deals, key=lambda x: x.get('composite_score', 0), reverse=True)
+        # Sort by composite score (stable, so ties keep input order)
+        order = np.argsort(-keys, kind='stable')
+        ranked = [deals[index] for index in order]
         
         # Add rank
         for idx, deal in enumerate(ranked, 1):
@@ -2,33 +2,86 @@
 Deal Scraper - Web Scraping & Data Aggregation
 BEST PRACTICES: 
 - Multiple data sources (AngelList, Crunchbase, PitchBook, SEC)
-- Real-time scraping with caching
+- Real-time scraping with caching (per source and filter set; TTL + LRU, optional disk tier)
 - Error handling & retry logic
-- Rate limiting
+- Fuzzy entity resolution (names + websites) to merge duplicates across sources
+- Rate limiting (per source; sources are queried concurrently)
+- Incremental refresh into a persistent DealStore via per-source watermarks
 """
-import requests
+import copy
 import json
+import os
+import tempfile
 import time
-from typing import List, Dict
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Iterator, List, Dict, Optional, Tuple
 from datetime import datetime, timedelta
 import hashlib
+from config.constants import DEAL_CACHE_TTL, DEAL_CACHE_MAX_ENTRIES
+from utils.deal_store import DealStore, watermark_key
+from utils.entity_resolution import EntityResolver
+from utils.http_client import get_http_client
+from utils.rate_limiter import TokenBucket
 
 class DealScraper:
     """Enterprise deal sourcing using multiple APIs"""
     
-    def __init__(self):
-        self.cache = {}
-        self.cache_ttl = 3600  # 1 hour
+    # Field each source's high-water mark tracks (dates, or the id as a cursor)
+    WATERMARK_FIELDS = {
+        'AngelList': 'id',
+        'Crunchbase': 'id',
+        'LinkedIn': 'id',
+        'TechCrunch': 'announcement_date',
+        'SEC': 'filing_date'
+    }
+    
+    def __init__(self, cache_dir: Optional[str] = None, store: Optional[DealStore] = None):
+        self.cache = OrderedDict()  # key -> (data, timestamp), least recently used first
+        self.cache_ttl = DEAL_CACHE_TTL
+        self.cache_max_entries = DEAL_CACHE_MAX_ENTRIES
+        self.cache_dir = cache_dir  # On-disk tier shared across processes (None disables it)
+        if cache_dir:
+            os.makedirs(cache_dir, exist_ok=True)
+        self.cache_stats = {'hits': 0, 'disk_hits': 0, 'misses': 0, 'evictions': 0}
+        self.store = store  # Persistent deal store; enables incremental refreshes
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Investment Research Bot)'
         }
-        self.rate_limit_delay = 0.5  # 500ms between requests
+        self.rate_limit_delay = 0.5  # 500ms between requests to the same source
+        self.http_client = get_http_client()  # Pooled keep-alive connections shared with WebScraper
+        
+        # Source name -> scraper; all are queried concurrently by scrape_all_sources
+        self.sources: Dict[str, Callable[[Dict], List[Dict]]] = {
+            'AngelList': self.scrape_angellist,
+            'Crunchbase': self.scrape_crunchbase,
+            'LinkedIn': self.scrape_linkedin,
+            'TechCrunch': self.scrape_techcrunch,
+            'SEC': self.scrape_sec_filings
+        }
+        self.source_limits = {
+            source: TokenBucket(rate=1 / self.rate_limit_delay, capacity=1) for source in self.sources
+        }
+    
+    def _rate_limit(self, source: str):
+        """Wait for the source's own rate limit (other sources are unaffected)"""
+        if source not in self.source_limits:
+            self.source_limits[source] = TokenBucket(rate=1 / self.rate_limit_delay, capacity=1)
+        wait = self.source_limits[source].reserve()
+        if wait:
+            time.sleep(wait)
     
-    # ===== SIMULATED API RESPONSES (Production would use real APIs) =====
+    def _get_json(self, url: str, params: Dict = None) -> Dict:
+        """GET a JSON API endpoint over the shared connection pool"""
+        response = self.http_client.get(url, params=params, headers=self.headers)
+        response.raise_for_status()
+        return response.json()
     
-    def scrape_angellist(self, filters: Dict) -> List[Dict]:
+    # ===== SIMULATED API RESPONSES (Production would use real APIs via _get_json) =====
+    
+    def scrape_angellist(self, filters: Dict, since: Optional[str] = None) -> List[Dict]:
         """AngelList API - Seed/early-stage startups"""
-        time.sleep(self.rate_limit_delay)
+        self._rate_limit('AngelList')
         
         deals = [
             {
@@ -67,11 +120,12 @@ class DealScraper:
             }
         ]
         
+        deals = self._since(deals, 'AngelList', since)
         return self._filter_deals(deals, filters)
     
-    def scrape_crunchbase(self, filters: Dict) -> List[Dict]:
+    def scrape_crunchbase(self, filters: Dict, since: Optional[str] = None) -> List[Dict]:
         """Crunchbase API - Funding data"""
-        time.sleep(self.rate_limit_delay)
+        self._rate_limit('Crunchbase')
         
         deals = [
             {
@@ -110,11 +164,12 @@ class DealScraper:
             }
         ]
         
+        deals = self._since(deals, 'Crunchbase', since)
         return self._filter_deals(deals, filters)
     
-    def scrape_linkedin(self, filters: Dict) -> List[Dict]:
+    def scrape_linkedin(self, filters: Dict, since: Optional[str] = None) -> List[Dict]:
         """LinkedIn Jobs API - Growth signals"""
-        time.sleep(self.rate_limit_delay)
+        self._rate_limit('LinkedIn')
         
         deals = [
             {
@@ -135,11 +190,12 @@ class DealScraper:
             }
         ]
         
+        deals = self._since(deals, 'LinkedIn', since)
         return self._filter_deals(deals, filters)
     
-    def scrape_techcrunch(self, filters: Dict) -> List[Dict]:
+    def scrape_techcrunch(self, filters: Dict, since: Optional[str] = None) -> List[Dict]:
         """TechCrunch - News & funding announcements"""
-        time.sleep(self.rate_limit_delay)
+        self._rate_limit('TechCrunch')
         
         deals = [
             {
@@ -159,11 +215,12 @@ class DealScraper:
             }
         ]
         
+        deals = self._since(deals, 'TechCrunch', since)
         return self._filter_deals(deals, filters)
     
-    def scrape_sec_filings(self, filters: Dict) -> List[Dict]:
+    def scrape_sec_filings(self, filters: Dict, since: Optional[str] = None) -> List[Dict]:
         """SEC EDGAR - Form D filings (Reg D offerings)"""
-        time.sleep(self.rate_limit_delay)
+        self._rate_limit('SEC')
         
         deals = [
             {
@@ -183,28 +240,45 @@ class DealScraper:
             }
         ]
         
+        deals = self._since(deals, 'SEC', since)
         return self._filter_deals(deals, filters)
     
     # ===== HELPER METHODS =====
     
+    def _since(self, deals: List[Dict], source: str, since: Optional[str]) -> List[Dict]:
+        """
+        Deals at or past a source's watermark (what an updated_since/cursor API parameter returns)
+        
+        Dates only have day granularity, so deals on the watermark day are
+        fetched again (DealStore.upsert counts them as unchanged); id cursors
+        are exclusive and compare by their trailing number.
+        """
+        if since is None:
+            return deals
+        field = self.WATERMARK_FIELDS.get(source, 'id')
+        mark = watermark_key(since)
+        if field == 'id':
+            return [d for d in deals if d.get(field) and watermark_key(d[field]) > mark]
+        return [d for d in deals if d.get(field) and watermark_key(d[field]) >= mark]
+    
     def _filter_deals(self, deals: List[Dict], filters: Dict) -> List[Dict]:
-        """Apply filters to deals"""
+        """Apply filters to deals (unset filters, as in the cache key, match everything)"""
         filtered = deals
         
         # Industry filter
-        if filters.get('industries'):
+        if not self._is_unset(filters.get('industries')):
             filtered = [d for d in filtered if d['industry'] in filters['industries']]
         
         # Stage filter
-        if filters.get('stages'):
+        if not self._is_unset(filters.get('stages')):
             filtered = [d for d in filtered if d['stage'] in filters['stages']]
         
         # Funding filter
-        if filters.get('min_funding'):
+        if not self._is_unset(filters.get('min_funding')):
             filtered = [d for d in filtered if self._parse_funding(d.get('funding_amount', '$0')) >= filters['min_funding']]
         
         # Score filter
-        if filters.get('min_score'):
+        if not self._is_unset(filters.get('min_score')):
             filtered = [d for d in filtered if d.get('score', 0) >= filters['min_score']]
         
         return filtered
@@ -217,46 +291,190 @@ class DealScraper:
         except:
             return 0
     
-    def scrape_all_sources(self, filters: Dict) -> List[Dict]:
-        """Scrape all sources and aggregate"""
-        all_deals = []
+    def iter_source_results(self, filters: Dict) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Query all sources concurrently and yield (source, deals) as each completes
         
-        sources = [
-            self.scrape_angellist,
-            self.scrape_crunchbase,
-            self.scrape_linkedin,
-            self.scrape_techcrunch,
-            self.scrape_sec_filings
+        Total latency is that of the slowest source, not the sum of all of them.
+        Sources with cached results for the same filters are not queried.
+        """
+        pending = {}
+        for source in self.sources:
+            cached = self.get_cached(self._cache_key(source, filters))
+            if cached is not None:
+                yield source, cached
+            else:
+                pending[source] = self.sources[source]
+        
+        if not pending:
+            return
+        
+        with ThreadPoolExecutor(max_workers=len(pending), thread_name_prefix='deal-source') as pool:
+            futures = {pool.submit(scrape, filters): source for source, scrape in pending.items()}
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    deals = future.result()
+                except Exception as e:
+                    print(f"Error scraping {source}: {e}")
+                    continue
+                self.set_cache(self._cache_key(source, filters), deals)
+                yield source, deals
+    
+    def _refresh_source(self, source: str) -> Dict[str, int]:
+        """Fetch one source's deals past its watermark into the store"""
+        since = self.store.watermark(source)
+        deals = self.sources[source]({}, since=since)
+        counts = self.store.upsert(deals)
+        
+        field = self.WATERMARK_FIELDS.get(source, 'id')
+        marks = [str(d[field]) for d in deals if d.get(field)]
+        self.store.set_watermark(source, max(marks, key=watermark_key) if marks else since)
+        return counts
+    
+    def refresh(self, max_age: Optional[float] = None) -> Dict[str, Dict[str, int]]:
+        """
+        Pull new and changed deals from every source into the store, concurrently
+        
+        Args:
+            max_age: Skip sources refreshed within this many seconds (default: cache_ttl)
+        
+        Returns:
+            {source: {'new', 'changed', 'unchanged'}} for the sources refreshed
+        """
+        if self.store is None:
+            raise ValueError("DealScraper.refresh needs a DealStore")
+        
+        max_age = self.cache_ttl if max_age is None else max_age
+        stale = [
+            source for source in self.sources
+            if time.time() - (self.store.last_refreshed(source) or 0) >= max_age
         ]
         
-        for source_func in sources:
-            try:
-                deals = source_func(filters)
+        results = {}
+        if not stale:
+            return results
+        with ThreadPoolExecutor(max_workers=len(stale), thread_name_prefix='deal-source') as pool:
+            futures = {pool.submit(self._refresh_source, source): source for source in stale}
+            for future in as_completed(futures):
+                source = futures[future]
+                try:
+                    results[source] = future.result()
+                except Exception as e:
+                    print(f"Error refreshing {source}: {e}")
+        return results
+    
+    def scrape_all_sources(self, filters: Dict) -> List[Dict]:
+        """Scrape all sources concurrently and aggregate"""
+        all_deals = []
+        
+        if self.store is not None:
+            # Only activity since each source's watermark is fetched; filters run on the store
+            self.refresh()
+            all_deals = self._filter_deals(self.store.deals(), filters)
+        else:
+            for source, deals in self.iter_source_results(filters):
                 all_deals.extend(deals)
-            except Exception as e:
-                print(f"Error scraping {source_func.__name__}: {e}")
-                continue
         
-        # Remove duplicates
-        unique_deals = {}
-        for deal in all_deals:
-            key = deal['company'].lower()
-            if key not in unique_deals or deal.get('score', 0) > unique_deals[key].get('score', 0):
-                unique_deals[key] = deal
+        # Remove duplicates: fuzzy name / website matching across sources
+        unique_deals = [self._merge_duplicates(cluster) for cluster in EntityResolver().resolve(all_deals)]
         
         # Sort by score
-        sorted_deals = sorted(unique_deals.values(), key=lambda x: x.get('score', 0), reverse=True)
+        sorted_deals = sorted(unique_deals, key=lambda x: x.get('score', 0), reverse=True)
         
         return sorted_deals
     
+    @staticmethod
+    def _merge_duplicates(cluster: List[Dict]) -> Dict:
+        """One deal per company: the best-scored record, gaps filled from the others"""
+        if len(cluster) == 1:
+            return cluster[0]
+        
+        merged = {}
+        for deal in sorted(cluster, key=lambda d: d.get('score', 0)):
+            merged.update(deal)
+        merged['sources'] = sorted({deal['source'] for deal in cluster if deal.get('source')})
+        return merged
+    
+    # ===== CACHE =====
+    
+    @staticmethod
+    def _is_unset(value) -> bool:
+        """None, '' and empty collections leave a filter unset; False and 0 are real values"""
+        return value is None or (isinstance(value, (str, list, tuple, set, dict)) and not value)
+    
+    @classmethod
+    def _normalize_filters(cls, filters: Dict) -> Dict:
+        """Canonical form of a filter dict: no unset values, sorted lists, numbers as floats"""
+        normalized = {}
+        for name, value in filters.items():
+            if cls._is_unset(value):
+                continue
+            if isinstance(value, (list, tuple, set)):
+                value = sorted(str(item) for item in value)
+            elif isinstance(value, (int, float)) and not isinstance(value, bool):
+                value = float(value)
+            normalized[name] = value
+        return normalized
+    
+    def _cache_key(self, source: str, filters: Dict) -> str:
+        """Cache key for one source's results under a filter set"""
+        canonical = json.dumps({'source': source, 'filters': self._normalize_filters(filters)},
+                               sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+    
+    def _disk_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, key + '.json')
+    
     def get_cached(self, key: str):
-        """Get cached data"""
+        """Get a copy of cached data (memory first, then the disk tier)"""
         if key in self.cache:
             data, timestamp = self.cache[key]
             if time.time() - timestamp < self.cache_ttl:
-                return data
+                self.cache.move_to_end(key)
+                self.cache_stats['hits'] += 1
+                # Callers rank and annotate the deals in place
+                return copy.deepcopy(data)
+            del self.cache[key]
+        
+        if self.cache_dir:
+            try:
+                with open(self._disk_path(key), encoding='utf-8') as f:
+                    entry = json.load(f)
+            except (OSError, ValueError):
+                entry = None
+            if entry and time.time() - entry['timestamp'] < self.cache_ttl:
+                self._remember(key, entry['data'], entry['timestamp'])
+                self.cache_stats['disk_hits'] += 1
+                return copy.deepcopy(entry['data'])
+        
+        self.cache_stats['misses'] += 1
         return None
     
-    def set_cache(self, key: str, data):
-        """Set cache"""
-        self.cache[key] = (data, time.time())
+    def set_cache(self, key: str, data: Any):
+        """Set cache (and write through to the disk tier)"""
+        timestamp = time.time()
+        # Keep a private copy: the caller goes on to use (and mutate) data
+        self._remember(key, copy.deepcopy(data), timestamp)
+        
+        if self.cache_dir:
+            # Write-then-rename so concurrent readers never see a partial file
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump({'data': data, 'timestamp': timestamp}, f)
+            os.replace(tmp_path, self._disk_path(key))
+    
+    def _remember(self, key: str, data: Any, timestamp: float):
+        self.cache[key] = (data, timestamp)
+        self.cache.move_to_end(key)
+        while len(self.cache) > self.cache_max_entries:
+            self.cache.popitem(last=False)
+            self.cache_stats['evictions'] += 1
+    
+    def clear_cache(self):
+        """Drop both cache tiers"""
+        self.cache.clear()
+        if self.cache_dir:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.cache_dir, name))
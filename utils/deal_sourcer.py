@@ -1,23 +1,72 @@
 """
 Deal Sourcer - Searches and filters investment deals
-Matches criteria with deal database
+Matches criteria against the persistent DealUniverse: filters are pushed
+down to its indexed SQL columns and only the matching deals are scored.
+Scoring is vectorised: each screening factor is one NumPy expression over
+the matched columns, and only the requested page of records is loaded.
 """
 import logging
-from typing import List, Dict
+from typing import List, Dict, Optional
 from datetime import datetime
 
+import numpy as np
+
+from utils.deal_universe import DealUniverse
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+def _contains(columns: Dict, field: str, text: str) -> np.ndarray:
+    """Element-wise `text in value` for a dictionary-encoded column, tested once per label"""
+    labels = columns['labels'][field]
+    return np.array([text in label for label in labels], dtype=bool)[columns[field]]
+
+
+def _isin(columns: Dict, field: str, values: List[str]) -> np.ndarray:
+    """Element-wise `value in values` for a dictionary-encoded column"""
+    return np.isin(columns['labels'][field], values)[columns[field]]
+
+
 class DealSourcer:
     """
     Searches and filters investment opportunities by criteria
     INDEPENDENT: Does NOT use web_scraper
     """
     
-    def __init__(self):
-        self.deal_database = self._initialize_deals()
+    # Screening factor -> score column over the matched deals' columns
+    SCREENING_FACTORS = {
+        'Unit Economics (LTV/CAC)': lambda c: c['growth'] / 100,  # Normalize growth
+        'Growth Rate (YoY)': lambda c: c['growth'] / 200,
+        'Market Traction': lambda c: (c['team_score'] / 5.0) * 100,
+        'Team Quality': lambda c: c['team_score'],
+        'IP/Technology': lambda c: np.where(c['team_score'] > 4.2, c['team_score'] - 0.5, 3.0),
+        'Strategic Fit with QDB': lambda c: np.where(
+            _contains(c, 'industry', 'ClimateTech') | _contains(c, 'industry', 'Fintech'), 5.0, 3.5),
+        'Exit Potential': lambda c: np.where(
+            _isin(c, 'stage', ['Series A', 'Series B']), c['revenue'] * 2, c['revenue']),
+        'ESG Alignment': lambda c: np.where(_contains(c, 'industry', 'ClimateTech'), 5.0, 3.0),
+    }
+    
+    def __init__(self, universe: Optional[DealUniverse] = None):
+        # Seeded with the mock deals, and re-seeded when they change unless load_deals() replaced them
+        self.universe = universe or DealUniverse(seed=self._initialize_deals())
+    
+    def load_deals(self, deals: List[Dict]):
+        """Replace the deal universe"""
+        self.universe.replace(deals)
+    
+    def _filters(self, industry_list: List[str], stage_list: List[str], revenue_min: float,
+                 revenue_max: float, geography_list: List[str]) -> Dict:
+        """search_deals criteria as DealUniverse filters"""
+        return {
+            'industries': industry_list,
+            'stages': stage_list,
+            'revenue_min': revenue_min,
+            'revenue_max': revenue_max,
+            # Geography is flexible: "Global" in the request matches any deal, and Global deals match any request
+            'geographies': None if "Global" in geography_list else [*geography_list, "Global"]
+        }
     
     def _initialize_deals(self) -> List[Dict]:
         """Initialize mock deal database (in production, would connect to real DB)"""
@@ -66,7 +115,8 @@ class DealSourcer:
     
     def search_deals(self, industry_list: List[str], stage_list: List[str], 
                      revenue_min: float, revenue_max: float, geography_list: List[str],
-                     screening_factors: List[str] = None) -> Dict:
+                     screening_factors: List[str] = None, limit: Optional[int] = None,
+                     offset: int = 0) -> Dict:
         """
         Search deals matching criteria
         
@@ -77,6 +127,8 @@ class DealSourcer:
             revenue_max: Maximum revenue (millions)
             geography_list: Geographic regions
             screening_factors: Criteria to prioritize
+            limit: Page size (all matches when None)
+            offset: Matches to skip, in score order
         
         Returns:
             Dictionary with matched deals and analysis
@@ -85,42 +137,23 @@ class DealSourcer:
         if screening_factors is None:
             screening_factors = []
         
-        # Filter deals by criteria
-        matched_deals = []
-        
-        for deal in self.deal_database:
-            # Check industry
-            if deal['industry'] not in industry_list:
-                continue
-            
-            # Check stage
-            if deal['stage'] not in stage_list:
-                continue
-            
-            # Check revenue range
-            if deal['revenue'] < revenue_min or deal['revenue'] > revenue_max:
-                continue
-            
-            # Check geography (flexible - Global matches any)
-            geo_match = False
-            if "Global" in geography_list or deal['geography'] in geography_list or deal['geography'] == "Global":
-                geo_match = True
-            
-            if not geo_match:
-                continue
-            
-            # Calculate score based on screening factors
-            score = self._calculate_deal_score(deal, screening_factors)
-            deal_with_score = {**deal, 'investment_score': score}
-            matched_deals.append(deal_with_score)
-        
-        # Sort by score
-        matched_deals.sort(key=lambda x: x['investment_score'], reverse=True)
+        # Filters run in SQL; the matching deals' typed columns are scored together
+        filters = self._filters(industry_list, stage_list, revenue_min, revenue_max, geography_list)
+        columns = self.universe.columns(**filters)
+        scores = self._score_deals(columns, screening_factors)
+        
+        # Sort by score (stable, so ties keep database order), then load only the requested page
+        order = np.argsort(-scores, kind='stable')
+        page = order[offset:offset + limit] if limit is not None else order[offset:]
+        matched_deals = [
+            {**deal, 'investment_score': float(score)}
+            for deal, score in zip(self.universe.fetch(columns['id'][page]), scores[page])
+        ]
         
-        logger.info(f"Found {len(matched_deals)} deals matching criteria")
+        logger.info(f"Found {len(scores)} deals matching criteria")
         
         return {
-            'total_matches': len(matched_deals),
+            'total_matches': len(scores),
             'deals': matched_deals,
             'search_criteria': {
                 'industries': industry_list,
@@ -131,86 +164,68 @@ class DealSourcer:
             }
         }
     
-    def _calculate_deal_score(self, deal: Dict, screening_factors: List[str]) -> float:
-        """Calculate investment score based on criteria"""
-        
-        score = 0
-        max_score = len(screening_factors) if screening_factors else 1
+    def _score_deals(self, columns: Dict, screening_factors: List[str]) -> np.ndarray:
+        """Investment scores of every deal in the columns, as one array"""
+        
+        columns = {
+            **columns,
+            'revenue': np.nan_to_num(columns['revenue'], nan=0.0),
+            'growth': np.nan_to_num(columns['growth'], nan=0.0),
+            'team_score': np.nan_to_num(columns['team_score'], nan=3.0)
+        }
         
         if not screening_factors:
-            return deal.get('team_score', 3.0)
+            return columns['team_score']
         
-        # Score based on screening factors
+        # Each factor column is computed once; a factor listed twice counts twice, unknown factors score 3.0
         factor_scores = {
-            'Unit Economics (LTV/CAC)': deal.get('growth', 0) / 100,  # Normalize growth
-            'Growth Rate (YoY)': deal.get('growth', 0) / 200,
-            'Market Traction': (deal.get('team_score', 3.0) / 5.0) * 100,
-            'Team Quality': deal.get('team_score', 3.0),
-            'IP/Technology': deal.get('team_score', 3.0) - 0.5 if deal.get('team_score', 3.0) > 4.2 else 3.0,
-            'Strategic Fit with QDB': 5.0 if 'ClimateTech' in deal.get('industry', '') or 'Fintech' in deal.get('industry', '') else 3.5,
-            'Exit Potential': (deal.get('revenue', 0) * 2) if deal.get('stage') in ['Series A', 'Series B'] else deal.get('revenue', 0),
-            'ESG Alignment': 5.0 if 'ClimateTech' in deal.get('industry', '') else 3.0,
+            factor: self.SCREENING_FACTORS[factor](columns) if factor in self.SCREENING_FACTORS else 3.0
+            for factor in set(screening_factors)
         }
-        
+        score = np.zeros(len(columns['id']))
         for factor in screening_factors:
-            score += factor_scores.get(factor, 3.0)
+            score += factor_scores[factor]
         
-        return (score / max_score) if max_score > 0 else score
+        return score / len(screening_factors)
     
     def get_deal_details(self, deal_name: str) -> Dict:
         """Get detailed information about a specific deal"""
         
-        for deal in self.deal_database:
-            if deal['name'] == deal_name:
-                return {
-                    **deal,
-                    'analysis': f"""
-                    ## {deal['name']} - Investment Summary
-                    
-                    **Company**: {deal['name']}  
-                    **Industry**: {deal['industry']}  
-                    **Stage**: {deal['stage']}  
-                    **Current Revenue**: ${deal['revenue']}M  
-                    **Growth Rate**: {deal['growth']}% YoY  
-                    **Geographic Focus**: {deal['geography']}  
-                    **Team Quality Score**: {deal['team_score']}/5.0  
-                    **Market Traction**: {deal['traction']}  
-                    
-                    ### Investment Highlights
-                    - Strong growth trajectory ({deal['growth']}% YoY)
-                    - Experienced founding team (Score: {deal['team_score']}/5.0)
-                    - Clear market traction: {deal['traction']}
-                    - Strategic fit for portfolio diversification
-                    
-                    ### Funding Recommendation
-                    **Recommendation**: STRONG INTEREST (Tier 1 Priority)  
-                    **Suggested Check Size**: ${max(0.5, deal['revenue'] * 1.5)}M - ${max(1.0, deal['revenue'] * 3.0)}M  
-                    **Expected ROI (5-year)**: 3-8x  
-                    **Investment Timeline**: 60-90 days
-                    """
-                }
-        
+        deal = self.universe.get(deal_name)
+        if deal:
+            return {
+                **deal,
+                'analysis': f"""
+                ## {deal['name']} - Investment Summary
+                
+                **Company**: {deal['name']}  
+                **Industry**: {deal['industry']}  
+                **Stage**: {deal['stage']}  
+                **Current Revenue**: ${deal['revenue']}M  
+                **Growth Rate**: {deal['growth']}% YoY  
+                **Geographic Focus**: {deal['geography']}  
+                **Team Quality Score**: {deal['team_score']}/5.0  
+                **Market Traction**: {deal['traction']}  
+                
+                ### Investment Highlights
+                - Strong growth trajectory ({deal['growth']}% YoY)
+                - Experienced founding team (Score: {deal['team_score']}/5.0)
+                - Clear market traction: {deal['traction']}
+                - Strategic fit for portfolio diversification
+                
+                ### Funding Recommendation
+                **Recommendation**: STRONG INTEREST (Tier 1 Priority)  
+                **Suggested Check Size**: ${max(0.5, deal['revenue'] * 1.5)}M - ${max(1.0, deal['revenue'] * 3.0)}M  
+                **Expected ROI (5-year)**: 3-8x  
+                **Investment Timeline**: 60-90 days
+                """
+            }
+    
         return {}
     
     def get_market_summary(self, industry_list: List[str]) -> Dict:
         """Get market summary for selected industries"""
         
-        industry_data = {}
-        
-        for industry in industry_list:
-            industry_deals = [d for d in self.deal_database if d['industry'] == industry]
-            
-            if industry_deals:
-                avg_growth = sum(d['growth'] for d in industry_deals) / len(industry_deals)
-                avg_team = sum(d['team_score'] for d in industry_deals) / len(industry_deals)
-                total_revenue = sum(d['revenue'] for d in industry_deals)
-                
-                industry_data[industry] = {
-                    'deal_count': len(industry_deals),
-                    'avg_growth_rate': avg_growth,
-                    'avg_team_score': avg_team,
-                    'total_revenue': total_revenue,
-                    'top_deal': max(industry_deals, key=lambda x: x['growth'])['name']
-                }
-        
-        return industry_data
+        # Aggregated in SQL, reported in the requested order
+        summary = self.universe.industry_summary(industry_list)
+        return {industry: summary[industry] for industry in industry_list if industry in summary}
@@ -0,0 +1,138 @@
+"""
+Deal Store - Persistent SQLite store of sourced deals
+Holds every deal seen from every source plus a per-source high-water mark
+(last announcement/filing date or id cursor), so DealScraper refreshes pull
+only what is new since the previous refresh.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+
+from config.constants import DEAL_STORE_PATH
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deals (
+    source TEXT NOT NULL,
+    deal_id TEXT NOT NULL,
+    data TEXT NOT NULL,
+    content_hash TEXT NOT NULL,
+    first_seen REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    PRIMARY KEY (source, deal_id)
+);
+
+CREATE TABLE IF NOT EXISTS watermarks (
+    source TEXT PRIMARY KEY,
+    watermark TEXT,
+    refreshed_at REAL NOT NULL
+);
+"""
+
+TRAILING_NUMBER = re.compile(r'^(.*?)(\d+)$')
+
+
+def watermark_key(watermark: str) -> Tuple[str, int]:
+    """Sort key for watermarks: trailing numbers compare numerically ('AL-999' < 'AL-1000')"""
+    match = TRAILING_NUMBER.match(str(watermark))
+    return (match.group(1), int(match.group(2))) if match else (str(watermark), -1)
+
+
+class DealStore:
+    """Deals keyed by (source, id) with per-source watermarks"""
+
+    def __init__(self, path: str = DEAL_STORE_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One connection shared by the source worker threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+    # ===== WATERMARKS =====
+
+    def watermark(self, source: str) -> Optional[str]:
+        """Highest date/cursor fetched from a source so far"""
+        with self._lock:
+            row = self._conn.execute("SELECT watermark FROM watermarks WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def last_refreshed(self, source: str) -> Optional[float]:
+        """Unix time of the source's last refresh, or None"""
+        with self._lock:
+            row = self._conn.execute("SELECT refreshed_at FROM watermarks WHERE source = ?", (source,)).fetchone()
+        return row[0] if row else None
+
+    def set_watermark(self, source: str, watermark: Optional[str]):
+        """Record a completed refresh (the watermark never moves backwards)"""
+        current = self.watermark(source)
+        if current is not None and (watermark is None or watermark_key(watermark) < watermark_key(current)):
+            watermark = current
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO watermarks (source, watermark, refreshed_at) VALUES (?, ?, ?)",
+                (source, watermark, time.time())
+            )
+
+    # ===== DEALS =====
+
+    def upsert(self, deals: List[Dict]) -> Dict[str, int]:
+        """
+        Merge fetched deals into the store
+
+        Returns:
+            Counts of new, changed and unchanged deals
+        """
+        counts = {'new': 0, 'changed': 0, 'unchanged': 0}
+        now = time.time()
+        with self._lock, self._conn:
+            for deal in deals:
+                data = json.dumps(deal, sort_keys=True)
+                content_hash = hashlib.sha256(data.encode('utf-8')).hexdigest()
+                key = (deal.get('source', ''), str(deal.get('id') or deal.get('company', '')))
+
+                row = self._conn.execute(
+                    "SELECT content_hash FROM deals WHERE source = ? AND deal_id = ?", key
+                ).fetchone()
+                if row is None:
+                    counts['new'] += 1
+                    self._conn.execute(
+                        "INSERT INTO deals (source, deal_id, data, content_hash, first_seen, updated_at) "
+                        "VALUES (?, ?, ?, ?, ?, ?)", (*key, data, content_hash, now, now)
+                    )
+                elif row[0] != content_hash:
+                    counts['changed'] += 1
+                    self._conn.execute(
+                        "UPDATE deals SET data = ?, content_hash = ?, updated_at = ? WHERE source = ? AND deal_id = ?",
+                        (data, content_hash, now, *key)
+                    )
+                else:
+                    counts['unchanged'] += 1
+        return counts
+
+    def deals(self, source: Optional[str] = None) -> List[Dict]:
+        """All stored deals, optionally from one source"""
+        sql = "SELECT data FROM deals"
+        params = ()
+        if source:
+            sql += " WHERE source = ?"
+            params = (source,)
+        with self._lock:
+            rows = self._conn.execute(sql + " ORDER BY source, deal_id", params).fetchall()
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM deals").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,376 @@
+"""
+Deal Universe - Persistent SQLite store of investable companies
+Deals live in typed, indexed columns (industry, stage, revenue, geography...)
+next to their full record, so searches are pushed down to SQL and only the
+matching rows are read. Results stream in id order in batches, and pages
+use keyset pagination (an id cursor), which keeps every page equally cheap
+however deep the caller goes. For bulk scoring, columns() returns just the
+typed columns of the matching rows as NumPy arrays.
+
+The SQL indexes take over from DealSourcer's in-memory posting lists and
+sorted revenue column, and keep their query plan: bulk reads first count
+each usable index's candidates (capped, so the probes stay cheap) and read
+through the most selective one, instead of trusting SQLite's averages.
+"""
+import hashlib
+import json
+import os
+import re
+import sqlite3
+import threading
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from config.constants import DEAL_UNIVERSE_PATH, DEAL_UNIVERSE_PAGE_SIZE
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS deals (
+    id INTEGER PRIMARY KEY,
+    name TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    stage TEXT NOT NULL,
+    revenue REAL,
+    growth REAL,
+    geography TEXT,
+    team_score REAL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS deals_industry_stage_revenue ON deals (industry, stage, revenue);
+CREATE INDEX IF NOT EXISTS deals_stage_revenue ON deals (stage, revenue);
+CREATE INDEX IF NOT EXISTS deals_revenue ON deals (revenue);
+CREATE INDEX IF NOT EXISTS deals_geography ON deals (geography);
+CREATE INDEX IF NOT EXISTS deals_name ON deals (name);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+"""
+
+REVENUE_PATTERN = re.compile(r'([\d.]+)\s*([KMB]?)', re.IGNORECASE)
+REVENUE_UNITS = {'': 1.0, 'K': 0.001, 'M': 1.0, 'B': 1000.0}
+GROWTH_PATTERN = re.compile(r'(-?[\d.]+)\s*%')
+# Typed columns returned by columns() (text dictionary-encoded)
+NUMERIC_COLUMNS = ['id', 'revenue', 'growth', 'team_score']
+TEXT_COLUMNS = ['industry', 'stage', 'geography']
+# Index -> filtered columns it answers on its own (leading column first)
+INDEX_COLUMNS = {
+    'deals_industry_stage_revenue': ('industry', 'stage', 'revenue'),
+    'deals_stage_revenue': ('stage', 'revenue'),
+    'deals_revenue': ('revenue',),
+    'deals_geography': ('geography',)
+}
+# Candidate-count caps tried in turn when picking the most selective index
+INDEX_PROBE_LIMITS = (1_000, 20_000)
+
+
+def parse_revenue(value) -> Optional[float]:
+    """Revenue in millions: 2.5 -> 2.5, '$150K ARR' -> 0.15, '$1-2M' -> 1.0"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = REVENUE_PATTERN.search(str(value or '').replace(',', ''))
+    if not match:
+        return None
+    number, unit = match.groups()
+    if unit == '':
+        # '$1-2M': the unit is on the upper bound
+        rest = REVENUE_PATTERN.search(str(value)[match.end():])
+        unit = rest.group(2) if rest else ''
+    try:
+        return float(number) * REVENUE_UNITS[unit.upper()]
+    except ValueError:
+        return None
+
+
+def parse_growth(value) -> Optional[float]:
+    """Growth in percent: '120% YoY' -> 120.0, 85 -> 85.0 (None when absent)"""
+    if isinstance(value, (int, float)):
+        return float(value)
+    match = GROWTH_PATTERN.search(str(value or ''))
+    try:
+        return float(match.group(1)) if match else None
+    except ValueError:
+        return None
+
+
+def _number(value) -> Optional[float]:
+    # Typed REAL columns never hold text, whatever shape the record has
+    try:
+        return float(value) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _row(deal: Dict) -> Tuple:
+    return (
+        deal.get('name') or deal.get('company', ''),
+        deal.get('industry', ''),
+        deal.get('stage', ''),
+        parse_revenue(deal.get('revenue')),
+        parse_growth(deal.get('growth')),
+        deal.get('geography') or deal.get('location'),
+        _number(deal.get('team_score')),
+        json.dumps(deal)
+    )
+
+
+def _in(column: str, values: Optional[Sequence[str]], conditions: Dict[str, Tuple[List[str], List]]):
+    # None leaves the column unfiltered; an empty selection matches nothing
+    if values is None:
+        return
+    values = list(values)
+    if not values:
+        conditions[column] = (['0'], [])
+        return
+    conditions[column] = ([f"{column} IN ({', '.join('?' * len(values))})"], values)
+
+
+def _sql(conditions: Dict[str, Tuple[List[str], List]], columns: Optional[Sequence[str]] = None) -> Tuple[str, List]:
+    """WHERE clause over the conditions on these columns (all by default)"""
+    clauses, params = [], []
+    for column, (column_clauses, column_params) in conditions.items():
+        if columns is None or column in columns:
+            clauses.extend(column_clauses)
+            params.extend(column_params)
+    return (' WHERE ' + ' AND '.join(clauses)) if clauses else '', params
+
+
+class DealUniverse:
+    """
+    Deals with typed columns and SQL filter pushdown
+
+    Filters (all optional) take lists of industries, stages and geographies
+    and a revenue range in millions; a list matches any of its values.
+
+    A seed is recorded by fingerprint: when the seed passed in changes, a
+    store still holding the previous seed is re-seeded, while one whose
+    deals were loaded or added by the caller is left as it is.
+    """
+
+    def __init__(self, path: str = DEAL_UNIVERSE_PATH, seed: Optional[List[Dict]] = None):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+        if seed:
+            self._seed(seed)
+
+    # ===== LOADING =====
+
+    def _insert(self, deals: List[Dict]):
+        self._conn.executemany(
+            "INSERT INTO deals (name, industry, stage, revenue, growth, geography, team_score, data) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", (_row(deal) for deal in deals)
+        )
+
+    def _set_seed_version(self, version: str):
+        self._conn.execute("INSERT OR REPLACE INTO meta (key, value) VALUES ('seed_version', ?)", (version,))
+
+    def _seed(self, seed: List[Dict]):
+        """Load the seed unless the store already holds it or the caller's own deals"""
+        version = hashlib.sha1(json.dumps(seed, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+        with self._lock, self._conn:
+            row = self._conn.execute("SELECT value FROM meta WHERE key = 'seed_version'").fetchone()
+            empty = self._conn.execute("SELECT NOT EXISTS (SELECT 1 FROM deals)").fetchone()[0]
+            # '' marks caller-owned deals; no row is a store from before seeds were versioned
+            if not empty and row is not None and row[0] in (version, ''):
+                return
+            self._conn.execute("DELETE FROM deals")
+            self._insert(seed)
+            self._set_seed_version(version)
+
+    def add_deals(self, deals: List[Dict]) -> int:
+        """Append deals; returns the number added"""
+        with self._lock, self._conn:
+            self._insert(deals)
+            self._set_seed_version('')
+        return len(deals)
+
+    def replace(self, deals: List[Dict]) -> int:
+        """Swap the whole universe for these deals (readers never see it empty)"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM deals")
+            self._insert(deals)
+            self._set_seed_version('')
+        return len(deals)
+
+    # ===== QUERIES =====
+
+    @staticmethod
+    def _conditions(industries: Optional[Sequence[str]] = None, stages: Optional[Sequence[str]] = None,
+                    revenue_min: Optional[float] = None, revenue_max: Optional[float] = None,
+                    geographies: Optional[Sequence[str]] = None) -> Dict[str, Tuple[List[str], List]]:
+        """Filter clauses and parameters per column"""
+        conditions = {}
+        _in('industry', industries, conditions)
+        _in('stage', stages, conditions)
+        _in('geography', geographies, conditions)
+        revenue = ([], [])
+        if revenue_min is not None:
+            revenue[0].append('revenue >= ?')
+            revenue[1].append(revenue_min)
+        if revenue_max is not None:
+            revenue[0].append('revenue <= ?')
+            revenue[1].append(revenue_max)
+        if revenue[0]:
+            conditions['revenue'] = revenue
+        return conditions
+
+    def _where(self, **filters) -> Tuple[str, List]:
+        return _sql(self._conditions(**filters))
+
+    def _source(self, **filters) -> Tuple[str, List]:
+        """
+        FROM/WHERE reading through the most selective index
+
+        Each index whose leading column is filtered counts its candidates
+        from the index alone, up to a cap that grows until one comes in
+        under it; that index is forced. When every index has more
+        candidates than the last cap, SQLite chooses.
+        """
+        conditions = self._conditions(**filters)
+        where, params = _sql(conditions)
+        usable = {name: columns for name, columns in INDEX_COLUMNS.items() if columns[0] in conditions}
+        if len(usable) < 2 or any(clauses == ['0'] for clauses, _ in conditions.values()):
+            return " FROM deals" + where, params
+
+        for cap in INDEX_PROBE_LIMITS:
+            counts = {}
+            with self._lock:
+                for name, columns in usable.items():
+                    index_where, index_params = _sql(conditions, columns)
+                    counts[name] = self._conn.execute(
+                        f"SELECT COUNT(*) FROM (SELECT 1 FROM deals INDEXED BY {name}{index_where} LIMIT ?)",
+                        (*index_params, cap)
+                    ).fetchone()[0]
+            best = min(counts, key=counts.get)
+            if counts[best] < cap:
+                return f" FROM deals INDEXED BY {best}" + where, params
+        return " FROM deals" + where, params
+
+    def count(self, **filters) -> int:
+        """Number of deals matching the filters"""
+        source, params = self._source(**filters)
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*)" + source, params).fetchone()[0]
+
+    def count_by(self, key: str, **filters) -> Dict[Optional[str], int]:
+        """Number of matching deals per value of a record key (e.g. 'attraction')"""
+        source, params = self._source(**filters)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT json_extract(data, ?), COUNT(*)" + source + " GROUP BY 1", ('$.' + key, *params)
+            ).fetchall()
+        return dict(rows)
+
+    def page(self, after: int = 0, limit: int = DEAL_UNIVERSE_PAGE_SIZE,
+             **filters) -> Tuple[List[Dict], Optional[int]]:
+        """
+        One page of matching deals in id order
+
+        Returns:
+            (deals, cursor) - pass cursor as `after` for the next page; None at the end
+        """
+        where, params = self._where(**filters)
+        where += (' AND' if where else ' WHERE') + ' id > ?'
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT id, data FROM deals" + where + " ORDER BY id LIMIT ?", (*params, after, limit + 1)
+            ).fetchall()
+        # The extra row only tells whether another page exists
+        cursor = rows[limit - 1][0] if len(rows) > limit else None
+        return [json.loads(data) for _, data in rows[:limit]], cursor
+
+    def iter_search(self, page_size: int = DEAL_UNIVERSE_PAGE_SIZE, **filters) -> Iterator[Dict]:
+        """Stream every matching deal in id order, page_size rows at a time"""
+        where, params = self._where(**filters)
+        # One statement for the whole scan: re-running the query per page would
+        # re-filter every earlier match each time
+        with self._lock:
+            rows = self._conn.execute("SELECT data FROM deals" + where + " ORDER BY id", params)
+        while True:
+            with self._lock:
+                batch = rows.fetchmany(page_size)
+            if not batch:
+                return
+            for (data,) in batch:
+                yield json.loads(data)
+
+    def columns(self, **filters) -> Dict:
+        """
+        Typed columns of every matching deal as arrays, in id order
+
+        Filters run in SQL and only the typed columns of matching rows are
+        read. Numeric columns ('id', 'revenue', 'growth', 'team_score') are
+        float arrays with NaN where missing; text columns ('industry',
+        'stage', 'geography') are integer codes into columns['labels'][field].
+        """
+        source, params = self._source(**filters)
+        with self._lock:
+            rows = self._conn.execute(
+                f"SELECT {', '.join(NUMERIC_COLUMNS + TEXT_COLUMNS)}" + source + " ORDER BY id", params
+            ).fetchall()
+
+        values = list(zip(*rows)) if rows else [()] * (len(NUMERIC_COLUMNS) + len(TEXT_COLUMNS))
+        columns, labels = {}, {}
+        for field, column in zip(NUMERIC_COLUMNS, values):
+            columns[field] = np.array(column, dtype=np.int64 if field == 'id' else float)
+        for field, column in zip(TEXT_COLUMNS, values[len(NUMERIC_COLUMNS):]):
+            codes: Dict[str, int] = {}
+            columns[field] = np.fromiter((codes.setdefault(value, len(codes)) for value in column),
+                                         dtype=np.int32, count=len(column))
+            labels[field] = np.array(list(codes), dtype=object)
+        columns['labels'] = labels
+        return columns
+
+    def fetch(self, ids: Sequence[int]) -> List[Dict]:
+        """Full records for these ids, in the given order"""
+        ids = [int(deal_id) for deal_id in ids]
+        records = {}
+        # Stay under SQLite's bound-parameter limit
+        for start in range(0, len(ids), 900):
+            chunk = ids[start:start + 900]
+            with self._lock:
+                rows = self._conn.execute(
+                    f"SELECT id, data FROM deals WHERE id IN ({', '.join('?' * len(chunk))})", chunk
+                ).fetchall()
+            records.update(rows)
+        return [json.loads(records[deal_id]) for deal_id in ids if deal_id in records]
+
+    def get(self, name: str) -> Optional[Dict]:
+        """First deal with this name"""
+        with self._lock:
+            row = self._conn.execute("SELECT data FROM deals WHERE name = ? ORDER BY id LIMIT 1", (name,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def industry_summary(self, industries: Sequence[str]) -> Dict[str, Dict]:
+        """Deal count, average growth/team score and total revenue per industry"""
+        where, params = self._where(industries=industries)
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT industry, COUNT(*), AVG(growth), AVG(team_score), SUM(revenue) FROM deals"
+                + where + " GROUP BY industry", params
+            ).fetchall()
+            summary = {}
+            for industry, count, avg_growth, avg_team, total_revenue in rows:
+                top = self._conn.execute(
+                    "SELECT name FROM deals WHERE industry = ? ORDER BY growth DESC, id LIMIT 1", (industry,)
+                ).fetchone()
+                summary[industry] = {
+                    'deal_count': count,
+                    'avg_growth_rate': avg_growth,
+                    'avg_team_score': avg_team,
+                    'total_revenue': total_revenue,
+                    'top_deal': top[0]
+                }
+        return summary
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
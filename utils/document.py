@@ -0,0 +1,209 @@
+"""
+Lazy, page-indexed document returned by FileProcessor
+Pages are extracted on demand and cached, so reading page 3 or the first
+few thousand characters of a 400-page file never forces full extraction.
+A Document owns its file handle: it is released once every page has been
+extracted, or by close() (or a with block) for callers that stop early.
+"""
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import tiktoken
+    HAS_TIKTOKEN = True
+except ImportError:
+    HAS_TIKTOKEN = False
+
+PAGE_SEPARATOR = '\n'
+CHARS_PER_TOKEN = 4  # Fallback estimate when tiktoken is unavailable
+
+
+class Document:
+    """
+    Lazily extracted document with page and section offsets
+
+    BACKWARD COMPATIBLE: Supports the dict-style access of the old processor
+    results (doc['text'], doc.get('type'), ...). 'text' is only concatenated
+    when it is actually requested.
+    """
+
+    def __init__(self, name: str, doc_type: str, page_count: int,
+                 page_loader: Callable[[int], str],
+                 sections: Optional[List[Tuple[str, int]]] = None,
+                 fields: Optional[Dict[str, Any]] = None,
+                 lazy_fields: Optional[Dict[str, Callable[[], Any]]] = None,
+                 on_close: Optional[Callable[[], None]] = None,
+                 page_separator: str = PAGE_SEPARATOR):
+        """
+        Args:
+            name: Original file name
+            doc_type: File type (pdf, docx, xlsx, txt, ...)
+            page_count: Number of pages (or sheets/sections)
+            page_loader: Callable returning the text of page i
+            sections: (title, start_page) pairs, e.g. from a PDF outline
+            fields: Legacy result fields available immediately
+            lazy_fields: Legacy result fields computed on first access
+            on_close: Callback releasing the underlying file handle
+            page_separator: String joining pages in 'text' and its offsets
+        """
+        self.name = name
+        self.type = doc_type
+        self.page_count = page_count
+        self.sections = sections or []
+        self._page_loader = page_loader
+        self._pages: Dict[int, str] = {}
+        self._fields = dict(fields or {})
+        self._lazy_fields = dict(lazy_fields or {})
+        self._on_close = on_close
+        self.page_separator = page_separator
+
+    # ===== PAGE ACCESS =====
+
+    def page(self, index: int) -> str:
+        """Get text of a single page (0-based), extracting it if needed"""
+        if index < 0:
+            index += self.page_count
+        if not 0 <= index < self.page_count:
+            raise IndexError(f"Page {index} out of range for {self.page_count}-page document")
+
+        if index not in self._pages:
+            self._pages[index] = self._page_loader(index) or ''
+            if len(self._pages) == self.page_count:
+                # Every page is cached: the file handle is no longer needed
+                self.close()
+        return self._pages[index]
+
+    def iter_pages(self, start: int = 0, stop: Optional[int] = None) -> Iterator[str]:
+        """Yield page texts one at a time without concatenating them"""
+        stop = self.page_count if stop is None else min(stop, self.page_count)
+        for index in range(start, stop):
+            yield self.page(index)
+
+    def __iter__(self) -> Iterator[str]:
+        return self.iter_pages()
+
+    def __len__(self) -> int:
+        return self.page_count
+
+    @property
+    def extracted_pages(self) -> int:
+        """Number of pages extracted so far"""
+        return len(self._pages)
+
+    # ===== OFFSETS =====
+
+    def page_offset(self, index: int) -> int:
+        """Character offset of a page in the concatenated text"""
+        offset = 0
+        for page_text in self.iter_pages(stop=index):
+            offset += len(page_text) + len(self.page_separator)
+        return offset
+
+    def page_at_offset(self, offset: int) -> int:
+        """Page containing a character offset of the concatenated text"""
+        position = 0
+        for index, page_text in enumerate(self.iter_pages()):
+            position += len(page_text) + len(self.page_separator)
+            if offset < position:
+                return index
+        return max(self.page_count - 1, 0)
+
+    def section_pages(self, title: str) -> Optional[Tuple[int, int]]:
+        """Page range [start, stop) of the first section matching a title"""
+        title_lower = title.lower()
+        for idx, (section_title, start) in enumerate(self.sections):
+            if title_lower in section_title.lower():
+                stop = self.page_count
+                for _, next_start in self.sections[idx + 1:]:
+                    if next_start > start:
+                        stop = next_start
+                        break
+                return start, stop
+        return None
+
+    def section_text(self, title: str) -> str:
+        """Text of the first section matching a title"""
+        page_range = self.section_pages(title)
+        if page_range is None:
+            return ''
+        return self.page_separator.join(self.iter_pages(*page_range))
+
+    # ===== PREFIXES =====
+
+    def head(self, max_chars: int) -> str:
+        """First max_chars characters, extracting only the pages needed"""
+        parts = []
+        remaining = max_chars
+        for page_text in self.iter_pages():
+            if remaining <= 0:
+                break
+            if parts:
+                parts.append(self.page_separator)
+                remaining -= len(self.page_separator)
+            parts.append(page_text[:max(remaining, 0)])
+            remaining -= len(page_text)
+        return ''.join(parts)[:max_chars]
+
+    def head_tokens(self, max_tokens: int, encoding: str = 'cl100k_base') -> str:
+        """First max_tokens tokens, extracting only the pages needed"""
+        if not HAS_TIKTOKEN:
+            return self.head(max_tokens * CHARS_PER_TOKEN)
+
+        encoder = tiktoken.get_encoding(encoding)
+        tokens: List[int] = []
+        for idx, page_text in enumerate(self.iter_pages()):
+            if idx:
+                page_text = self.page_separator + page_text
+            tokens.extend(encoder.encode(page_text))
+            if len(tokens) >= max_tokens:
+                break
+        return encoder.decode(tokens[:max_tokens])
+
+    @property
+    def text(self) -> str:
+        """Full concatenated text (forces extraction of every page)"""
+        return self.page_separator.join(self.iter_pages())
+
+    # ===== LEGACY DICT INTERFACE =====
+
+    def __getitem__(self, key: str) -> Any:
+        if key == 'text':
+            return self.text
+        if key == 'type':
+            return self.type
+        if key not in self._fields and key in self._lazy_fields:
+            self._fields[key] = self._lazy_fields.pop(key)()
+        return self._fields[key]
+
+    def get(self, key: str, default: Any = None) -> Any:
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key: str) -> bool:
+        return key in ('text', 'type') or key in self._fields or key in self._lazy_fields
+
+    def keys(self) -> List[str]:
+        return ['text', 'type'] + list(self._fields) + list(self._lazy_fields)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialise the legacy result dict (forces full extraction)"""
+        return {key: self[key] for key in self.keys()}
+
+    # ===== LIFECYCLE =====
+
+    def close(self):
+        """Release the underlying file handle"""
+        if self._on_close:
+            self._on_close()
+            self._on_close = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"Document(name={self.name!r}, type={self.type!r}, pages={self.page_count}, "
+                f"extracted={self.extracted_pages})")
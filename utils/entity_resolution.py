@@ -0,0 +1,179 @@
+"""
+Entity Resolution - Match deals that refer to the same company
+Names are normalised (case, punctuation, legal suffixes) and websites reduced
+to their registrable host. Candidates are blocked with a character n-gram
+inverted index, so each record is compared only with names sharing n-grams
+with it instead of with every other record, and scored by n-gram Dice
+similarity. Prefix filtering collects candidates from only the rarest grams
+a match must share; the other grams then prune, with set operations, the
+candidates that miss more of them than a match can, so only a handful of
+names is scored.
+
+Names built from a few common words share every gram with thousands of
+others, so no gram blocks them well. Each lookup therefore collects from at
+most a fixed budget of posting entries, keeping resolution linear in the
+number of names; lookups that exhaust it are counted in `truncated_lookups`,
+as they may miss a match (see benchmarks/entity_benchmark.py).
+"""
+import math
+import re
+from typing import Dict, List, Optional, Set, Tuple
+from urllib.parse import urlsplit
+
+from config.constants import ENTITY_CANDIDATE_BUDGET, ENTITY_MATCH_THRESHOLD
+
+LEGAL_SUFFIXES = {
+    'inc', 'incorporated', 'llc', 'ltd', 'limited', 'plc', 'corp', 'corporation', 'co',
+    'company', 'gmbh', 'ag', 'sa', 'sas', 'bv', 'nv', 'pte', 'pty', 'fze', 'fzco', 'wll', 'spc'
+}
+# Hosts shared by many companies (profiles, app stores, site builders) never identify one
+SHARED_HOSTS = {
+    'linkedin.com', 'facebook.com', 'twitter.com', 'x.com', 'instagram.com', 'medium.com',
+    'github.com', 'crunchbase.com', 'angel.co', 'wellfound.com', 'google.com', 'apple.com',
+    'notion.site', 'wixsite.com', 'squarespace.com', 'substack.com'
+}
+
+NON_ALPHANUMERIC = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: str) -> str:
+    """'BlockChain Hub Ltd.' -> 'blockchain hub'"""
+    words = NON_ALPHANUMERIC.sub(' ', (name or '').lower()).split()
+    while len(words) > 1 and words[-1] in LEGAL_SUFFIXES:
+        words.pop()
+    return ' '.join(words)
+
+
+def normalize_domain(website: str) -> str:
+    """'https://www.BlockHub.io/about' -> 'blockhub.io' ('' for shared or missing hosts)"""
+    website = (website or '').strip().lower()
+    if not website:
+        return ''
+    host = urlsplit(website if '//' in website else '//' + website).hostname or ''
+    if host.startswith('www.'):
+        host = host[4:]
+    return '' if host in SHARED_HOSTS else host
+
+
+def _ngrams(text: str, size: int) -> Set[str]:
+    # Spaces are dropped so 'Block Chain' and 'Blockchain' share every gram
+    padded = f" {text.replace(' ', '')} "
+    return {padded[i:i + size] for i in range(max(len(padded) - size + 1, 1))}
+
+
+class EntityResolver:
+    """
+    Incremental entity index
+
+    add() returns the entity id of a record, creating a new entity when no
+    indexed name or website matches. A shared website is conclusive; otherwise
+    the best name above the Dice threshold wins.
+    """
+
+    def __init__(self, threshold: float = ENTITY_MATCH_THRESHOLD, ngram_size: int = 3,
+                 candidate_budget: Optional[int] = ENTITY_CANDIDATE_BUDGET):
+        self.threshold = threshold
+        self.ngram_size = ngram_size
+        self.candidate_budget = candidate_budget
+
+        self.entity_count = 0
+        self.truncated_lookups = 0
+        self._name_ids: Dict[str, int] = {}  # normalised name -> name id
+        self._name_entity: List[int] = []
+        self._name_grams: List[Set[str]] = []
+        self._postings: Dict[str, Set[int]] = {}  # n-gram -> name ids
+        self._domains: Dict[str, int] = {}  # normalised domain -> entity id
+
+    def _match_name(self, name: str) -> Optional[Tuple[int, float]]:
+        if name in self._name_ids:
+            return self._name_entity[self._name_ids[name]], 1.0
+
+        grams = _ngrams(name, self.ngram_size)
+        # Dice >= t needs at least t|A|/(2-t) shared grams, so a match misses at
+        # most the rest of A's grams: it is in one of the misses + 1 rarest
+        # postings, and every later probe it misses uses up one of its misses
+        min_shared = math.ceil(self.threshold * len(grams) / (2 - self.threshold))
+        misses = len(grams) - min_shared
+        probes = sorted(grams, key=lambda gram: len(self._postings.get(gram, ())))
+
+        missed = [set() for _ in range(misses + 1)]  # names that missed `count` probes so far
+        seen = set()
+        budget = self.candidate_budget
+        truncated = False
+        for index, gram in enumerate(probes):
+            posting = self._postings.get(gram, set())
+            for count in range(min(index, misses), -1, -1):
+                kept = missed[count] & posting
+                if count < misses:
+                    missed[count + 1] |= missed[count] - kept
+                missed[count] = kept
+
+            if index <= misses:
+                # Out of budget, the lookup only prunes the names it already found
+                truncated = truncated or (budget is not None and len(posting) > budget)
+                if not truncated:
+                    new = posting - seen
+                    missed[index] |= new
+                    seen |= new
+                    if budget is not None:
+                        budget -= len(posting)
+            elif not any(missed):
+                break
+        if truncated:
+            self.truncated_lookups += 1
+        candidates = set().union(*missed)
+
+        # Dice >= t also bounds the size ratio of the two gram sets
+        min_size = self.threshold * len(grams) / (2 - self.threshold)
+        max_size = len(grams) * (2 - self.threshold) / self.threshold
+
+        best = None
+        for name_id in candidates:
+            other = self._name_grams[name_id]
+            if not min_size <= len(other) <= max_size:
+                continue
+            score = 2 * len(grams & other) / (len(grams) + len(other))
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (self._name_entity[name_id], score)
+        return best
+
+    def match(self, name: str, website: str = '') -> Optional[Tuple[int, float]]:
+        """(entity id, score) of the best match for a record, if any"""
+        domain = normalize_domain(website)
+        if domain and domain in self._domains:
+            return self._domains[domain], 1.0
+        normalized = normalize_name(name)
+        return self._match_name(normalized) if normalized else None
+
+    def add(self, name: str, website: str = '') -> int:
+        """Entity id for a record, indexing its name and website"""
+        match = self.match(name, website)
+        if match:
+            entity = match[0]
+        else:
+            entity = self.entity_count
+            self.entity_count += 1
+
+        domain = normalize_domain(website)
+        if domain:
+            self._domains.setdefault(domain, entity)
+
+        normalized = normalize_name(name)
+        if normalized and normalized not in self._name_ids:
+            name_id = len(self._name_entity)
+            grams = _ngrams(normalized, self.ngram_size)
+            self._name_ids[normalized] = name_id
+            self._name_entity.append(entity)
+            self._name_grams.append(grams)
+            for gram in grams:
+                self._postings.setdefault(gram, set()).add(name_id)
+        return entity
+
+    def resolve(self, records: List[Dict], name_key: str = 'company',
+                website_key: str = 'website') -> List[List[Dict]]:
+        """Group records by entity, in order of first appearance"""
+        clusters: Dict[int, List[Dict]] = {}
+        for record in records:
+            entity = self.add(record.get(name_key, ''), record.get(website_key, ''))
+            clusters.setdefault(entity, []).append(record)
+        return list(clusters.values())
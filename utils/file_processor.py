@@ -1,152 +1,379 @@
 """
-File processing utilities for PDF, DOCX, and XLSX files
+File processing utilities for PDF, DOCX, XLSX, and CSV files
+Processors return lazy, page-indexed Document objects
 """
 
 import io
 import fitz  # PyMuPDF
 import docx
+import PyPDF2
 import openpyxl
 import pandas as pd
+import numpy as np
 from typing import Dict, List, Any, Optional
 import streamlit as st
+from .document import Document
+from config.constants import PDF_ENGINE, CSV_CHUNK_ROWS, CSV_SAMPLE_ROWS, CSV_TOP_VALUES_KEPT
 
 class FileProcessor:
     """Handle document processing for various file types"""
     
     @staticmethod
-    def process_pdf(file) -> Dict[str, Any]:
-        """Extract text and metadata from PDF files"""
+    def process_pdf(file, engine: str = PDF_ENGINE) -> Optional[Document]:
+        """
+        Open a PDF lazily; page text is extracted on demand
+        
+        The Document owns the open PDF: it is closed once every page has been
+        extracted, otherwise call close() (or use a with block).
+        
+        Args:
+            file: PDF file object
+            engine: 'pymupdf' (fast, default) or 'pypdf2'
+        """
         try:
             # Read PDF
             pdf_bytes = file.read()
-            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
             
-            # Extract text from all pages
-            text_content = []
-            for page_num in range(pdf_document.page_count):
-                page = pdf_document[page_num]
-                text_content.append(page.get_text())
+            if engine == 'pypdf2':
+                stream = io.BytesIO(pdf_bytes)
+                pdf_reader = PyPDF2.PdfReader(stream)
+                return Document(
+                    name=getattr(file, 'name', ''),
+                    doc_type='pdf',
+                    page_count=len(pdf_reader.pages),
+                    page_loader=lambda index: pdf_reader.pages[index].extract_text(),
+                    fields={
+                        'pages': len(pdf_reader.pages),
+                        'metadata': dict(pdf_reader.metadata or {})
+                    },
+                    on_close=stream.close
+                )
             
-            # Extract metadata
-            metadata = pdf_document.metadata
+            pdf_document = fitz.open(stream=pdf_bytes, filetype="pdf")
             
-            result = {
-                'text': '\n'.join(text_content),
-                'pages': pdf_document.page_count,
-                'metadata': metadata,
-                'type': 'pdf'
-            }
+            # Outline entries are (level, title, 1-based page)
+            sections = [(title, page - 1) for _, title, page in pdf_document.get_toc() if page >= 1]
             
-            pdf_document.close()
-            return result
+            return Document(
+                name=getattr(file, 'name', ''),
+                doc_type='pdf',
+                page_count=pdf_document.page_count,
+                page_loader=lambda index: pdf_document[index].get_text(),
+                sections=sections,
+                fields={
+                    'pages': pdf_document.page_count,
+                    'metadata': pdf_document.metadata
+                },
+                on_close=pdf_document.close
+            )
             
         except Exception as e:
             st.error(f"Error processing PDF: {str(e)}")
             return None
     
     @staticmethod
-    def process_docx(file) -> Dict[str, Any]:
-        """Extract text from DOCX files"""
+    def process_docx(file) -> Optional[Document]:
+        """Extract text from DOCX files, paged by heading sections"""
         try:
             doc = docx.Document(file)
             
-            # Extract paragraphs
-            paragraphs = [para.text for para in doc.paragraphs if para.text.strip()]
-            
-            # Extract tables
-            tables = []
-            for table in doc.tables:
-                table_data = []
-                for row in table.rows:
-                    row_data = [cell.text for cell in row.cells]
-                    table_data.append(row_data)
-                tables.append(table_data)
-            
-            result = {
-                'text': '\n'.join(paragraphs),
-                'paragraphs': paragraphs,
-                'tables': tables,
-                'num_tables': len(tables),
-                'type': 'docx'
-            }
+            # Extract paragraphs, starting a new section at every heading
+            paragraphs = []
+            section_paragraphs = [[]]
+            sections = []
+            for para in doc.paragraphs:
+                if not para.text.strip():
+                    continue
+                style_name = para.style.name if para.style is not None else ''
+                if style_name.startswith(('Heading', 'Title')):
+                    if section_paragraphs[-1]:
+                        section_paragraphs.append([])
+                    sections.append((para.text.strip(), len(section_paragraphs) - 1))
+                paragraphs.append(para.text)
+                section_paragraphs[-1].append(para.text)
+            
+            def extract_tables():
+                tables = []
+                for table in doc.tables:
+                    table_data = []
+                    for row in table.rows:
+                        row_data = [cell.text for cell in row.cells]
+                        table_data.append(row_data)
+                    tables.append(table_data)
+                return tables
             
-            return result
+            return Document(
+                name=getattr(file, 'name', ''),
+                doc_type='docx',
+                page_count=len(section_paragraphs) if paragraphs else 0,
+                page_loader=lambda index: '\n'.join(section_paragraphs[index]),
+                sections=sections,
+                fields={
+                    'paragraphs': paragraphs,
+                    'num_tables': len(doc.tables)
+                },
+                lazy_fields={'tables': extract_tables}
+            )
             
         except Exception as e:
             st.error(f"Error processing DOCX: {str(e)}")
             return None
     
     @staticmethod
-    def process_xlsx(file) -> Dict[str, Any]:
-        """Extract data from Excel files"""
+    def process_xlsx(file) -> Optional[Document]:
+        """Open an Excel workbook lazily; one page per sheet"""
         try:
-            # Read all sheets
             excel_file = pd.ExcelFile(file)
+            sheet_names = excel_file.sheet_names
             sheets_data = {}
             
-            for sheet_name in excel_file.sheet_names:
-                df = pd.read_excel(file, sheet_name=sheet_name)
-                sheets_data[sheet_name] = df
+            def load_sheet(sheet_name: str) -> pd.DataFrame:
+                if sheet_name not in sheets_data:
+                    sheets_data[sheet_name] = excel_file.parse(sheet_name=sheet_name)
+                return sheets_data[sheet_name]
             
-            # Generate summary
-            summary = {
-                'num_sheets': len(excel_file.sheet_names),
-                'sheet_names': excel_file.sheet_names,
-                'sheets_data': sheets_data
-            }
+            def load_all_sheets() -> Dict[str, pd.DataFrame]:
+                return {sheet_name: load_sheet(sheet_name) for sheet_name in sheet_names}
             
             # Convert to text representation
-            text_parts = []
-            for sheet_name, df in sheets_data.items():
-                text_parts.append(f"\n=== Sheet: {sheet_name} ===\n")
-                text_parts.append(df.to_string())
-            
-            result = {
-                'text': '\n'.join(text_parts),
-                'summary': summary,
-                'dataframes': sheets_data,
-                'type': 'xlsx'
-            }
+            def sheet_text(index: int) -> str:
+                sheet_name = sheet_names[index]
+                return f"\n=== Sheet: {sheet_name} ===\n\n{load_sheet(sheet_name).to_string()}"
             
-            return result
+            return Document(
+                name=getattr(file, 'name', ''),
+                doc_type='xlsx',
+                page_count=len(sheet_names),
+                page_loader=sheet_text,
+                sections=[(sheet_name, idx) for idx, sheet_name in enumerate(sheet_names)],
+                lazy_fields={
+                    'summary': lambda: {
+                        'num_sheets': len(sheet_names),
+                        'sheet_names': sheet_names,
+                        'sheets_data': load_all_sheets()
+                    },
+                    'dataframes': load_all_sheets
+                }
+            )
             
         except Exception as e:
             st.error(f"Error processing XLSX: {str(e)}")
             return None
     
     @staticmethod
-    def process_txt(file) -> Dict[str, Any]:
-        """Extract text from TXT files"""
+    def process_csv(file, usecols: Optional[List[str]] = None,
+                    chunk_rows: int = CSV_CHUNK_ROWS) -> Optional[Document]:
+        """
+        Summarise CSV files in chunks without loading them fully
+        
+        Args:
+            file: CSV file object
+            usecols: Columns to keep (all by default)
+            chunk_rows: Rows read per chunk
+        
+        Returns:
+            Document with a compact numeric summary page and a sample page
+        """
         try:
-            text = file.read().decode('utf-8')
+            reader = pd.read_csv(file, usecols=usecols, chunksize=chunk_rows, low_memory=True)
+            
+            total_rows = 0
+            sample = None
+            stats = {}
+            top_values = {}
+            text_in_numeric = {}  # Numeric column -> counts of values that are not numbers
+            non_null = {}
+            
+            def tally(counts: Dict[str, int], values: pd.Series) -> Dict[str, int]:
+                """Add a chunk's value counts, keeping the CSV_TOP_VALUES_KEPT most frequent"""
+                for value, count in values.astype(str).value_counts().head(CSV_TOP_VALUES_KEPT).items():
+                    counts[value] = counts.get(value, 0) + int(count)
+                if len(counts) > CSV_TOP_VALUES_KEPT:
+                    counts = dict(sorted(counts.items(), key=lambda item: -item[1])[:CSV_TOP_VALUES_KEPT])
+                return counts
+            
+            for chunk in reader:
+                if sample is None:
+                    sample = chunk.head(CSV_SAMPLE_ROWS)
+                    non_null = {col: 0 for col in chunk.columns}
+                
+                total_rows += len(chunk)
+                
+                # A column's type is inferred from the first chunk where it has values
+                for col in chunk.columns:
+                    if col not in stats and col not in top_values and chunk[col].notna().any():
+                        if pd.api.types.is_numeric_dtype(chunk[col]):
+                            stats[col] = {'count': 0, 'sum': 0.0, 'mean': 0.0, 'm2': 0.0,
+                                          'min': np.inf, 'max': -np.inf, 'non_numeric': 0}
+                        else:
+                            top_values[col] = {}
+                
+                for col, col_stats in stats.items():
+                    numbers = pd.to_numeric(chunk[col], errors='coerce')
+                    if not pd.api.types.is_numeric_dtype(chunk[col]):
+                        # Text in a column typed numeric by an earlier chunk is counted, not dropped
+                        text = chunk[col][chunk[col].notna() & numbers.isna()]
+                        if len(text):
+                            col_stats['non_numeric'] += len(text)
+                            non_null[col] += len(text)
+                            text_in_numeric[col] = tally(text_in_numeric.get(col, {}), text)
+                    values = numbers.to_numpy(dtype=np.float64)
+                    values = values[~np.isnan(values)]
+                    if values.size:
+                        # Merge the chunk's mean and squared deviations (Chan et al.),
+                        # which stays accurate where sum_sq / n - mean^2 cancels
+                        count, mean = int(values.size), float(values.mean())
+                        total = col_stats['count'] + count
+                        delta = mean - col_stats['mean']
+                        col_stats['m2'] += (float(np.square(values - mean).sum())
+                                            + delta ** 2 * col_stats['count'] * count / total)
+                        col_stats['mean'] += delta * count / total
+                        col_stats['count'] = total
+                        col_stats['sum'] += float(values.sum())
+                        col_stats['min'] = min(col_stats['min'], values.min())
+                        col_stats['max'] = max(col_stats['max'], values.max())
+                    non_null[col] += int(values.size)
+                
+                for col, counts in top_values.items():
+                    values = chunk[col].dropna()
+                    non_null[col] += len(values)
+                    top_values[col] = tally(counts, values)
+            
+            # Prune columns that are empty in every chunk
+            columns = [col for col, count in non_null.items() if count]
+            non_null = {col: non_null[col] for col in columns}
+            sample = sample[columns] if sample is not None else pd.DataFrame()
+            
+            numeric_summary = {}
+            for col, col_stats in stats.items():
+                count = col_stats['count']
+                if not count:
+                    # Not a single number after all: report it as categorical
+                    if col in text_in_numeric:
+                        top_values[col] = text_in_numeric[col]
+                    continue
+                numeric_summary[col] = {
+                    'count': count,
+                    'mean': col_stats['mean'],
+                    'std': float(np.sqrt(col_stats['m2'] / count)),
+                    'min': float(col_stats['min']),
+                    'max': float(col_stats['max']),
+                    'sum': col_stats['sum'],
+                    'non_numeric': col_stats['non_numeric']
+                }
+                if col in text_in_numeric:
+                    numeric_summary[col]['non_numeric_values'] = dict(
+                        sorted(text_in_numeric[col].items(), key=lambda item: -item[1])[:5])
+            
+            categorical_summary = {
+                col: dict(sorted(counts.items(), key=lambda item: -item[1])[:5])
+                for col, counts in top_values.items()
+            }
             
-            result = {
-                'text': text,
-                'lines': text.split('\n'),
-                'type': 'txt'
+            summary = {
+                'rows': total_rows,
+                'columns': columns,
+                'numeric_columns': list(numeric_summary),
+                'non_null': non_null,
+                'numeric_summary': numeric_summary,
+                'top_values': categorical_summary
             }
             
-            return result
+            # Compact text for LLM prompts
+            summary_lines = [f"=== CSV Summary: {total_rows:,} rows x {len(columns)} columns ==="]
+            if numeric_summary:
+                summary_lines.append("\nNumeric columns (count, mean, std, min, max):")
+                for col, col_stats in numeric_summary.items():
+                    line = (f"- {col}: {col_stats['count']:,}, {col_stats['mean']:,.2f}, {col_stats['std']:,.2f}, "
+                            f"{col_stats['min']:,.2f}, {col_stats['max']:,.2f}")
+                    if col_stats['non_numeric']:
+                        values = ', '.join(f"{value} ({count:,})"
+                                           for value, count in col_stats['non_numeric_values'].items())
+                        line += f"; {col_stats['non_numeric']:,} non-numeric: {values}"
+                    summary_lines.append(line)
+            if categorical_summary:
+                summary_lines.append("\nCategorical columns (top values):")
+                for col, counts in categorical_summary.items():
+                    values = ', '.join(f"{value} ({count:,})" for value, count in counts.items())
+                    summary_lines.append(f"- {col}: {values}")
+            
+            pages = [
+                '\n'.join(summary_lines),
+                f"\n=== Sample ({len(sample)} rows) ===\n\n{sample.to_string(max_colwidth=40)}"
+            ]
+            
+            return Document(
+                name=getattr(file, 'name', ''),
+                doc_type='csv',
+                page_count=len(pages),
+                page_loader=lambda index: pages[index],
+                sections=[('Summary', 0), ('Sample', 1)],
+                fields={
+                    'summary': summary,
+                    'sample': sample,
+                    'rows': total_rows
+                }
+            )
+            
+        except Exception as e:
+            st.error(f"Error processing CSV: {str(e)}")
+            return None
+    
+    @staticmethod
+    def process_txt(file) -> Optional[Document]:
+        """Extract text from TXT files, paged on form feeds ('text' is the file unchanged)"""
+        try:
+            text = file.read().decode('utf-8')
+            pages = text.split('\f')
+            
+            return Document(
+                name=getattr(file, 'name', ''),
+                doc_type='txt',
+                page_count=len(pages),
+                page_loader=lambda index: pages[index],
+                lazy_fields={'lines': lambda: text.split('\n')},
+                page_separator='\f'
+            )
             
         except Exception as e:
             st.error(f"Error processing TXT: {str(e)}")
             return None
     
     @classmethod
-    def process_file(cls, file) -> Optional[Dict[str, Any]]:
-        """Process file based on extension"""
-        file_extension = file.name.split('.')[-1].lower()
-        
-        processors = {
+    def _processors(cls) -> Dict[str, Any]:
+        """Map file extensions to processor functions"""
+        return {
             'pdf': cls.process_pdf,
             'docx': cls.process_docx,
             'xlsx': cls.process_xlsx,
+            'csv': cls.process_csv,
             'txt': cls.process_txt
         }
+    
+    @classmethod
+    def supported_extensions(cls) -> List[str]:
+        """File extensions with a processor"""
+        return list(cls._processors())
+    
+    @classmethod
+    def process_file(cls, file, **options) -> Optional[Document]:
+        """
+        Process file based on extension
+        
+        Args:
+            file: Uploaded file object (its name decides the processor)
+            **options: Passed to the processor, e.g. usecols/chunk_rows for
+                CSV or engine for PDF
+        
+        Returns:
+            Lazy Document; pages are extracted on first access and the
+            legacy dict keys ('text', 'type', ...) are still supported
+        """
+        file_extension = file.name.split('.')[-1].lower()
         
-        processor = processors.get(file_extension)
+        processor = cls._processors().get(file_extension)
         if processor:
-            return processor(file)
+            return processor(file, **options)
         else:
             st.error(f"Unsupported file type: {file_extension}")
             return None
@@ -0,0 +1,151 @@
+"""
+HTTP Cache - On-disk response cache with conditional revalidation
+Stores bodies with their ETag/Last-Modified validators; stale entries are
+revalidated with conditional GETs so unchanged pages cost a 304, not a download.
+The cache is bounded in bytes and entries: the least recently used responses
+(file mtime, touched on every hit) are evicted first.
+"""
+import hashlib
+import json
+import logging
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from config.constants import HTTP_CACHE_DIR, HTTP_CACHE_MAX_BYTES, HTTP_CACHE_MAX_ENTRIES
+
+logger = logging.getLogger(__name__)
+
+
+class HTTPCache:
+    """File-per-URL response cache"""
+
+    def __init__(self, cache_dir: str = HTTP_CACHE_DIR, max_bytes: int = HTTP_CACHE_MAX_BYTES,
+                 max_entries: int = HTTP_CACHE_MAX_ENTRIES):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.stats = {'hits': 0, 'revalidated': 0, 'misses': 0, 'stores': 0, 'evictions': 0}
+
+        # path -> size in bytes, least recently used first. Built from the
+        # directory, so files written by other processes count from the next open
+        self._lock = threading.Lock()
+        self._sizes = OrderedDict()
+        self._total_bytes = 0
+        files = [(entry.stat(), entry.path) for entry in os.scandir(cache_dir) if entry.name.endswith('.json')]
+        for stat, path in sorted(files, key=lambda file: file[0].st_mtime):
+            self._sizes[path] = stat.st_size
+            self._total_bytes += stat.st_size
+        with self._lock:
+            self._evict()
+
+    def _path(self, url: str) -> str:
+        return os.path.join(self.cache_dir, hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    # ===== LOOKUP =====
+
+    def get(self, url: str) -> Optional[Dict]:
+        """Stored entry for a URL, fresh or not"""
+        path = self._path(url)
+        try:
+            with open(path, encoding='utf-8') as f:
+                entry = json.load(f)
+        except FileNotFoundError:
+            return None
+        except ValueError as e:
+            logger.warning(f"Discarding corrupt cache entry for {url}: {str(e)}")
+            return None
+
+        # Mark it recently used, on disk too so the order survives restarts
+        with self._lock:
+            if path in self._sizes:
+                self._sizes.move_to_end(path)
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return entry
+
+    @staticmethod
+    def is_fresh(entry: Dict, max_age: float) -> bool:
+        """Whether an entry can be served without revalidation"""
+        return time.time() - entry.get('stored_at', 0) < max_age
+
+    @staticmethod
+    def conditional_headers(entry: Optional[Dict]) -> Dict[str, str]:
+        """Headers turning a GET into a revalidation request"""
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    # ===== STORAGE =====
+
+    def store(self, url: str, status_code: int, body: str, headers) -> Dict:
+        """Store a response body with its validators"""
+        entry = {
+            'url': url,
+            'status_code': status_code,
+            'body': body,
+            'etag': headers.get('ETag'),
+            'last_modified': headers.get('Last-Modified'),
+            'stored_at': time.time()
+        }
+        self._write(entry)
+        self.stats['stores'] += 1
+        return entry
+
+    def refresh(self, entry: Dict, headers=None) -> Dict:
+        """Mark an entry fresh again after a 304 Not Modified"""
+        if headers is not None:
+            entry['etag'] = headers.get('ETag', entry.get('etag'))
+            entry['last_modified'] = headers.get('Last-Modified', entry.get('last_modified'))
+        entry['stored_at'] = time.time()
+        self._write(entry)
+        return entry
+
+    def _write(self, entry: Dict):
+        # Write-then-rename so concurrent readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(entry, f)
+        size = os.path.getsize(tmp_path)
+        path = self._path(entry['url'])
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            self._total_bytes += size - self._sizes.pop(path, 0)
+            self._sizes[path] = size
+            self._evict()
+
+    def _evict(self):
+        # Caller holds self._lock
+        while self._sizes and (len(self._sizes) > self.max_entries or self._total_bytes > self.max_bytes):
+            path, size = self._sizes.popitem(last=False)
+            self._total_bytes -= size
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            self.stats['evictions'] += 1
+
+    def clear(self):
+        """Remove all cached responses"""
+        with self._lock:
+            for name in os.listdir(self.cache_dir):
+                if name.endswith('.json'):
+                    os.remove(os.path.join(self.cache_dir, name))
+            self._sizes.clear()
+            self._total_bytes = 0
+
+    def hit_rate(self) -> float:
+        """Share of lookups served without downloading a body"""
+        lookups = self.stats['hits'] + self.stats['revalidated'] + self.stats['misses']
+        return (self.stats['hits'] + self.stats['revalidated']) / lookups if lookups else 0.0
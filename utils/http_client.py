@@ -0,0 +1,238 @@
+"""
+HTTP Client - Shared, pooled keep-alive connections for all scrapers
+One long-lived httpx client per process (HTTP/2 when h2 is installed),
+driven by a background event loop so connections survive across searches
+and Streamlit reruns instead of paying a TCP+TLS handshake per request.
+Every request passes its domain's token bucket and circuit breaker.
+"""
+import asyncio
+import importlib.util
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Coroutine, Dict, Optional
+from urllib.parse import urlsplit
+
+import httpx
+
+from config.constants import (
+    HTTP_MAX_CONNECTIONS, HTTP_MAX_KEEPALIVE, HTTP_MAX_CONNECTIONS_PER_HOST,
+    HTTP_KEEPALIVE_EXPIRY, REQUEST_TIMEOUT, USER_AGENT
+)
+
+from utils.rate_limiter import DomainGuard, get_domain_guard
+
+logger = logging.getLogger(__name__)
+
+HAS_HTTP2 = importlib.util.find_spec('h2') is not None
+
+
+class HTTPClient:
+    """
+    Connection-pooling HTTP client shared by WebScraper and DealScraper
+
+    Async requests run on a private event loop thread that owns the pool;
+    sync callers use a separate pooled httpx.Client. Per-host concurrency is
+    capped so one slow outlet cannot take every pooled connection.
+    """
+
+    def __init__(self, max_connections: int = HTTP_MAX_CONNECTIONS,
+                 max_keepalive: int = HTTP_MAX_KEEPALIVE,
+                 max_per_host: int = HTTP_MAX_CONNECTIONS_PER_HOST,
+                 keepalive_expiry: float = HTTP_KEEPALIVE_EXPIRY,
+                 http2: bool = True, user_agent: str = USER_AGENT):
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive,
+            keepalive_expiry=keepalive_expiry
+        )
+        self.max_per_host = max_per_host
+        self.http2 = http2 and HAS_HTTP2
+        self.headers = {'User-Agent': user_agent}
+
+        self._lock = threading.Lock()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._async_client: Optional[httpx.AsyncClient] = None
+        self._sync_client: Optional[httpx.Client] = None
+        self._host_slots: Dict[str, asyncio.Semaphore] = {}
+        self._sync_host_slots: Dict[str, threading.BoundedSemaphore] = {}
+
+        self.stats = {'requests': 0, 'connections_opened': 0, 'by_host': {}}
+
+    # ===== EVENT LOOP =====
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        """Background loop owning the async connection pool"""
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name='http-client-loop', daemon=True).start()
+            return self._loop
+
+    def submit(self, coro: Coroutine) -> Future:
+        """Schedule a coroutine on the client loop"""
+        return asyncio.run_coroutine_threadsafe(coro, self.loop)
+
+    def run(self, coro: Coroutine) -> Any:
+        """Run a coroutine on the client loop and wait for its result"""
+        return self.submit(coro).result()
+
+    # ===== STATISTICS =====
+
+    def _host_stats(self, host: str) -> Dict[str, int]:
+        return self.stats['by_host'].setdefault(host, {'requests': 0, 'connections_opened': 0})
+
+    def _record_request(self, host: str):
+        self.stats['requests'] += 1
+        self._host_stats(host)['requests'] += 1
+
+    def _record_connection(self, host: str, event_name: str):
+        if event_name == 'connection.connect_tcp.complete':
+            self.stats['connections_opened'] += 1
+            self._host_stats(host)['connections_opened'] += 1
+
+    @staticmethod
+    def _record_outcome(guard: DomainGuard, response: httpx.Response):
+        """Feed the response status into the domain's limiter and breaker"""
+        if response.status_code == 429:
+            retry_after = response.headers.get('Retry-After', '')
+            guard.bucket.penalize(float(retry_after) if retry_after.isdigit() else 1.0)
+            guard.breaker.record_failure()
+        elif response.status_code >= 500:
+            guard.breaker.record_failure()
+        else:
+            guard.breaker.record_success()
+
+    @staticmethod
+    def _record_error(guard: DomainGuard, error: BaseException, sent: bool):
+        """Settle the breaker for a request that raised instead of returning"""
+        # Timeouts surface as cancellation when the caller's deadline expires;
+        # anything raised before sending, or not caused by the host, only
+        # gives back a half-open probe slot so the domain is not locked out
+        if sent and isinstance(error, (httpx.TransportError, asyncio.CancelledError)):
+            guard.breaker.record_failure()
+        else:
+            guard.breaker.release_probe()
+    
+    def reuse_stats(self) -> Dict[str, Any]:
+        """Requests served on an already open connection, overall and per host"""
+        def summarise(counts: Dict[str, int]) -> Dict[str, Any]:
+            reused = max(counts['requests'] - counts['connections_opened'], 0)
+            return {
+                **counts,
+                'reused': reused,
+                'reuse_rate': round(reused / counts['requests'], 3) if counts['requests'] else 0.0
+            }
+
+        return {
+            **summarise({'requests': self.stats['requests'], 'connections_opened': self.stats['connections_opened']}),
+            'http2': self.http2,
+            'by_host': {host: summarise(counts) for host, counts in self.stats['by_host'].items()}
+        }
+
+    # ===== ASYNC REQUESTS =====
+
+    @property
+    def async_client(self) -> httpx.AsyncClient:
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(
+                headers=self.headers, limits=self.limits, http2=self.http2,
+                timeout=REQUEST_TIMEOUT, follow_redirects=True
+            )
+        return self._async_client
+
+    async def aget(self, url: str, **kwargs) -> httpx.Response:
+        """GET on the shared async pool (must run on the client loop)"""
+        host = urlsplit(url).netloc
+        if host not in self._host_slots:
+            self._host_slots[host] = asyncio.Semaphore(self.max_per_host)
+
+        async def trace(event_name: str, info: Dict):
+            self._record_connection(host, event_name)
+
+        guard = get_domain_guard(host)
+        wait = guard.acquire()
+        sent = False
+        try:
+            if wait:
+                await asyncio.sleep(wait)
+            async with self._host_slots[host]:
+                self._record_request(host)
+                sent = True
+                response = await self.async_client.get(url, extensions={'trace': trace}, **kwargs)
+        except BaseException as error:
+            self._record_error(guard, error, sent)
+            raise
+        
+        self._record_outcome(guard, response)
+        return response
+
+    # ===== SYNC REQUESTS =====
+
+    @property
+    def sync_client(self) -> httpx.Client:
+        with self._lock:
+            if self._sync_client is None:
+                self._sync_client = httpx.Client(
+                    headers=self.headers, limits=self.limits, http2=self.http2,
+                    timeout=REQUEST_TIMEOUT, follow_redirects=True
+                )
+            return self._sync_client
+
+    def get(self, url: str, **kwargs) -> httpx.Response:
+        """GET on the shared sync pool"""
+        host = urlsplit(url).netloc
+
+        def trace(event_name: str, info: Dict):
+            self._record_connection(host, event_name)
+
+        with self._lock:
+            if host not in self._sync_host_slots:
+                self._sync_host_slots[host] = threading.BoundedSemaphore(self.max_per_host)
+            slots = self._sync_host_slots[host]
+
+        guard = get_domain_guard(host)
+        wait = guard.acquire()
+        sent = False
+        try:
+            if wait:
+                time.sleep(wait)
+            with slots:
+                self._record_request(host)
+                sent = True
+                response = self.sync_client.get(url, extensions={'trace': trace}, **kwargs)
+        except BaseException as error:
+            self._record_error(guard, error, sent)
+            raise
+        
+        self._record_outcome(guard, response)
+        return response
+
+    # ===== LIFECYCLE =====
+
+    def close(self):
+        """Close both pools and stop the loop"""
+        if self._async_client is not None and self._loop is not None:
+            self.run(self._async_client.aclose())
+            self._async_client = None
+        if self._sync_client is not None:
+            self._sync_client.close()
+            self._sync_client = None
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._loop = None
+
+
+_shared_client: Optional[HTTPClient] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_client() -> HTTPClient:
+    """Process-wide HTTP client shared by all scrapers"""
+    global _shared_client
+    with _shared_lock:
+        if _shared_client is None:
+            _shared_client = HTTPClient()
+        return _shared_client
@@ -0,0 +1,211 @@
+"""
+Near-Duplicate Detection - MinHash signatures with LSH banding
+Collapses repeated drafts (v1/v2/final of the same agreement) so only one
+copy is parsed into prompts and embeddings, and syndicated wire stories
+repeated across news outlets so reports list each story once
+"""
+import re
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from config.constants import (
+    NEAR_DUPLICATE_THRESHOLD, ARTICLE_DUPLICATE_THRESHOLD, ARTICLE_TITLE_DUPLICATE_THRESHOLD
+)
+
+MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+MAX_HASH = np.uint64((1 << 32) - 1)
+HASH_CHUNK_ROWS = 8192  # Bounds the (shingles x permutations) work matrix
+
+WORD_PATTERN = re.compile(r'\w+')
+
+
+class NearDuplicateDetector:
+    """
+    Streaming near-duplicate index
+
+    Each document is reduced to a MinHash signature over word shingles.
+    Signatures are split into LSH bands so only documents sharing a band
+    bucket are compared, instead of every pair.
+    """
+
+    def __init__(self, threshold: float = NEAR_DUPLICATE_THRESHOLD, num_perm: int = 128,
+                 bands: int = 16, shingle_size: int = 5, seed: int = 1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+
+        self.threshold = threshold
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.shingle_size = shingle_size
+
+        generator = np.random.RandomState(seed)
+        self._a = generator.randint(1, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % MERSENNE_PRIME
+        self._b = generator.randint(0, np.iinfo(np.int64).max, size=num_perm, dtype=np.int64).astype(np.uint64) % MERSENNE_PRIME
+
+        self.signatures: Dict[str, np.ndarray] = {}
+        self._buckets: List[Dict[bytes, List[str]]] = [{} for _ in range(bands)]
+
+    # ===== SIGNATURES =====
+
+    def _shingle_hashes(self, text: str) -> np.ndarray:
+        """32-bit hashes of the distinct word shingles of a text"""
+        words = WORD_PATTERN.findall(text.lower())
+        if not words:
+            return np.empty(0, dtype=np.uint64)
+
+        k = min(self.shingle_size, len(words))
+        shingles = {' '.join(words[i:i + k]) for i in range(len(words) - k + 1)}
+        return np.fromiter((zlib.crc32(s.encode('utf-8')) for s in shingles),
+                           dtype=np.uint64, count=len(shingles))
+
+    def signature(self, text: str) -> Optional[np.ndarray]:
+        """MinHash signature of a text (None for empty text)"""
+        hashes = self._shingle_hashes(text)
+        if hashes.size == 0:
+            return None
+
+        signature = np.full(self.num_perm, MAX_HASH, dtype=np.uint64)
+        for start in range(0, hashes.size, HASH_CHUNK_ROWS):
+            chunk = hashes[start:start + HASH_CHUNK_ROWS, None]
+            permuted = ((chunk * self._a + self._b) % MERSENNE_PRIME) & MAX_HASH
+            np.minimum(signature, permuted.min(axis=0), out=signature)
+        return signature
+
+    @staticmethod
+    def similarity(first: np.ndarray, second: np.ndarray) -> float:
+        """Estimated Jaccard similarity of two signatures"""
+        return float(np.mean(first == second))
+
+    # ===== INDEX =====
+
+    def _band_keys(self, signature: np.ndarray) -> List[bytes]:
+        return [signature[band * self.rows:(band + 1) * self.rows].tobytes()
+                for band in range(self.bands)]
+
+    def query(self, signature: np.ndarray) -> Optional[Tuple[str, float]]:
+        """Most similar indexed document above the threshold, if any"""
+        candidates = set()
+        for band, key in enumerate(self._band_keys(signature)):
+            candidates.update(self._buckets[band].get(key, ()))
+
+        best = None
+        for candidate in candidates:
+            score = self.similarity(signature, self.signatures[candidate])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (candidate, score)
+        return best
+
+    def add(self, key: str, text: Optional[str] = None,
+            signature: Optional[np.ndarray] = None) -> Optional[str]:
+        """
+        Index a document unless it near-duplicates one already indexed
+
+        Args:
+            key: Document identifier
+            text: Document text (ignored when a signature is given)
+            signature: Precomputed MinHash signature
+
+        Returns:
+            Key of the indexed document it duplicates, or None if it was added
+        """
+        if signature is None:
+            signature = self.signature(text or '')
+        if signature is None:
+            return None
+
+        signature = np.asarray(signature, dtype=np.uint64)
+        match = self.query(signature)
+        if match:
+            return match[0]
+
+        self.signatures[key] = signature
+        for band, band_key in enumerate(self._band_keys(signature)):
+            self._buckets[band].setdefault(band_key, []).append(key)
+        return None
+
+    def deduplicate(self, documents: Dict[str, str]) -> Tuple[List[str], Dict[str, str]]:
+        """
+        Collapse duplicates and near-duplicates in a batch
+
+        The longest copy of each cluster is kept, as it is usually the
+        most complete draft.
+
+        Returns:
+            (keys to keep in original order, {duplicate key: kept key})
+        """
+        duplicate_of = {}
+        for key in sorted(documents, key=lambda k: len(documents[k]), reverse=True):
+            match = self.add(key, documents[key])
+            if match:
+                duplicate_of[key] = match
+
+        unique = [key for key in documents if key not in duplicate_of]
+        return unique, duplicate_of
+
+
+def _article_text(article: Dict) -> str:
+    return f"{article.get('title', '')} {article.get('summary', '')}"
+
+
+def deduplicate_articles(results: Dict[str, List[Dict]],
+                         threshold: float = ARTICLE_DUPLICATE_THRESHOLD,
+                         title_threshold: float = ARTICLE_TITLE_DUPLICATE_THRESHOLD) -> Dict[str, List[Dict]]:
+    """
+    Collapse the same story reported by several outlets
+
+    The headline identifies the story: it is compared on word bigrams, so a
+    single changed word ("profit rises" / "profit falls") breaks two shingles
+    and keeps opposite stories apart, while outlets that rewrite only the
+    summary still merge. Articles without a headline fall back to their
+    summary words. Narrow LSH bands let near-identical copies still collide.
+    The article with the most text in each cluster is kept and lists the
+    other outlets under 'also_in'.
+
+    Args:
+        results: {source: articles} as returned by WebScraper
+        threshold: Estimated Jaccard similarity of summary words (untitled articles)
+        title_threshold: Estimated Jaccard similarity of headline bigrams
+
+    Returns:
+        {source: articles} in the original order, without duplicates
+    """
+    titles = NearDuplicateDetector(title_threshold, bands=32, shingle_size=2)
+    texts = NearDuplicateDetector(threshold, bands=32, shingle_size=1)
+
+    flat = [(source, article) for source, articles in results.items() for article in articles or []]
+    also_in: Dict[str, List[str]] = {}
+    duplicates = set()
+
+    for index in sorted(range(len(flat)), key=lambda i: len(_article_text(flat[i][1])), reverse=True):
+        source, article = flat[index]
+        key = str(index)
+        title_signature = titles.signature(article.get('title', ''))
+        text_signature = texts.signature(_article_text(article))
+
+        # A shared summary never merges two different headlines
+        if title_signature is not None:
+            match = titles.query(title_signature)
+        else:
+            match = text_signature is not None and texts.query(text_signature)
+        if match:
+            duplicates.add(index)
+            outlets = also_in.setdefault(match[0], [])
+            if source != flat[int(match[0])][0] and source not in outlets:
+                outlets.append(source)
+            continue
+
+        titles.add(key, signature=title_signature)
+        texts.add(key, signature=text_signature)
+
+    order = list(results)
+    deduplicated = {source: [] for source in results}
+    for index, (source, article) in enumerate(flat):
+        if index in duplicates:
+            continue
+        if also_in.get(str(index)):
+            article = {**article, 'also_in': sorted(also_in[str(index)], key=order.index)}
+        deduplicated[source].append(article)
+    return deduplicated
@@ -0,0 +1,163 @@
+"""
+News Crawler - Background refresh of news for watchlist companies
+Periodically runs WebScraper searches for portfolio and pipeline companies
+so their articles are already in the NewsIndex and HTTP cache when an
+analyst opens the market page. Companies are crawled one at a time with
+jittered spacing; each outlet sees at most one request per company and
+the shared per-domain limiters and circuit breakers still apply.
+
+Watchlist file (JSON):
+    [{"company": "Baladna", "industry": "Food & Beverage"}, ...]
+
+Usage:
+    python -m utils.news_crawler --watchlist data/watchlist.json
+    python -m utils.news_crawler --company "Baladna" "Food & Beverage" --once
+"""
+import argparse
+import json
+import logging
+import random
+import threading
+import time
+from typing import Dict, List, Optional
+
+from config.constants import (
+    NEWS_WATCHLIST_PATH, NEWS_CRAWL_INTERVAL, NEWS_CRAWL_JITTER, NEWS_CRAWL_COMPANY_DELAY
+)
+from utils.web_scraper import WebScraper
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def load_watchlist(path: str) -> List[Dict[str, str]]:
+    """Read a JSON list of {"company", "industry"} entries"""
+    with open(path, encoding='utf-8') as f:
+        entries = json.load(f)
+    watchlist = []
+    for entry in entries:
+        if not entry.get('company'):
+            logger.warning(f"Skipping watchlist entry without a company: {entry}")
+            continue
+        watchlist.append({'company': entry['company'], 'industry': entry.get('industry', '')})
+    return watchlist
+
+
+class WatchlistCrawler:
+    """Scheduler refreshing news for a fixed list of companies"""
+
+    def __init__(self, watchlist: List[Dict[str, str]], interval: float = NEWS_CRAWL_INTERVAL,
+                 jitter: float = NEWS_CRAWL_JITTER, company_delay: float = NEWS_CRAWL_COMPANY_DELAY,
+                 scraper: Optional[WebScraper] = None):
+        self.watchlist = watchlist
+        self.interval = interval
+        self.jitter = jitter
+        self.company_delay = company_delay
+
+        self.scraper = scraper or WebScraper()
+        # Always go to the network: the point is to refresh the index
+        self.scraper.index_freshness = 0
+
+        self.stop_event = threading.Event()
+        self.stats = {'crawls': 0, 'articles': 0, 'new_articles': 0, 'failed': 0}
+
+    def _jittered(self, seconds: float) -> float:
+        return seconds * random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def crawl(self, entry: Dict[str, str]) -> Dict:
+        """Refresh one company; returns per-crawl statistics"""
+        started = time.perf_counter()
+        started_at = time.time()
+        new_before = self.scraper.news_index.stats['new_articles']
+
+        results = self.scraper.search_all_sources(entry['company'], entry['industry'])
+
+        # Sources that fell back to mock articles leave no crawl watermark
+        crawled = [
+            source for source in results
+            if (self.scraper.news_index.last_crawled(entry['company'], entry['industry'], source) or 0) >= started_at
+        ]
+        stats = {
+            'company': entry['company'],
+            'sources_crawled': len(crawled),
+            'articles': sum(len(results[source]) for source in crawled),
+            'new_articles': self.scraper.news_index.stats['new_articles'] - new_before,
+            'elapsed_s': round(time.perf_counter() - started, 2)
+        }
+        self.stats['crawls'] += 1
+        self.stats['articles'] += stats['articles']
+        self.stats['new_articles'] += stats['new_articles']
+        logger.info(f"Crawled {entry['company']}: {stats['sources_crawled']}/{len(results)} sources, "
+                    f"{stats['new_articles']} new articles in {stats['elapsed_s']}s")
+        return stats
+
+    def _crawl_safely(self, entry: Dict[str, str]):
+        try:
+            self.crawl(entry)
+        except Exception as e:
+            self.stats['failed'] += 1
+            logger.warning(f"Crawl failed for {entry['company']}: {str(e)}")
+
+    def run_once(self):
+        """Crawl every watchlist company once, spaced by the company delay"""
+        for index, entry in enumerate(self.watchlist):
+            if index and self.stop_event.wait(self._jittered(self.company_delay)):
+                return
+            self._crawl_safely(entry)
+
+    def run_forever(self):
+        """Crawl each company every interval (with jitter) until stopped"""
+        now = time.monotonic()
+        # Stagger the first round so companies do not all fire together
+        next_run = {index: now + index * self._jittered(self.company_delay)
+                    for index in range(len(self.watchlist))}
+
+        while not self.stop_event.is_set() and next_run:
+            index = min(next_run, key=next_run.get)
+            if self.stop_event.wait(max(next_run[index] - time.monotonic(), 0)):
+                break
+            self._crawl_safely(self.watchlist[index])
+            # Keep at least the company delay before the next crawl starts
+            next_run[index] = time.monotonic() + self._jittered(self.interval)
+            floor = time.monotonic() + self.company_delay
+            for other in next_run:
+                next_run[other] = max(next_run[other], floor)
+
+        logger.info(f"Crawler stopped: {self.stats}")
+
+    def stop(self):
+        self.stop_event.set()
+
+
+def main(argv: Optional[List[str]] = None):
+    """Command-line entry point"""
+    parser = argparse.ArgumentParser(description="Refresh news for watchlist companies in the background")
+    parser.add_argument('--watchlist', default=NEWS_WATCHLIST_PATH,
+                        help=f"JSON watchlist file (default: {NEWS_WATCHLIST_PATH})")
+    parser.add_argument('--company', nargs=2, action='append', metavar=('NAME', 'INDUSTRY'),
+                        help="Crawl this company instead of the watchlist file (repeatable)")
+    parser.add_argument('--interval', type=float, default=NEWS_CRAWL_INTERVAL,
+                        help="Seconds between refreshes of the same company")
+    parser.add_argument('--company-delay', type=float, default=NEWS_CRAWL_COMPANY_DELAY,
+                        help="Minimum seconds between two company crawls")
+    parser.add_argument('--once', action='store_true', help="Crawl every company once and exit")
+    args = parser.parse_args(argv)
+
+    if args.company:
+        watchlist = [{'company': name, 'industry': industry} for name, industry in args.company]
+    else:
+        watchlist = load_watchlist(args.watchlist)
+
+    crawler = WatchlistCrawler(watchlist, interval=args.interval, company_delay=args.company_delay)
+    try:
+        if args.once:
+            crawler.run_once()
+        else:
+            crawler.run_forever()
+    except KeyboardInterrupt:
+        crawler.stop()
+    print(json.dumps(crawler.stats, indent=2))
+
+
+if __name__ == '__main__':
+    main()
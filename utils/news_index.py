@@ -0,0 +1,203 @@
+"""
+News Index - Persistent SQLite (FTS5) store of scraped articles
+Every successful scrape is written here, so market analyses can be served
+from disk by company/industry/date and only go to the network for sources
+not crawled recently. Safe to share between Streamlit and the crawler process.
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Dict, List, Optional
+
+from config.constants import NEWS_INDEX_PATH, MAX_ARTICLES_PER_SOURCE
+
+logger = logging.getLogger(__name__)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS articles (
+    id INTEGER PRIMARY KEY,
+    url TEXT NOT NULL UNIQUE,
+    source TEXT NOT NULL,
+    title TEXT NOT NULL,
+    summary TEXT,
+    date TEXT,
+    published TEXT NOT NULL,
+    fetched_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS articles_source_published ON articles (source, published);
+
+CREATE TABLE IF NOT EXISTS article_queries (
+    article_id INTEGER NOT NULL REFERENCES articles (id),
+    company TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    PRIMARY KEY (company, industry, article_id)
+);
+
+CREATE TABLE IF NOT EXISTS crawls (
+    company TEXT NOT NULL,
+    industry TEXT NOT NULL,
+    source TEXT NOT NULL,
+    crawled_at REAL NOT NULL,
+    PRIMARY KEY (company, industry, source)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS articles_fts USING fts5(
+    title, summary, content='articles', content_rowid='id'
+);
+CREATE TRIGGER IF NOT EXISTS articles_fts_insert AFTER INSERT ON articles BEGIN
+    INSERT INTO articles_fts (rowid, title, summary) VALUES (new.id, new.title, new.summary);
+END;
+"""
+
+
+def _key(value: str) -> str:
+    return ' '.join(value.lower().split())
+
+
+def _published(date: str) -> str:
+    """Sortable YYYY-MM-DD for an article's display date (today if unparseable)"""
+    for fmt in ('%B %d, %Y', '%Y-%m-%d'):
+        try:
+            return datetime.strptime(date, fmt).strftime('%Y-%m-%d')
+        except (TypeError, ValueError):
+            continue
+    return datetime.now().strftime('%Y-%m-%d')
+
+
+def _fts_phrase(text: str) -> str:
+    return '"' + text.replace('"', '""') + '"'
+
+
+class NewsIndex:
+    """Article store with full-text search and per-source crawl watermarks"""
+
+    def __init__(self, path: str = NEWS_INDEX_PATH):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        # One connection shared by the scraper loop and Streamlit threads
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, timeout=30, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock, self._conn:
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.executescript(SCHEMA)
+
+        self.stats = {'served': 0, 'crawled': 0, 'new_articles': 0}
+
+    # ===== WRITES =====
+
+    def add_articles(self, articles: List[Dict], company: str, industry: str) -> int:
+        """
+        Store scraped articles and link them to the query that found them
+
+        Returns:
+            Number of articles not seen before
+        """
+        now = time.time()
+        added = 0
+        with self._lock, self._conn:
+            for article in articles:
+                if not article.get('url') or not article.get('title'):
+                    continue
+                cursor = self._conn.execute(
+                    "INSERT OR IGNORE INTO articles (url, source, title, summary, date, published, fetched_at) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (article['url'], article.get('source', ''), article['title'], article.get('summary', ''),
+                     article.get('date', ''), _published(article.get('date', '')), now)
+                )
+                added += cursor.rowcount
+                self._conn.execute(
+                    "INSERT OR IGNORE INTO article_queries (article_id, company, industry) "
+                    "SELECT id, ?, ? FROM articles WHERE url = ?",
+                    (_key(company), _key(industry), article['url'])
+                )
+        self.stats['new_articles'] += added
+        return added
+
+    def mark_crawled(self, company: str, industry: str, source: str):
+        """Record a successful network crawl of one source for a query"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO crawls (company, industry, source, crawled_at) VALUES (?, ?, ?, ?)",
+                (_key(company), _key(industry), source, time.time())
+            )
+        self.stats['crawled'] += 1
+
+    # ===== READS =====
+
+    def last_crawled(self, company: str, industry: str, source: str) -> Optional[float]:
+        """Unix time of the last successful crawl, or None"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT crawled_at FROM crawls WHERE company = ? AND industry = ? AND source = ?",
+                (_key(company), _key(industry), source)
+            ).fetchone()
+        return row['crawled_at'] if row else None
+
+    def is_fresh(self, company: str, industry: str, source: str, max_age: float) -> bool:
+        """Whether a source was crawled for this query within max_age seconds"""
+        crawled_at = self.last_crawled(company, industry, source)
+        return crawled_at is not None and time.time() - crawled_at < max_age
+
+    def articles_for(self, company: str, industry: Optional[str] = None, source: Optional[str] = None,
+                     since: Optional[datetime] = None, limit: int = MAX_ARTICLES_PER_SOURCE) -> List[Dict]:
+        """
+        Stored articles about a company, newest first
+
+        Matches articles found by earlier searches for the company (and
+        industry, if given) plus any article mentioning it in the full-text index.
+        """
+        linked = "SELECT article_id FROM article_queries WHERE company = ?"
+        params: list = [_key(company)]
+        if industry:
+            linked += " AND industry = ?"
+            params.append(_key(industry))
+
+        sql = (f"SELECT source, title, date, url, summary FROM articles "
+               f"WHERE (id IN ({linked}) OR id IN (SELECT rowid FROM articles_fts WHERE articles_fts MATCH ?))")
+        params.append(_fts_phrase(company))
+        if source:
+            sql += " AND source = ?"
+            params.append(source)
+        if since:
+            sql += " AND published >= ?"
+            params.append(since.strftime('%Y-%m-%d'))
+        sql += " ORDER BY published DESC, id LIMIT ?"
+        params.append(limit)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row) for row in rows]
+
+    def search(self, text: str, limit: int = 50) -> List[Dict]:
+        """Free-text search over stored titles and summaries, best match first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT a.source, a.title, a.date, a.url, a.summary FROM articles_fts "
+                "JOIN articles a ON a.id = articles_fts.rowid "
+                "WHERE articles_fts MATCH ? ORDER BY rank LIMIT ?",
+                (_fts_phrase(text), limit)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+_shared_index: Optional[NewsIndex] = None
+_shared_lock = threading.Lock()
+
+
+def get_news_index() -> NewsIndex:
+    """Process-wide news index"""
+    global _shared_index
+    with _shared_lock:
+        if _shared_index is None:
+            _shared_index = NewsIndex()
+        return _shared_index
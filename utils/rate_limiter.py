@@ -0,0 +1,177 @@
+"""
+Rate Limiter - Per-domain token buckets and circuit breakers
+Shared by every scraper and Streamlit session in the process, so we stay
+polite to throttling outlets and skip failing ones instantly during a
+cool-down window instead of waiting out their timeout on every search
+"""
+import threading
+import time
+from typing import Dict, Optional
+
+from config.constants import (
+    RATE_LIMIT_PER_SECOND, RATE_LIMIT_BURST, RATE_LIMIT_MAX_WAIT,
+    CIRCUIT_FAILURE_THRESHOLD, CIRCUIT_COOLDOWN, DOMAIN_RATE_LIMITS
+)
+
+
+class SourceUnavailableError(Exception):
+    """Request refused locally without touching the network"""
+
+
+class CircuitOpenError(SourceUnavailableError):
+    """The domain's circuit breaker is open"""
+
+
+class RateLimitedError(SourceUnavailableError):
+    """The domain's token bucket would make us wait too long"""
+
+
+class TokenBucket:
+    """Thread-safe token bucket; callers sleep for the returned reservation"""
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, max_wait: Optional[float] = None) -> float:
+        """
+        Take one token, possibly from the future
+
+        Returns:
+            Seconds to wait before sending
+
+        Raises:
+            RateLimitedError: If the wait would exceed max_wait (no token is taken)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+            wait = max(0.0, (1 - self.tokens) / self.rate)
+            if max_wait is not None and wait > max_wait:
+                raise RateLimitedError(f"Rate limit wait {wait:.1f}s exceeds {max_wait:.1f}s")
+
+            self.tokens -= 1
+            return wait
+
+    def penalize(self, seconds: float):
+        """Drain the bucket, e.g. after a 429 with Retry-After"""
+        with self._lock:
+            self.tokens = min(self.tokens, -seconds * self.rate)
+            self.updated = time.monotonic()
+
+
+class CircuitBreaker:
+    """Closed -> open after repeated failures -> half-open probe after cool-down"""
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(self, failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+                 cooldown: float = CIRCUIT_COOLDOWN):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = self.CLOSED
+        self.failures = 0
+        self.opened_at = 0.0
+        self._probe_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self) -> bool:
+        """Whether a request may be sent now"""
+        with self._lock:
+            if self.state == self.CLOSED:
+                return True
+            if self.state == self.OPEN and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self.state == self.HALF_OPEN and not self._probe_in_flight:
+                self._probe_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = self.CLOSED
+            self.failures = 0
+            self._probe_in_flight = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            if self.state == self.HALF_OPEN or self.failures >= self.failure_threshold:
+                self.state = self.OPEN
+                self.opened_at = time.monotonic()
+            self._probe_in_flight = False
+
+    def release_probe(self):
+        """Give back a half-open probe slot that will not be used"""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def retry_in(self) -> float:
+        """Seconds left in the cool-down window"""
+        if self.state != self.OPEN:
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class DomainGuard:
+    """Token bucket plus circuit breaker for one domain"""
+
+    def __init__(self, domain: str):
+        limits = DOMAIN_RATE_LIMITS.get(domain, {})
+        self.domain = domain
+        self.bucket = TokenBucket(limits.get('rate', RATE_LIMIT_PER_SECOND),
+                                  limits.get('burst', RATE_LIMIT_BURST))
+        self.breaker = CircuitBreaker()
+        self.max_wait = limits.get('max_wait', RATE_LIMIT_MAX_WAIT)
+
+    def acquire(self) -> float:
+        """
+        Admit a request
+
+        Returns:
+            Seconds to wait before sending
+
+        Raises:
+            SourceUnavailableError: If the circuit is open or the wait is too long
+        """
+        if not self.breaker.allow():
+            raise CircuitOpenError(f"{self.domain} circuit open, retry in {self.breaker.retry_in():.0f}s")
+        try:
+            return self.bucket.reserve(self.max_wait)
+        except RateLimitedError:
+            self.breaker.release_probe()
+            raise
+
+    def status(self) -> Dict:
+        return {
+            'state': self.breaker.state,
+            'failures': self.breaker.failures,
+            'retry_in_s': round(self.breaker.retry_in(), 1),
+            'tokens': round(self.bucket.tokens, 2)
+        }
+
+
+_guards: Dict[str, DomainGuard] = {}
+_guards_lock = threading.Lock()
+
+
+def get_domain_guard(domain: str) -> DomainGuard:
+    """Process-wide guard for a domain"""
+    with _guards_lock:
+        if domain not in _guards:
+            _guards[domain] = DomainGuard(domain)
+        return _guards[domain]
+
+
+def domain_status() -> Dict[str, Dict]:
+    """Limiter and breaker state of every domain contacted so far"""
+    with _guards_lock:
+        return {domain: guard.status() for domain, guard in _guards.items()}
@@ -6,6 +6,8 @@ from io import BytesIO
 from datetime import datetime
 import os
 
+from utils.near_duplicates import deduplicate_articles
+
 try:
     from docx import Document
     from docx.shared import Inches, Pt, RGBColor
@@ -115,10 +117,15 @@ class TemplateGenerator:
         return report
     
     def _format_news_data(self, web_data: dict) -> str:
-        """EXISTING - Unchanged"""
+        """Format news results, listing syndicated stories once"""
         if not web_data:
             return "No news data available"
         
+        web_data = deduplicate_articles({
+            source: articles for source, articles in web_data.items()
+            if articles and isinstance(articles, list)
+        })
+        
         news_section = "**Sources:** 8 major outlets\n\n"
         source_count = 0
         article_count = 0
@@ -1,11 +1,30 @@
 """
 Web Scraper - Searches news sources for market intelligence
 FULLY INTEGRATED with template generation
+All sources are queried concurrently (asyncio + httpx), each under its own timeout,
+over the shared pooled keep-alive HTTPClient; pages are parsed by ArticleParser.
+Per-domain rate limits and circuit breakers skip failing outlets instantly.
+Responses go through an on-disk HTTP cache revalidated with conditional GETs;
+an optional search deadline returns partial results while late sources keep filling it.
+Syndicated stories are collapsed across outlets before summarising.
+Scraped articles persist in the NewsIndex, which is queried before the network.
+Index and HTTP cache I/O run in worker threads so a busy SQLite writer or slow
+disk never stalls the shared event loop.
 """
-import requests
-from typing import List, Dict
+import asyncio
+import queue
+import time
+from typing import AsyncIterator, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import quote
 import logging
 from datetime import datetime
+from config.constants import HTTP_CACHE_FRESHNESS, NEWS_INDEX_FRESHNESS
+from utils.http_cache import HTTPCache
+from utils.http_client import HTTPClient, get_http_client
+from utils.article_parser import get_article_parser
+from utils.near_duplicates import deduplicate_articles
+from utils.news_index import NewsIndex, get_news_index
+from utils.rate_limiter import SourceUnavailableError
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -28,58 +47,186 @@ class WebScraper:
         'Yahoo Finance': 'https://finance.yahoo.com/search?q='
     }
     
-    def __init__(self):
+    def __init__(self, http_cache: Optional[HTTPCache] = None, news_index: Optional[NewsIndex] = None):
         self.user_agent = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         self.timeout = 10
+        self.source_timeouts = {}  # Per-source overrides of self.timeout (seconds)
+        self.cache_freshness = HTTP_CACHE_FRESHNESS
+        self.source_freshness = {}  # Per-source overrides of self.cache_freshness (seconds)
+        self.http_cache = http_cache or HTTPCache()
+        self.http_client = get_http_client()
+        self.article_parser = get_article_parser()
+        self.news_index = news_index or get_news_index()  # Shared process-wide unless one is passed in
+        self.index_freshness = NEWS_INDEX_FRESHNESS
         self.search_results = []
+        self.missing_sources = []  # Sources that missed the last search's deadline
     
-    def search_all_sources(self, company: str, industry: str) -> Dict[str, List[Dict]]:
+    def search_all_sources(self, company: str, industry: str,
+                           deadline: Optional[float] = None) -> Dict[str, List[Dict]]:
         """
-        Search all major news sources for articles
+        Search all major news sources for articles (concurrently)
         
         Args:
             company: Company name
             industry: Industry sector
+            deadline: Total seconds to wait; None waits for every source
         
         Returns:
-            Dictionary with source names and articles found
+            Dictionary with source names and articles found. Sources that missed
+            the deadline map to an empty list and are listed in self.missing_sources.
         """
-        all_results = {}
+        all_results = dict(self.iter_search_results(company, industry, deadline))
+        return {source: all_results.get(source, []) for source in self.NEWS_SOURCES}
+    
+    def iter_search_results(self, company: str, industry: str,
+                            deadline: Optional[float] = None) -> Iterator[Tuple[str, List[Dict]]]:
+        """
+        Query all sources concurrently and yield (source, articles) as each completes
         
-        for source_name, base_url in self.NEWS_SOURCES.items():
-            query = f"{company} {industry} market analysis"
-            search_url = base_url + query
-            
+        Lets the UI render sources as they arrive instead of waiting for the slowest.
+        The search runs on the shared HTTP client loop so pooled connections are reused.
+        When the deadline passes iteration stops, but the outstanding requests keep
+        running in the background and fill the HTTP cache for the next search.
+        """
+        arrivals = queue.Queue()
+        
+        async def produce():
             try:
-                logger.info(f"Searching {source_name}...")
-                articles = self._scrape_source(source_name, search_url, company, industry)
-                all_results[source_name] = articles if articles else self._generate_mock_articles(source_name, company, industry)
-            except Exception as e:
-                logger.warning(f"Error scraping {source_name}: {str(e)}")
-                all_results[source_name] = self._generate_mock_articles(source_name, company, industry)
+                async for item in self._search_sources(company, industry):
+                    arrivals.put(item)
+            finally:
+                arrivals.put(None)
+        
+        future = self.http_client.submit(produce())
+        collected = {}
+        expires_at = time.monotonic() + deadline if deadline is not None else None
         
-        self.search_results = all_results
-        return all_results
+        try:
+            while True:
+                remaining = None if expires_at is None else max(expires_at - time.monotonic(), 0)
+                try:
+                    item = arrivals.get(timeout=remaining)
+                except queue.Empty:
+                    logger.info(f"Search deadline of {deadline}s reached; "
+                                f"{len(self.NEWS_SOURCES) - len(collected)} sources still loading in background")
+                    break
+                if item is None:
+                    future.result()
+                    break
+                source_name, articles = item
+                collected[source_name] = articles
+                yield source_name, articles
+        finally:
+            # The search is not cancelled: late sources still land in the HTTP cache
+            self.missing_sources = [source for source in self.NEWS_SOURCES if source not in collected]
+            self.search_results = {source: collected[source] for source in self.NEWS_SOURCES if source in collected}
+    
+    async def _search_sources(self, company: str, industry: str) -> AsyncIterator[Tuple[str, List[Dict]]]:
+        """Fan out one request per source and yield results in completion order"""
+        query = quote(f"{company} {industry} market analysis")
+        
+        tasks = [
+            asyncio.ensure_future(self._search_source(self.http_client, source_name, base_url + query, company, industry))
+            for source_name, base_url in self.NEWS_SOURCES.items()
+        ]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    async def _search_source(self, client: HTTPClient, source_name: str, search_url: str,
+                             company: str, industry: str) -> Tuple[str, List[Dict]]:
+        """Search one source under its own timeout, falling back to mock articles"""
+        # Recently crawled for this company: serve from the index, skip the network
+        articles = await asyncio.to_thread(self._indexed_articles, company, industry, source_name)
+        if articles:
+            return source_name, articles
+        
+        timeout = self.source_timeouts.get(source_name, self.timeout)
+        try:
+            logger.info(f"Searching {source_name}...")
+            articles = await asyncio.wait_for(
+                self._scrape_source(client, source_name, search_url, company, industry), timeout
+            )
+            return source_name, articles if articles else self._generate_mock_articles(source_name, company, industry)
+        except Exception as e:
+            logger.warning(f"Error scraping {source_name}: {str(e) or type(e).__name__}")
+            return source_name, self._generate_mock_articles(source_name, company, industry)
     
-    def _scrape_source(self, source: str, url: str, company: str, industry: str) -> List[Dict]:
+    async def _scrape_source(self, client: HTTPClient, source: str, url: str,
+                             company: str, industry: str) -> List[Dict]:
         """
         Attempt to scrape articles from source (with fallback to mock)
         """
         try:
-            headers = {'User-Agent': self.user_agent}
-            response = requests.get(url, headers=headers, timeout=self.timeout)
+            body = await self._fetch(client, source, url)
             
-            if response.status_code == 200:
-                # Real article would be extracted here with BeautifulSoup
-                # For now, return mock that simulates successful scraping
-                return self._generate_mock_articles(source, company, industry, real=True)
+            if body is not None:
+                # Parsed on the worker pool; an empty result falls back to mock articles
+                articles = await self.article_parser.parse_async(source, body, url)
+                if articles:
+                    return await asyncio.to_thread(self._index_articles, articles, company, industry, source)
+                return articles
             else:
                 return self._generate_mock_articles(source, company, industry)
         
         except Exception as e:
-            logger.warning(f"Scraping failed for {source}, using mock data: {str(e)}")
+            logger.warning(f"Scraping failed for {source}, using mock data: {str(e) or type(e).__name__}")
             return self._generate_mock_articles(source, company, industry)
     
+    def _indexed_articles(self, company: str, industry: str, source: str) -> List[Dict]:
+        """Articles from the index if the source was crawled recently (blocking)"""
+        if not self.news_index.is_fresh(company, industry, source, self.index_freshness):
+            return []
+        articles = self.news_index.articles_for(company, industry, source=source)
+        if articles:
+            self.news_index.stats['served'] += 1
+        return articles
+    
+    def _index_articles(self, articles: List[Dict], company: str, industry: str, source: str) -> List[Dict]:
+        """Store freshly parsed articles and return the source's indexed set (blocking)"""
+        added = self.news_index.add_articles(articles, company, industry)
+        self.news_index.mark_crawled(company, industry, source)
+        logger.info(f"{source}: {added} new articles since last crawl")
+        return self.news_index.articles_for(company, industry, source=source) or articles
+    
+    async def _fetch(self, client: HTTPClient, source: str, url: str) -> Optional[str]:
+        """
+        GET a page through the HTTP cache
+        
+        Fresh entries are served from disk; stale ones are revalidated with a
+        conditional GET. Returns the body, or None for a non-200 response.
+        """
+        entry = await asyncio.to_thread(self.http_cache.get, url)
+        if entry and self.http_cache.is_fresh(entry, self.source_freshness.get(source, self.cache_freshness)):
+            self.http_cache.stats['hits'] += 1
+            return entry['body']
+        
+        timeout = self.source_timeouts.get(source, self.timeout)
+        headers = {'User-Agent': self.user_agent, **self.http_cache.conditional_headers(entry)}
+        try:
+            response = await client.aget(url, headers=headers, timeout=timeout)
+        except SourceUnavailableError as e:
+            # Circuit open or throttled: skip instantly, serving a stale copy if we have one
+            logger.info(f"Skipping {source}: {str(e)}")
+            if entry:
+                self.http_cache.stats['hits'] += 1
+                return entry['body']
+            raise
+        
+        if response.status_code == 304 and entry:
+            self.http_cache.stats['revalidated'] += 1
+            return (await asyncio.to_thread(self.http_cache.refresh, entry, response.headers))['body']
+        
+        self.http_cache.stats['misses'] += 1
+        if response.status_code == 200:
+            entry = await asyncio.to_thread(self.http_cache.store, url, response.status_code,
+                                            response.text, response.headers)
+            return entry['body']
+        return None
+    
     def _generate_mock_articles(self, source: str, company: str, industry: str, real: bool = False) -> List[Dict]:
         """Generate realistic mock articles based on source and topic"""
         
@@ -234,23 +381,30 @@ class WebScraper:
     def compile_news_summary(self) -> str:
         """
         Compile comprehensive news summary for inclusion in report
+        Stories syndicated across outlets are listed once
         """
         if not self.search_results:
             return "No news data available"
         
+        results = deduplicate_articles(self.search_results)
+        found = sum(len(articles) for articles in self.search_results.values())
+        unique = sum(len(articles) for articles in results.values())
+        
         summary = "## News Intelligence Summary\n\n"
         summary += f"**Report Generated:** {datetime.now().strftime('%B %d, %Y')}\n\n"
         summary += f"**Total Sources Analyzed:** {len(self.search_results)} major news outlets\n"
-        summary += f"**Total Articles Found:** {sum(len(articles) for articles in self.search_results.values())}\n\n"
+        summary += f"**Total Articles Found:** {unique} unique ({found - unique} syndicated duplicates removed)\n\n"
         
         summary += "### Key Headlines by Source:\n\n"
         
-        for source, articles in self.search_results.items():
+        for source, articles in results.items():
             if articles:
                 summary += f"**{source}** ({len(articles)} articles)\n"
                 for article in articles[:2]:  # Top 2 per source
                     summary += f"- {article.get('title', 'Unknown')}\n"
                     summary += f"  - {article.get('summary', 'N/A')}\n"
+                    if article.get('also_in'):
+                        summary += f"  - Also reported by: {', '.join(article['also_in'])}\n"
                 summary += "\n"
         
         return summary